@@ -1,4 +1,5 @@
 from flask import Flask
+from .commands import check_progress_command, recompute_progress_command, resume_worker_command
 from .config import Config
 from .extensions import cors, db, jwt, migrate
 from .routes.auth import bp as auth_bp
@@ -6,7 +7,9 @@ from .routes.user import bp as user_bp
 from .routes.dashboard import bp as dashboard_bp
 from .routes.skills import bp as skills_bp
 from .routes.projects import bp as projects_bp
-from .routes.resume import bp as resume_bp
+from .routes.resume import bp as resume_bp, start_resume_job_workers
+from .services.judge0 import warm_language_catalog
+from .services.submit_jobs import SubmitJobSweeper
 
 
 def create_app():
@@ -34,6 +37,20 @@ def create_app():
   app.register_blueprint(projects_bp)
   app.register_blueprint(resume_bp)
 
+  app.cli.add_command(recompute_progress_command)
+  app.cli.add_command(check_progress_command)
+  app.cli.add_command(resume_worker_command)
+
+  if app.config.get("JUDGE0_WARM_LANGUAGES"):
+    warm_language_catalog()
+
+  if app.config.get("BACKGROUND_JOBS_ENABLED"):
+    sweeper = SubmitJobSweeper(app)
+    sweeper.start()
+    app.extensions["submit_job_sweeper"] = sweeper
+    if app.config.get("RESUME_SCORER_ENABLED"):
+      start_resume_job_workers(app)
+
   @app.get("/")
   def health():
     return {"status": "ok"}
@@ -0,0 +1,63 @@
+import time
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from .services.progression import bulk_recompute_user_progress, check_progress_consistency
+from .services.resume_jobs import RESUME_JOB_POLL_SECONDS, RESUME_JOB_WORKERS, ResumeJobWorkerPool
+
+
+@click.command("recompute-progress")
+@click.option("--chunk-size", default=1000, show_default=True, help="Users loaded and written per batch.")
+@with_appcontext
+def recompute_progress_command(chunk_size: int):
+  """Recompute readiness scores for every user, e.g. after a catalog migration."""
+  started = time.perf_counter()
+  stats = bulk_recompute_user_progress(
+    chunk_size=chunk_size,
+    on_chunk=lambda processed: click.echo(f"processed {processed} users"),
+  )
+  elapsed = time.perf_counter() - started
+  click.echo(
+    f"Recomputed {stats['users']} users in {stats['chunks']} chunks "
+    f"({stats['updated']} updated, {stats['created']} created) in {elapsed:.1f}s"
+  )
+
+
+@click.command("check-progress")
+@click.option("--limit", type=int, default=None, help="Only check the first N users.")
+@click.option("--repair", is_flag=True, help="Rewrite stored progress for users that drifted.")
+@with_appcontext
+def check_progress_command(limit: int | None, repair: bool):
+  """Compare stored (incrementally maintained) progress against a full recompute."""
+  result = check_progress_consistency(limit=limit, repair=repair)
+  click.echo(f"Checked {result['checked']} users, {len(result['drifted'])} drifted")
+  for user_id in result["drifted"]:
+    click.echo(f"  user {user_id}")
+
+
+@click.command("resume-worker")
+@click.option("--workers", type=int, default=RESUME_JOB_WORKERS, show_default=True, help="Worker threads.")
+@with_appcontext
+def resume_worker_command(workers: int):
+  """Drain queued resume scoring jobs in a dedicated process until interrupted."""
+  from .routes.resume import run_resume_job
+
+  # The app factory may have started in-process workers already; this command's pool replaces them.
+  in_app_pool = current_app.extensions.pop("resume_job_pool", None)
+  if in_app_pool is not None:
+    in_app_pool.stop()
+  pool = ResumeJobWorkerPool(
+    current_app._get_current_object(),
+    run_resume_job,
+    workers=workers,
+    poll_seconds=RESUME_JOB_POLL_SECONDS,
+  )
+  pool.start()
+  click.echo(f"Resume worker started with {workers} threads")
+  try:
+    while True:
+      time.sleep(3600)
+  except KeyboardInterrupt:
+    pool.stop(timeout=30)
@@ -33,3 +33,10 @@ class Config:
   JWT_SECRET_KEY = _require_env("JWT_SECRET_KEY")
   SUPERUSER_EMAILS = os.getenv("SUPERUSER_EMAILS", "")
   RESUME_SCORER_ENABLED = _env_bool("RESUME_SCORER_ENABLED", default=False)
+  JUDGE0_WARM_LANGUAGES = _env_bool("JUDGE0_WARM_LANGUAGES", default=True)
+  # Background threads started with every app: the submit job sweeper and, when resume scoring is
+  # enabled, RESUME_JOB_WORKERS resume scoring workers (0 leaves those to `flask resume-worker`).
+  BACKGROUND_JOBS_ENABLED = _env_bool("BACKGROUND_JOBS_ENABLED", default=True)
+  # Werkzeug stops reading request bodies past this size, chunked ones included: the 5MB resume
+  # upload limit plus room for multipart boundaries and form fields.
+  MAX_CONTENT_LENGTH = int(os.getenv("MAX_CONTENT_LENGTH") or 5 * 1024 * 1024 + 64 * 1024)
@@ -49,11 +49,31 @@ class UserProgress(db.Model):
   category_resume = db.Column(db.Integer, default=0)
   coding_override_score = db.Column(db.Integer, nullable=True)
   coding_override_source = db.Column(db.String(100), nullable=True)
+  # Set when scoring inputs change; dashboard reads only write the row back while this is set.
+  needs_recompute = db.Column(db.Boolean, nullable=False, default=True, server_default=db.text("true"))
   updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
   user = db.relationship("User", backref=db.backref("progress", uselist=False))
 
 
+class UserModuleProgress(db.Model):
+  __tablename__ = "user_module_progress"
+
+  id = db.Column(db.Integer, primary_key=True)
+  user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+  module_id = db.Column(db.Integer, db.ForeignKey("modules.id"), nullable=False)
+  score = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+  completed_weight = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+  # Version of the module's active task weights the row was scored against; a mismatch forces a recompute.
+  catalog_version = db.Column(db.String(16), nullable=True)
+  updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+  __table_args__ = (
+    db.UniqueConstraint("user_id", "module_id", name="uq_user_module_progress"),
+    db.Index("ix_user_module_progress_module_score", "module_id", "score"),
+  )
+
+
 class Module(db.Model):
   __tablename__ = "modules"
 
@@ -88,6 +108,10 @@ class Task(db.Model):
 
   module = db.relationship("Module", backref=db.backref("tasks", lazy=True))
 
+  __table_args__ = (
+    db.Index("ix_tasks_module_challenge_active", "module_id", "challenge_id", "is_active"),
+  )
+
 
 class UserTaskCompletion(db.Model):
   __tablename__ = "user_task_completions"
@@ -119,6 +143,13 @@ class ProjectSubmission(db.Model):
 
   user = db.relationship("User", backref=db.backref("project_submissions", lazy=True))
 
+  __table_args__ = (
+    db.Index("ix_project_submissions_user_status", "user_id", "status"),
+    db.Index("ix_project_submissions_user_created", user_id, created_at.desc(), id.desc()),
+    db.Index("ix_project_submissions_created", created_at.desc(), id.desc()),
+    db.Index("ix_project_submissions_status_created", status, created_at.desc(), id.desc()),
+  )
+
 
 class ResumeSubmission(db.Model):
   __tablename__ = "resume_submissions"
@@ -142,11 +173,26 @@ class ResumeSubmission(db.Model):
   improvements_json = db.Column(db.Text, nullable=True)
   error_code = db.Column(db.String(64), nullable=True)
   error_message = db.Column(db.String(500), nullable=True)
+  rubric_scores_json = db.Column(db.Text, nullable=True)
+  # SHA-256 of the uploaded PDF; a user's identical uploads reuse their earlier score for the same provider/model/prompt.
+  content_sha256 = db.Column(db.String(64), nullable=True)
+  reused_from_submission_id = db.Column(db.Integer, db.ForeignKey("resume_submissions.id"), nullable=True)
+  # Queued jobs keep the upload here until a worker finishes with it.
+  pdf_bytes = db.deferred(db.Column(db.LargeBinary, nullable=True))
+  claimed_at = db.Column(db.DateTime, nullable=True)
+  attempts = db.Column(db.Integer, nullable=False, default=0, server_default="0")
   created_at = db.Column(db.DateTime, default=datetime.utcnow)
   updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
   user = db.relationship("User", backref=db.backref("resume_submissions", lazy=True))
 
+  __table_args__ = (
+    db.Index("ix_resume_submissions_user_status_score", "user_id", "status", "overall_score"),
+    db.Index("ix_resume_submissions_user_created", user_id, created_at.desc(), id.desc()),
+    db.Index("ix_resume_submissions_status_id", "status", "id"),
+    db.Index("ix_resume_submissions_content_lookup", "content_sha256", "provider", "model", "prompt_version"),
+  )
+
   @property
   def strengths(self) -> list[str]:
     if not self.strengths_json:
@@ -170,3 +216,65 @@ class ResumeSubmission(db.Model):
     if not isinstance(parsed, list):
       return []
     return [str(item) for item in parsed if isinstance(item, str)]
+
+  @property
+  def rubric_scores(self) -> dict[str, int] | None:
+    if not self.rubric_scores_json:
+      return None
+    try:
+      parsed = json.loads(self.rubric_scores_json)
+    except Exception:
+      return None
+    if not isinstance(parsed, dict):
+      return None
+    return {str(key): int(value) for key, value in parsed.items() if isinstance(value, int)}
+
+
+class ChallengeSubmissionJob(db.Model):
+  __tablename__ = "challenge_submission_jobs"
+
+  id = db.Column(db.String(32), primary_key=True)
+  user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+  challenge_id = db.Column(db.String(64), nullable=False)
+  language_id = db.Column(db.Integer, nullable=False)
+  status = db.Column(db.String(32), nullable=False, default="queued", server_default="queued")
+  total_cases = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+  case_results_json = db.Column(db.Text, nullable=True)
+  result_json = db.Column(db.Text, nullable=True)
+  error_code = db.Column(db.String(64), nullable=True)
+  error_message = db.Column(db.String(500), nullable=True)
+  # Set when a worker starts the job.
+  claimed_at = db.Column(db.DateTime, nullable=True)
+  # Refreshed by the process holding the job while it is queued or running; see services.submit_jobs.
+  heartbeat_at = db.Column(db.DateTime, nullable=True)
+  created_at = db.Column(db.DateTime, default=datetime.utcnow)
+  updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+  __table_args__ = (
+    db.Index("ix_challenge_submission_jobs_user_created", "user_id", "created_at"),
+    db.Index("ix_challenge_submission_jobs_status_heartbeat", "status", "heartbeat_at"),
+  )
+
+  user = db.relationship("User", backref=db.backref("challenge_submission_jobs", lazy=True))
+
+  @property
+  def case_results(self) -> list[dict]:
+    if not self.case_results_json:
+      return []
+    try:
+      parsed = json.loads(self.case_results_json)
+    except Exception:
+      return []
+    if not isinstance(parsed, list):
+      return []
+    return [item for item in parsed if isinstance(item, dict)]
+
+  @property
+  def result(self) -> dict | None:
+    if not self.result_json:
+      return None
+    try:
+      parsed = json.loads(self.result_json)
+    except Exception:
+      return None
+    return parsed if isinstance(parsed, dict) else None
@@ -0,0 +1,70 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Iterable
+
+from .extensions import db
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(created_at: datetime | None, row_id: int) -> str:
+  raw = json.dumps([created_at.isoformat() if created_at else None, row_id], separators=(",", ":"))
+  return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(value: str) -> tuple[datetime, int]:
+  try:
+    padded = value + "=" * (-len(value) % 4)
+    created_at_raw, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    return datetime.fromisoformat(created_at_raw), int(row_id)
+  except (ValueError, TypeError, UnicodeError):
+    raise ValueError("Invalid cursor") from None
+
+
+def parse_page_size(value: str | None) -> int:
+  # Listings are always paged; clients that need every row follow next_cursor.
+  if value is None or value == "":
+    return DEFAULT_PAGE_SIZE
+  try:
+    size = int(value)
+  except ValueError:
+    raise ValueError("limit must be an integer") from None
+  if size < 1:
+    raise ValueError("limit must be positive")
+  return min(size, MAX_PAGE_SIZE)
+
+
+def parse_fields(value: str | None, allowed: Iterable[str]) -> set[str] | None:
+  if value is None or not value.strip():
+    return None
+  fields = {field.strip() for field in value.split(",") if field.strip()}
+  unknown = fields - set(allowed)
+  if unknown:
+    raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+  return fields
+
+
+def project_fields(payload: dict[str, Any], fields: set[str] | None) -> dict[str, Any]:
+  if fields is None:
+    return payload
+  return {key: value for key, value in payload.items() if key in fields}
+
+
+def keyset_page(query, model, *, cursor: str | None, limit: int) -> tuple[list[Any], str | None]:
+  """Newest-first page ordered by (created_at, id); the cursor points at the last row returned."""
+  if cursor:
+    created_at, row_id = decode_cursor(cursor)
+    query = query.filter(
+      db.or_(
+        model.created_at < created_at,
+        db.and_(model.created_at == created_at, model.id < row_id),
+      )
+    )
+  query = query.order_by(model.created_at.desc(), model.id.desc())
+  rows = query.limit(limit + 1).all()
+  if len(rows) <= limit:
+    return rows, None
+  rows = rows[:limit]
+  return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
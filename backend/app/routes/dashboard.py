@@ -1,11 +1,13 @@
 from datetime import date
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from ..models import Task, User
+from ..models import User
 from ..utils import days_until
 from ..services.progression import (
+  get_catalog,
   get_tasks_for_user_module,
-  recompute_and_persist_user_progress,
+  get_user_progress_summary,
+  get_users_below_threshold,
   set_task_completion_internal,
 )
 from ..services.recruiting import build_recruiting_view
@@ -20,7 +22,7 @@ def summary():
 
   today = date.today()
 
-  computed = recompute_and_persist_user_progress(user.id, commit=True)
+  computed = get_user_progress_summary(user.id)
   recruiting = build_recruiting_view(
     today=today,
     readiness_score=computed["progress"],
@@ -77,8 +79,7 @@ def update_task_completion(task_id: int):
   if not isinstance(completed, bool):
     return jsonify({"error": "completed must be a boolean"}), 400
 
-  task = Task.query.filter_by(id=task_id, is_active=True).first()
-  if task is None:
+  if task_id not in get_catalog().tasks_by_id:
     return jsonify({"error": "Task not found"}), 404
 
   computed = set_task_completion_internal(user_id, task_id, completed)
@@ -89,3 +90,25 @@ def update_task_completion(task_id: int):
       "module_progress": computed["module_progress"],
     }
   )
+
+
+@bp.get("/admin/stuck-users")
+@jwt_required()
+def stuck_users():
+  user = User.query.get_or_404(int(get_jwt_identity()))
+  if not user.is_superuser:
+    return jsonify({"error": "Superuser access required."}), 403
+
+  module_key = (request.args.get("module_key") or "").strip()
+  if not module_key:
+    return jsonify({"error": "module_key is required"}), 400
+  try:
+    threshold = int(request.args["threshold"]) if "threshold" in request.args else None
+    limit = max(1, min(500, int(request.args.get("limit", 100))))
+  except ValueError:
+    return jsonify({"error": "threshold and limit must be integers"}), 400
+
+  payload = get_users_below_threshold(module_key, threshold=threshold, limit=limit)
+  if payload is None:
+    return jsonify({"error": "Module not found"}), 404
+  return jsonify(payload)
@@ -4,16 +4,19 @@ from urllib.parse import urlparse
 
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import defer, joinedload
 
 from ..extensions import db
 from ..models import ProjectSubmission, User
+from ..pagination import keyset_page, parse_fields, parse_page_size, project_fields
 from ..services.progression import sync_projects_submission_progress
 
 bp = Blueprint("projects", __name__, url_prefix="/projects")
 
 _ALLOWED_GITHUB_HOSTS = {"github.com", "www.github.com"}
 _REVIEW_DECISIONS = {"pass", "fail"}
+_SUBMISSION_STATUSES = {"pending", *_REVIEW_DECISIONS}
+_SUBMISSION_FIELDS = ("id", "user_id", "repo_url", "deployed_url", "status", "review_notes", "created_at", "updated_at")
 
 
 def _normalize_optional_url(value: object) -> str | None:
@@ -79,14 +82,20 @@ def _current_user() -> User:
   return User.query.get_or_404(user_id)
 
 
-def _serialize_submission(submission: ProjectSubmission, *, include_user: bool = False) -> dict[str, object]:
+def _serialize_submission(
+  submission: ProjectSubmission,
+  *,
+  include_user: bool = False,
+  fields: set[str] | None = None,
+) -> dict[str, object]:
   payload: dict[str, object] = {
     "id": submission.id,
     "user_id": submission.user_id,
     "repo_url": submission.repo_url,
     "deployed_url": submission.deployed_url,
     "status": submission.status,
-    "review_notes": submission.review_notes,
+    # Deferred by projected listings; only touch it when requested to avoid per-row loads.
+    "review_notes": submission.review_notes if fields is None or "review_notes" in fields else None,
     "created_at": submission.created_at.isoformat() if submission.created_at else None,
     "updated_at": submission.updated_at.isoformat() if submission.updated_at else None,
   }
@@ -99,17 +108,56 @@ def _serialize_submission(submission: ProjectSubmission, *, include_user: bool =
   return payload
 
 
+def _listing_query(fields: set[str] | None):
+  query = ProjectSubmission.query
+  if fields is not None and "review_notes" not in fields:
+    query = query.options(defer(ProjectSubmission.review_notes))
+  return query
+
+
+def _status_counts(query) -> dict[str, int]:
+  counts = {status: 0 for status in sorted(_SUBMISSION_STATUSES)}
+  rows = query.with_entities(ProjectSubmission.status, db.func.count(ProjectSubmission.id)).group_by(ProjectSubmission.status)
+  for status, count in rows:
+    if status in counts:
+      counts[status] = count
+  return counts
+
+
 @bp.get("/submissions")
 @jwt_required()
 def list_submissions():
   user = _current_user()
-  submissions = (
-    ProjectSubmission.query
-    .filter_by(user_id=user.id)
-    .order_by(ProjectSubmission.created_at.desc(), ProjectSubmission.id.desc())
-    .all()
+  try:
+    limit = parse_page_size(request.args.get("limit"))
+    fields = parse_fields(request.args.get("fields"), _SUBMISSION_FIELDS)
+    submissions, next_cursor = keyset_page(
+      _listing_query(fields).filter_by(user_id=user.id),
+      ProjectSubmission,
+      cursor=request.args.get("cursor"),
+      limit=limit,
+    )
+  except ValueError as err:
+    return jsonify({"error": str(err)}), 400
+  return jsonify(
+    {
+      "submissions": [project_fields(_serialize_submission(item, fields=fields), fields) for item in submissions],
+      "next_cursor": next_cursor,
+    }
   )
-  return jsonify({"submissions": [_serialize_submission(item) for item in submissions]})
+
+
+@bp.get("/submissions/summary")
+@jwt_required()
+def submissions_summary():
+  user = _current_user()
+  query = ProjectSubmission.query.filter_by(user_id=user.id)
+  counts = _status_counts(query)
+  deployed_passes = query.filter(
+    ProjectSubmission.status == "pass",
+    ProjectSubmission.deployed_url.isnot(None),
+  ).count()
+  return jsonify({"counts": counts, "total": sum(counts.values()), "deployed_passes": deployed_passes})
 
 
 @bp.post("/submissions")
@@ -151,13 +199,47 @@ def list_admin_submissions():
   if not user.is_superuser:
     return jsonify({"error": "Superuser access required."}), 403
 
-  submissions = (
-    ProjectSubmission.query
-    .options(joinedload(ProjectSubmission.user))
-    .order_by(ProjectSubmission.created_at.desc(), ProjectSubmission.id.desc())
-    .all()
+  status = (request.args.get("status") or "").strip().lower() or None
+  if status is not None and status not in _SUBMISSION_STATUSES:
+    return jsonify({"error": "status must be one of: fail, pass, pending"}), 400
+
+  try:
+    limit = parse_page_size(request.args.get("limit"))
+    fields = parse_fields(request.args.get("fields"), (*_SUBMISSION_FIELDS, "user"))
+    include_user = fields is None or "user" in fields
+    query = _listing_query(fields)
+    if include_user:
+      query = query.options(joinedload(ProjectSubmission.user))
+    if status is not None:
+      query = query.filter(ProjectSubmission.status == status)
+    submissions, next_cursor = keyset_page(
+      query,
+      ProjectSubmission,
+      cursor=request.args.get("cursor"),
+      limit=limit,
+    )
+  except ValueError as err:
+    return jsonify({"error": str(err)}), 400
+  return jsonify(
+    {
+      "submissions": [
+        project_fields(_serialize_submission(item, include_user=include_user, fields=fields), fields)
+        for item in submissions
+      ],
+      "next_cursor": next_cursor,
+    }
   )
-  return jsonify({"submissions": [_serialize_submission(item, include_user=True) for item in submissions]})
+
+
+@bp.get("/admin/submissions/summary")
+@jwt_required()
+def admin_submissions_summary():
+  user = _current_user()
+  if not user.is_superuser:
+    return jsonify({"error": "Superuser access required."}), 403
+
+  counts = _status_counts(ProjectSubmission.query)
+  return jsonify({"counts": counts, "total": sum(counts.values())})
 
 
 @bp.post("/submissions/<int:submission_id>/review")
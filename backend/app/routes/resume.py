@@ -1,22 +1,34 @@
 from __future__ import annotations
 
+import io
 import json
 import logging
 import time
-from threading import Lock
 from typing import Any
 
 from flask import Blueprint, current_app, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
+from sqlalchemy.orm import defer
+from werkzeug.exceptions import RequestEntityTooLarge
 
 from ..extensions import db
 from ..models import ResumeSubmission
+from ..pagination import keyset_page, parse_fields, parse_page_size, project_fields
 from ..services.progression import sync_resume_submission_progress
-from ..services.resume_providers import ResumeProviderError, build_resume_scoring_provider
+from ..services.rate_limiting import get_rate_limiter
+from ..services.resume_jobs import RESUME_JOB_POLL_SECONDS, RESUME_JOB_WORKERS, ResumeJobWorkerPool
+from ..services.resume_providers import (
+  ResumeProviderError,
+  build_resume_scoring_provider,
+  resume_scoring_provider_identity,
+)
 from ..services.resume_scoring import (
   PASS_THRESHOLD_SCORE,
   PROMPT_VERSION,
   ResumeScoringError,
+  ResumeScoringResult,
+  SpooledUpload,
+  hash_upload,
   prepare_resume_content,
   score_prepared_resume,
   validate_pdf_upload,
@@ -27,8 +39,6 @@ bp = Blueprint("resume", __name__, url_prefix="/resume")
 logger = logging.getLogger(__name__)
 
 RESUME_SCORE_LIMIT_PER_MINUTE = 6
-_RATE_LIMIT_EVENTS: dict[str, list[float]] = {}
-_RATE_LIMIT_LOCK = Lock()
 
 
 def _is_resume_scorer_enabled() -> bool:
@@ -42,18 +52,7 @@ def _is_resume_scorer_enabled() -> bool:
 
 
 def _check_rate_limit(user_id: int, *, limit: int, window_seconds: float = 60.0) -> int | None:
-  key = f"{user_id}:resume_score"
-  now = time.time()
-  with _RATE_LIMIT_LOCK:
-    history = _RATE_LIMIT_EVENTS.get(key, [])
-    history = [stamp for stamp in history if now - stamp < window_seconds]
-    if len(history) >= limit:
-      retry_after = int(window_seconds - (now - history[0])) + 1
-      _RATE_LIMIT_EVENTS[key] = history
-      return max(1, retry_after)
-    history.append(now)
-    _RATE_LIMIT_EVENTS[key] = history
-  return None
+  return get_rate_limiter().check(f"{user_id}:resume_score", limit=limit, window_seconds=window_seconds)
 
 
 def _json_list(value: list[str]) -> str:
@@ -73,7 +72,26 @@ def _public_error_message(err: ResumeScoringError) -> str:
   return str(err)
 
 
-def _serialize_submission(submission: ResumeSubmission) -> dict[str, Any]:
+_SUBMISSION_FIELDS = (
+  "id",
+  "status",
+  "file_name",
+  "file_size_bytes",
+  "page_count",
+  "extracted_char_count",
+  "overall_score",
+  "metadata",
+  "strengths",
+  "improvements",
+  "error_code",
+  "error_message",
+  "created_at",
+  "updated_at",
+  "dimension_scores",
+)
+
+
+def _serialize_submission(submission: ResumeSubmission, fields: set[str] | None = None) -> dict[str, Any]:
   payload: dict[str, Any] = {
     "id": submission.id,
     "status": submission.status,
@@ -87,8 +105,9 @@ def _serialize_submission(submission: ResumeSubmission) -> dict[str, Any]:
       "model": submission.model,
       "prompt_version": submission.prompt_version,
     },
-    "strengths": submission.strengths,
-    "improvements": submission.improvements,
+    # Deferred by projected listings; only touch them when requested to avoid per-row loads.
+    "strengths": submission.strengths if fields is None or "strengths" in fields else None,
+    "improvements": submission.improvements if fields is None or "improvements" in fields else None,
     "error_code": submission.error_code,
     "error_message": submission.error_message,
     "created_at": submission.created_at.isoformat() if submission.created_at else None,
@@ -110,13 +129,195 @@ def _serialize_submission(submission: ResumeSubmission) -> dict[str, Any]:
 @jwt_required()
 def list_submissions():
   user_id = int(get_jwt_identity())
-  submissions = (
-    ResumeSubmission.query
-    .filter_by(user_id=user_id)
-    .order_by(ResumeSubmission.created_at.desc(), ResumeSubmission.id.desc())
-    .all()
+  try:
+    limit = parse_page_size(request.args.get("limit"))
+    fields = parse_fields(request.args.get("fields"), _SUBMISSION_FIELDS)
+    query = ResumeSubmission.query.filter_by(user_id=user_id)
+    if fields is not None and "strengths" not in fields:
+      query = query.options(defer(ResumeSubmission.strengths_json))
+    if fields is not None and "improvements" not in fields:
+      query = query.options(defer(ResumeSubmission.improvements_json))
+    submissions, next_cursor = keyset_page(
+      query,
+      ResumeSubmission,
+      cursor=request.args.get("cursor"),
+      limit=limit,
+    )
+  except ValueError as err:
+    return jsonify({"error": str(err)}), 400
+  return jsonify(
+    {
+      "submissions": [project_fields(_serialize_submission(submission, fields), fields) for submission in submissions],
+      "next_cursor": next_cursor,
+    }
+  )
+
+
+def _find_reusable_submission(user_id: int, content_sha256: str, *, provider: str, model: str) -> ResumeSubmission | None:
+  # Scoped to the uploader: one user's stored feedback is never handed to another user.
+  return (
+    ResumeSubmission.query.filter(
+      ResumeSubmission.user_id == user_id,
+      ResumeSubmission.content_sha256 == content_sha256,
+      ResumeSubmission.provider == provider,
+      ResumeSubmission.model == model,
+      ResumeSubmission.prompt_version == PROMPT_VERSION,
+      ResumeSubmission.status == "succeeded",
+      ResumeSubmission.rubric_scores_json.isnot(None),
+    )
+    .order_by(ResumeSubmission.id.desc())
+    .first()
+  )
+
+
+def _reused_result(source: ResumeSubmission) -> ResumeScoringResult:
+  rubric_scores = source.rubric_scores or {}
+  return ResumeScoringResult(
+    overall_score=source.overall_score,
+    formatting_score=source.formatting_score,
+    content_score=source.content_score,
+    ats_score=source.ats_score,
+    impact_score=source.impact_score,
+    bullet_quality_impact_score=rubric_scores.get("bullet_quality_impact", 0),
+    technical_demonstration_score=rubric_scores.get("technical_demonstration", 0),
+    writing_communication_score=rubric_scores.get("writing_communication", 0),
+    formatting_ats_score=rubric_scores.get("formatting_ats", 0),
+    strengths=source.strengths,
+    improvements=source.improvements,
+  )
+
+
+def _score_submission(submission: ResumeSubmission, upload: SpooledUpload) -> ResumeScoringResult:
+  submission.content_sha256 = upload.sha256
+  submission.prompt_version = PROMPT_VERSION
+  # The dedupe lookup needs only the configured names; the client is built on a miss, so a stored
+  # score is still reused while the provider is misconfigured or unavailable.
+  submission.provider, submission.model = resume_scoring_provider_identity()
+
+  source = _find_reusable_submission(
+    submission.user_id,
+    submission.content_sha256,
+    provider=submission.provider,
+    model=submission.model,
+  )
+  if source is not None:
+    submission.reused_from_submission_id = source.reused_from_submission_id or source.id
+    submission.page_count = source.page_count
+    submission.extracted_char_count = source.extracted_char_count
+    scored = _reused_result(source)
+  else:
+    provider = build_resume_scoring_provider()
+    prepared_content = prepare_resume_content(upload.file)
+    submission.page_count = prepared_content.page_count
+    submission.extracted_char_count = prepared_content.extracted_char_count
+    scored = score_prepared_resume(
+      prepared_content=prepared_content,
+      provider=provider,
+      pdf_bytes=upload.file,
+      file_name=submission.file_name,
+    )
+
+  submission.status = "succeeded"
+  submission.overall_score = scored.overall_score
+  submission.formatting_score = scored.formatting_score
+  submission.content_score = scored.content_score
+  submission.ats_score = scored.ats_score
+  submission.impact_score = scored.impact_score
+  submission.strengths_json = _json_list(scored.strengths)
+  submission.improvements_json = _json_list(scored.improvements)
+  submission.rubric_scores_json = json.dumps(scored.rubric_scores)
+  submission.error_code = None
+  submission.error_message = None
+  submission.pdf_bytes = None
+  return scored
+
+
+def _record_scoring_failure(submission: ResumeSubmission, err: Exception) -> tuple[str, str, int]:
+  """Marks the submission failed and returns (public message, error code, http status).
+
+  Must be called from the ``except`` block handling ``err`` so unexpected errors keep their traceback.
+  """
+  if isinstance(err, ResumeScoringError):
+    public_message, error_code, status_code = _public_error_message(err), err.code, err.status_code
+    stored_message = public_message
+    logger.warning(
+      "resume_score_failed user_id=%s submission_id=%s code=%s message=%s",
+      submission.user_id,
+      submission.id,
+      err.code,
+      str(err),
+    )
+  elif isinstance(err, ResumeProviderError):
+    public_message, error_code, status_code = "Resume scorer is not configured.", "provider_config_error", 503
+    stored_message = str(err)
+    logger.exception("resume_score_provider_config_error user_id=%s submission_id=%s", submission.user_id, submission.id)
+  else:
+    public_message, error_code, status_code = "Internal scoring error.", "resume_scoring_internal_error", 500
+    stored_message = public_message
+    logger.exception("resume_score_internal_error user_id=%s submission_id=%s", submission.user_id, submission.id)
+  submission.status = "failed"
+  submission.error_code = error_code
+  submission.error_message = stored_message[:500]
+  submission.pdf_bytes = None
+  return public_message, error_code, status_code
+
+
+def _log_scoring_success(submission: ResumeSubmission, scored: ResumeScoringResult, start: float) -> None:
+  elapsed_ms = int((time.perf_counter() - start) * 1000)
+  logger.info(
+    "resume_score_succeeded user_id=%s submission_id=%s provider=%s model=%s overall=%s page_count=%s size=%s reused=%s elapsed_ms=%s",
+    submission.user_id,
+    submission.id,
+    submission.provider,
+    submission.model,
+    scored.overall_score,
+    submission.page_count,
+    submission.file_size_bytes,
+    submission.reused_from_submission_id is not None,
+    elapsed_ms,
+  )
+
+
+def run_resume_job(submission: ResumeSubmission) -> None:
+  """Scores a claimed queued submission; the worker pool calls this inside an app context."""
+  start = time.perf_counter()
+  try:
+    pdf_bytes = submission.pdf_bytes or b""
+    upload = SpooledUpload(file=io.BytesIO(pdf_bytes), size_bytes=len(pdf_bytes), sha256=submission.content_sha256)
+    scored = _score_submission(submission, upload)
+    sync_resume_submission_progress(submission.user_id, commit=False)
+    db.session.commit()
+    _log_scoring_success(submission, scored, start)
+  except Exception as err:
+    db.session.rollback()
+    submission = db.session.get(ResumeSubmission, submission.id)
+    _record_scoring_failure(submission, err)
+    db.session.commit()
+
+
+def start_resume_job_workers(app) -> ResumeJobWorkerPool:
+  """Starts this process's resume scoring workers at app creation, so jobs left queued or running by a
+  restart are picked up without waiting for a new upload."""
+  pool = ResumeJobWorkerPool(
+    app,
+    run_resume_job,
+    workers=RESUME_JOB_WORKERS,
+    poll_seconds=RESUME_JOB_POLL_SECONDS,
   )
-  return jsonify({"submissions": [_serialize_submission(submission) for submission in submissions]})
+  pool.start()
+  app.extensions["resume_job_pool"] = pool
+  return pool
+
+
+def _notify_resume_job_workers() -> None:
+  # Without in-process workers the job waits for the next poll of a `flask resume-worker` process.
+  pool = current_app.extensions.get("resume_job_pool")
+  if pool is not None:
+    pool.notify()
+
+
+def _is_async_request() -> bool:
+  return str(request.form.get("async") or "").strip().lower() in {"1", "true", "yes", "on"}
 
 
 @bp.post("/score")
@@ -136,17 +337,21 @@ def score_resume():
     response.headers["Retry-After"] = str(retry_after)
     return response
 
-  uploaded = request.files.get("file")
+  try:
+    # MAX_CONTENT_LENGTH makes the parser refuse oversized bodies, chunked or not, before spooling them.
+    uploaded = request.files.get("file")
+  except RequestEntityTooLarge:
+    return jsonify(_submission_error_payload("File is too large. Max size is 5MB.", error_code="file_too_large")), 400
   if uploaded is None:
     return jsonify({"error": "file is required"}), 400
 
   file_name = (uploaded.filename or "resume.pdf").strip() or "resume.pdf"
-  file_bytes = uploaded.read() or b""
-  file_size_bytes = len(file_bytes)
+  upload = hash_upload(uploaded.stream)
   submission = ResumeSubmission(
     user_id=user_id,
     file_name=file_name,
-    file_size_bytes=file_size_bytes,
+    file_size_bytes=upload.size_bytes,
+    content_sha256=upload.sha256,
     status="failed",
   )
   db.session.add(submission)
@@ -156,36 +361,24 @@ def score_resume():
     validate_pdf_upload(
       filename=file_name,
       mimetype=uploaded.mimetype,
-      file_size_bytes=file_size_bytes,
+      file_size_bytes=upload.size_bytes,
     )
 
-    prepared_content = prepare_resume_content(file_bytes)
-    submission.page_count = prepared_content.page_count
-    submission.extracted_char_count = prepared_content.extracted_char_count
-    submission.prompt_version = PROMPT_VERSION
-
-    provider = build_resume_scoring_provider()
-    submission.provider = provider.provider_name
-    submission.model = provider.model_name
-
-    scored = score_prepared_resume(
-      prepared_content=prepared_content,
-      provider=provider,
-      pdf_bytes=file_bytes,
-      file_name=file_name,
-    )
-
-    submission.status = "succeeded"
-    submission.overall_score = scored.overall_score
-    submission.formatting_score = scored.formatting_score
-    submission.content_score = scored.content_score
-    submission.ats_score = scored.ats_score
-    submission.impact_score = scored.impact_score
-    submission.strengths_json = _json_list(scored.strengths)
-    submission.improvements_json = _json_list(scored.improvements)
-    submission.error_code = None
-    submission.error_message = None
-
+    if _is_async_request():
+      # The upload is held on the row until a worker claims and scores it.
+      submission.status = "queued"
+      submission.pdf_bytes = upload.read_bytes()
+      db.session.commit()
+      _notify_resume_job_workers()
+      return jsonify(
+        {
+          "submission_id": submission.id,
+          "status": submission.status,
+          "status_url": f"{bp.url_prefix}/submissions/{submission.id}",
+        }
+      ), 202
+
+    scored = _score_submission(submission, upload)
     sync_resume_submission_progress(user_id, commit=False)
     db.session.commit()
 
@@ -196,18 +389,7 @@ def score_resume():
     )
     resume_category = int(best_successful_score or 0)
     resume_task_completed = resume_category >= PASS_THRESHOLD_SCORE
-    elapsed_ms = int((time.perf_counter() - start) * 1000)
-    logger.info(
-      "resume_score_succeeded user_id=%s submission_id=%s provider=%s model=%s overall=%s page_count=%s size=%s elapsed_ms=%s",
-      user_id,
-      submission.id,
-      submission.provider,
-      submission.model,
-      scored.overall_score,
-      submission.page_count,
-      submission.file_size_bytes,
-      elapsed_ms,
-    )
+    _log_scoring_success(submission, scored, start)
 
     return jsonify(
       {
@@ -222,6 +404,7 @@ def score_resume():
           "provider": submission.provider,
           "model": submission.model,
           "prompt_version": submission.prompt_version,
+          "reused": submission.reused_from_submission_id is not None,
         },
         "progression": {
           "resume_task_completed": resume_task_completed,
@@ -230,31 +413,19 @@ def score_resume():
         },
       }
     )
-  except ResumeScoringError as err:
-    public_message = _public_error_message(err)
-    submission.status = "failed"
-    submission.error_code = err.code
-    submission.error_message = public_message[:500]
-    db.session.commit()
-    logger.warning(
-      "resume_score_failed user_id=%s submission_id=%s code=%s message=%s",
-      user_id,
-      submission.id,
-      err.code,
-      str(err),
-    )
-    return jsonify(_submission_error_payload(public_message, error_code=err.code)), err.status_code
-  except ResumeProviderError as err:
-    submission.status = "failed"
-    submission.error_code = "provider_config_error"
-    submission.error_message = str(err)[:500]
-    db.session.commit()
-    logger.exception("resume_score_provider_config_error user_id=%s submission_id=%s", user_id, submission.id)
-    return jsonify(_submission_error_payload("Resume scorer is not configured.", error_code="provider_config_error")), 503
-  except Exception:
-    submission.status = "failed"
-    submission.error_code = "resume_scoring_internal_error"
-    submission.error_message = "Internal scoring error."
+  except Exception as err:
+    public_message, error_code, status_code = _record_scoring_failure(submission, err)
     db.session.commit()
-    logger.exception("resume_score_internal_error user_id=%s submission_id=%s", user_id, submission.id)
-    return jsonify(_submission_error_payload("Internal scoring error.", error_code="resume_scoring_internal_error")), 500
+    return jsonify(_submission_error_payload(public_message, error_code=error_code)), status_code
+  finally:
+    upload.close()
+
+
+@bp.get("/submissions/<int:submission_id>")
+@jwt_required()
+def submission_status(submission_id: int):
+  user_id = int(get_jwt_identity())
+  submission = ResumeSubmission.query.filter_by(id=submission_id, user_id=user_id).first()
+  if submission is None:
+    return jsonify({"error": "Submission not found"}), 404
+  return jsonify(_serialize_submission(submission))
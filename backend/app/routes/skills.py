@@ -1,33 +1,59 @@
 from __future__ import annotations
 
 import json
+import logging
 import math
 import time
-from threading import Lock
-from typing import Any
-
-from flask import Blueprint, jsonify, request
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime
+from threading import BoundedSemaphore
+from typing import Any, Callable, Iterator
+
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
 from flask_jwt_extended import get_jwt_identity, jwt_required
 
-from ..models import Module, Task
+from ..extensions import db
+from ..models import ChallengeSubmissionJob, User, UserTaskCompletion
+from ..services.execution_cache import (
+  compile_failure_key,
+  execution_cache_key,
+  get_compile_failure_cache,
+  get_execution_cache,
+)
+from ..services.executors import get_executor_stats, run_submission, run_submission_batch, supports_batch
 from ..services.judge0 import (
   Judge0Error,
   Judge0ProcessingTimeout,
   get_compact_languages,
+  get_language_catalog_stats,
   get_language_family,
   get_languages,
-  run_submission,
+  get_poll_stats,
+  get_transport_stats,
+)
+from ..services.progression import get_challenge_task_ids, set_task_completion_internal
+from ..services.rate_limiting import get_rate_limiter
+from ..services.skills_harness import (
+  ERROR_MARKER,
+  MULTI_CASE_FAMILIES,
+  RESULT_MARKER,
+  TIME_MARKER,
+  build_harness_source,
+  build_multi_case_harness_source,
+  format_case_preview,
 )
-from ..services.progression import set_task_completion_internal
-from ..services.skills_harness import RESULT_MARKER, build_harness_source, format_case_preview
 from ..services.skills_challenges import (
   challenge_supports_family,
   get_challenge_config,
   list_challenge_contracts,
   list_challenge_ids,
 )
+from ..services.submit_jobs import own_submit_job, release_submit_job
 
 bp = Blueprint("skills", __name__, url_prefix="/skills")
+logger = logging.getLogger(__name__)
 
 MAX_SOURCE_CODE_CHARS = 20000
 RUN_LIMIT_PER_MINUTE = 10
@@ -35,11 +61,23 @@ SUBMIT_LIMIT_PER_MINUTE = 2
 RUN_CONCURRENT_LIMIT = 2
 SUBMIT_CONCURRENT_LIMIT = 1
 MAX_CAPTURED_OUTPUT_CHARS = 20000
-
-_RATE_LIMIT_EVENTS: dict[str, list[float]] = {}
-_RATE_LIMIT_LOCK = Lock()
-_IN_FLIGHT_REQUESTS: dict[str, int] = {}
-_IN_FLIGHT_LOCK = Lock()
+MAX_MULTI_CASE_CPU_TIME_LIMIT = 10.0
+SUBMIT_JOB_WORKERS = 4
+MAX_PENDING_SUBMIT_JOBS = 32
+SUBMIT_JOB_STREAM_INTERVAL_SECONDS = 0.25
+SUBMIT_JOB_STREAM_MAX_INTERVAL_SECONDS = 2.0
+SUBMIT_JOB_STREAM_MAX_SECONDS = 120.0
+# Each open stream holds a request thread; past this many per process clients are sent to the status endpoint.
+MAX_SUBMIT_JOB_STREAMS = 16
+# Threads that run unbatchable cases side by side; executors.MAX_OUTSTANDING_EXECUTIONS caps how
+# many of those, together with every other execution, reach the judge at once.
+CASE_FAN_OUT_WORKERS = 8
+
+# Async submits run here so request threads return immediately; the semaphore bounds queued work.
+_SUBMIT_EXECUTOR = ThreadPoolExecutor(max_workers=SUBMIT_JOB_WORKERS, thread_name_prefix="skills-submit")
+_SUBMIT_JOB_SLOTS = BoundedSemaphore(MAX_PENDING_SUBMIT_JOBS)
+_SUBMIT_JOB_STREAM_SLOTS = BoundedSemaphore(MAX_SUBMIT_JOB_STREAMS)
+_CASE_FAN_OUT_EXECUTOR = ThreadPoolExecutor(max_workers=CASE_FAN_OUT_WORKERS, thread_name_prefix="skills-case")
 
 
 def _normalize_output(value: str | None) -> str:
@@ -57,11 +95,13 @@ def _json_preview(value: Any) -> str:
     return str(value)
 
 
-def _extract_serialized_result(stdout: str) -> str:
+def _extract_serialized_result(stdout: str, *, case_index: int | None = None) -> str:
+  # Multi-case programs tag each result line with its case index; single-case ones do not.
+  marker = RESULT_MARKER if case_index is None else f"{RESULT_MARKER}{case_index}:"
   marker_indexes: list[int] = []
   offset = 0
   while True:
-    index = stdout.find(RESULT_MARKER, offset)
+    index = stdout.find(marker, offset)
     if index < 0:
       break
     marker_indexes.append(index)
@@ -72,7 +112,10 @@ def _extract_serialized_result(stdout: str) -> str:
 
   decoder = json.JSONDecoder()
   for marker_index in reversed(marker_indexes):
-    payload = stdout[marker_index + len(RESULT_MARKER):].strip()
+    payload = stdout[marker_index + len(marker):]
+    if case_index is not None:
+      payload = payload.split("\n", 1)[0]
+    payload = payload.strip()
     if not payload:
       continue
     try:
@@ -202,7 +245,7 @@ def _status_kind(status_id: int, status_description: str) -> str:
   text = (status_description or "").lower()
   if status_id == 3:
     return "ok"
-  if "compile" in text:
+  if status_id == 6 or "compil" in text:
     return "compile_error"
   if "runtime" in text:
     return "runtime_error"
@@ -216,39 +259,15 @@ def _status_kind(status_id: int, status_description: str) -> str:
 
 
 def _check_rate_limit(user_id: int, action: str, limit: int, *, window_seconds: float = 60.0) -> int | None:
-  key = f"{user_id}:{action}"
-  now = time.time()
-
-  with _RATE_LIMIT_LOCK:
-    history = _RATE_LIMIT_EVENTS.get(key, [])
-    history = [stamp for stamp in history if now - stamp < window_seconds]
-    if len(history) >= limit:
-      retry_after = int(window_seconds - (now - history[0])) + 1
-      _RATE_LIMIT_EVENTS[key] = history
-      return max(1, retry_after)
-    history.append(now)
-    _RATE_LIMIT_EVENTS[key] = history
-  return None
+  return get_rate_limiter().check(f"{user_id}:{action}", limit=limit, window_seconds=window_seconds)
 
 
 def _acquire_in_flight(user_id: int, action: str, limit: int) -> bool:
-  key = f"{user_id}:{action}"
-  with _IN_FLIGHT_LOCK:
-    current = _IN_FLIGHT_REQUESTS.get(key, 0)
-    if current >= limit:
-      return False
-    _IN_FLIGHT_REQUESTS[key] = current + 1
-  return True
+  return get_rate_limiter().acquire(f"{user_id}:{action}", limit=limit)
 
 
 def _release_in_flight(user_id: int, action: str) -> None:
-  key = f"{user_id}:{action}"
-  with _IN_FLIGHT_LOCK:
-    current = _IN_FLIGHT_REQUESTS.get(key, 0)
-    if current <= 1:
-      _IN_FLIGHT_REQUESTS.pop(key, None)
-    else:
-      _IN_FLIGHT_REQUESTS[key] = current - 1
+  get_rate_limiter().release(f"{user_id}:{action}")
 
 
 def _rate_limited_response(message: str, retry_after_seconds: int):
@@ -271,16 +290,14 @@ def _judge_timeout_response(message: str, retry_after_seconds: int = 2):
   return response
 
 
-def _evaluate_case(
+def _build_case_source(
   source_code: str,
-  language_id: int,
   language_family: str,
   challenge: dict[str, Any],
   test_case: dict[str, Any],
-  cpu_time_limit: float,
-) -> dict[str, Any]:
+) -> str:
   try:
-    wrapped_source = build_harness_source(
+    return build_harness_source(
       family=language_family,
       function_name=str(challenge["function_name"]),
       parameters=list(challenge["parameters"]),
@@ -291,13 +308,53 @@ def _evaluate_case(
   except ValueError as err:
     raise Judge0Error(str(err)) from err
 
-  result = run_submission(
-    source_code=wrapped_source,
-    language_id=language_id,
-    stdin="",
-    cpu_time_limit=cpu_time_limit,
-  )
 
+def _case_raised(stdout: str, case_index: int) -> bool:
+  return f"{ERROR_MARKER}{case_index}\n" in stdout
+
+
+def _case_reported(stdout: str, case_index: int) -> bool:
+  return _case_raised(stdout, case_index) or f"{RESULT_MARKER}{case_index}:" in stdout
+
+
+def _case_elapsed_ms(stdout: str, case_index: int) -> int | None:
+  marker = f"{TIME_MARKER}{case_index}:"
+  start = stdout.find(marker)
+  if start < 0:
+    return None
+  try:
+    return int(stdout[start + len(marker):].split("\n", 1)[0].strip())
+  except ValueError:
+    return None
+
+
+def _build_multi_case_source(
+  source_code: str,
+  language_family: str,
+  challenge: dict[str, Any],
+  tests: list[dict[str, Any]],
+) -> str:
+  try:
+    return build_multi_case_harness_source(
+      family=language_family,
+      function_name=str(challenge["function_name"]),
+      parameters=list(challenge["parameters"]),
+      return_type=str(challenge.get("return_type") or "string"),
+      cases_args=[list(test_case["args"]) for test_case in tests],
+      user_source=source_code,
+    )
+  except ValueError as err:
+    raise Judge0Error(str(err)) from err
+
+
+def _evaluate_case(
+  challenge: dict[str, Any],
+  test_case: dict[str, Any],
+  result: dict[str, Any],
+  *,
+  case_index: int | None = None,
+  time_limit_ms: int | None = None,
+) -> dict[str, Any]:
   status = result.get("status") or {}
   status_id = int(status.get("id") or 0)
   status_description = str(status.get("description") or "Unknown")
@@ -316,10 +373,23 @@ def _evaluate_case(
   normalized_stdout = _normalize_output(stdout)
   expected_preview = _json_preview(test_case["expected"])
   actual_preview = normalized_stdout
+  time_ms = _to_ms(result.get("time"))
+
+  if case_index is not None:
+    # A shared multi-case run only reports one status and time; resolve this case from its own markers.
+    elapsed_ms = _case_elapsed_ms(raw_stdout, case_index)
+    if elapsed_ms is not None:
+      time_ms = elapsed_ms
+    if _case_raised(raw_stdout, case_index):
+      status_id, status_description = 11, "Runtime Error (NZEC)"
+    elif time_limit_ms is not None and elapsed_ms is not None and elapsed_ms > time_limit_ms:
+      status_id, status_description = 5, "Time Limit Exceeded"
+    elif f"{RESULT_MARKER}{case_index}:" in raw_stdout:
+      status_id, status_description = 3, "Accepted"
 
   if status_id == 3:
     try:
-      payload = _extract_serialized_result(raw_stdout)
+      payload = _extract_serialized_result(raw_stdout, case_index=case_index)
       parsed_actual = json.loads(payload)
       actual_preview = _json_preview(parsed_actual)
       passed = _compare_typed_values(
@@ -346,11 +416,128 @@ def _evaluate_case(
     "stdin": format_case_preview(list(challenge["parameters"]), list(test_case["args"])),
     "compile_output": compile_output,
     "stderr": stderr,
-    "time_ms": _to_ms(result.get("time")),
+    "time_ms": time_ms,
     "memory_kb": result.get("memory"),
   }
 
 
+def _run_cached(
+  source_codes: list[str],
+  *,
+  language_id: int,
+  language_family: str,
+  cpu_time_limit: float,
+) -> Iterator[dict[str, Any]]:
+  """Yield results for wrapped sources in order, serving unchanged programs from the execution result cache.
+
+  Misses run as one batch when the executor supports it and otherwise fan out on the shared case
+  pool; either way they pass the executors' process-wide execution gate. Closing the iterator early
+  cancels cases that have not started yet.
+  """
+  cache = get_execution_cache()
+  keys = [
+    execution_cache_key(source_code=source, language_id=language_id, cpu_time_limit=cpu_time_limit)
+    for source in source_codes
+  ]
+  results: list[dict[str, Any] | None] = [cache.get(key) for key in keys]
+  missing = [index for index, result in enumerate(results) if result is None]
+  pending: dict[int, Future] = {}
+
+  if len(missing) == 1:
+    index = missing[0]
+    fresh = [
+      run_submission(
+        source_code=source_codes[index],
+        language_id=language_id,
+        stdin="",
+        cpu_time_limit=cpu_time_limit,
+        language_family=language_family,
+      )
+    ]
+  elif missing and supports_batch(language_family):
+    fresh = run_submission_batch(
+      source_codes=[source_codes[index] for index in missing],
+      language_id=language_id,
+      cpu_time_limit=cpu_time_limit,
+      language_family=language_family,
+    )
+  else:
+    fresh = []
+    pending = {
+      index: _CASE_FAN_OUT_EXECUTOR.submit(
+        run_submission,
+        source_code=source_codes[index],
+        language_id=language_id,
+        stdin="",
+        cpu_time_limit=cpu_time_limit,
+        language_family=language_family,
+      )
+      for index in missing
+    }
+
+  for index, result in zip(missing, fresh):
+    cache.set(keys[index], result)
+    results[index] = result
+
+  try:
+    for index, key in enumerate(keys):
+      if index in pending:
+        results[index] = pending.pop(index).result()
+        cache.set(key, results[index])
+      yield results[index] or {}
+  finally:
+    for future in pending.values():
+      future.cancel()
+
+
+def _with_case_index(results: Iterator[dict[str, Any]]) -> Iterator[tuple[dict[str, Any], int | None]]:
+  with closing(results):
+    for result in results:
+      yield result, None
+
+
+def _run_multi_case(
+  source_code: str,
+  language_id: int,
+  language_family: str,
+  challenge: dict[str, Any],
+  tests: list[dict[str, Any]],
+  cpu_time_limit: float,
+) -> Iterator[tuple[dict[str, Any], int | None]]:
+  """Yield ``(result, case_index)`` per case from one shared program that runs every case.
+
+  Cases the shared program reported are judged from its markers. Cases it never reached, because
+  an earlier case exhausted the shared budget or crashed the process, are re-run on their own
+  under the per-case limit, so one runaway case does not fail the cases after it.
+  """
+  (shared_result,) = _run_cached(
+    [_build_multi_case_source(source_code, language_family, challenge, tests)],
+    language_id=language_id,
+    language_family=language_family,
+    cpu_time_limit=min(cpu_time_limit * len(tests), MAX_MULTI_CASE_CPU_TIME_LIMIT),
+  )
+  stdout = str(shared_result.get("stdout") or "")
+  status = shared_result.get("status") or {}
+  unreported = [index for index in range(len(tests)) if not _case_reported(stdout, index)]
+  if not unreported or _status_kind(int(status.get("id") or 0), str(status.get("description") or "")) == "compile_error":
+    for index in range(len(tests)):
+      yield shared_result, index
+    return
+
+  reruns = _run_cached(
+    [_build_case_source(source_code, language_family, challenge, tests[index]) for index in unreported],
+    language_id=language_id,
+    language_family=language_family,
+    cpu_time_limit=cpu_time_limit,
+  )
+  with closing(reruns):
+    for index in range(len(tests)):
+      if index in unreported:
+        yield next(reruns), None
+      else:
+        yield shared_result, index
+
+
 def _evaluate_test_group(
   source_code: str,
   language_id: int,
@@ -360,6 +547,7 @@ def _evaluate_test_group(
   cpu_time_limit: float,
   *,
   stop_on_first_failure: bool,
+  on_case: Callable[[int, dict[str, Any]], None] | None = None,
 ) -> dict[str, Any]:
   case_results: list[dict[str, Any]] = []
   error_kind = "ok"
@@ -368,24 +556,67 @@ def _evaluate_test_group(
   peak_time_ms = 0
   peak_memory_kb = 0
 
-  for test_case in tests:
-    case = _evaluate_case(source_code, language_id, language_family, challenge, test_case, cpu_time_limit)
-    case_results.append(case)
-
-    if case["compile_output"] and not compile_output:
-      compile_output = str(case["compile_output"])
-    if case["stderr"] and not stderr:
-      stderr = str(case["stderr"])
-    if isinstance(case["time_ms"], int):
-      peak_time_ms = max(peak_time_ms, case["time_ms"])
-    if isinstance(case["memory_kb"], int):
-      peak_memory_kb = max(peak_memory_kb, case["memory_kb"])
-
-    if case["status_kind"] not in {"ok", "wrong_answer"} and error_kind == "ok":
-      error_kind = case["status_kind"]
+  multi_case = language_family in MULTI_CASE_FAMILIES and len(tests) > 1
+  failure_key = compile_failure_key(
+    source_code=source_code,
+    language_id=language_id,
+    signature=json.dumps(
+      [challenge["function_name"], challenge["parameters"], challenge.get("return_type")],
+      sort_keys=True,
+    ),
+  )
+  # Set once any case fails to compile: the remaining cases would fail identically, so they are
+  # judged against this result instead of being executed.
+  compile_failure = get_compile_failure_cache().get(failure_key)
+  if compile_failure is not None:
+    results = ((compile_failure, None) for _ in tests)
+  elif multi_case:
+    # Compiled families pay compilation once: every case runs inside a single program and is
+    # still held to the per-case limit through the harness's own timing.
+    results = _run_multi_case(source_code, language_id, language_family, challenge, tests, cpu_time_limit)
+  else:
+    wrapped_sources = [
+      _build_case_source(source_code, language_family, challenge, test_case)
+      for test_case in tests
+    ]
+    # Cases execute as one Judge0 batch or concurrently; results are still judged in case order so
+    # stop_on_first_failure reports the same prefix the serial path did.
+    results = _with_case_index(
+      _run_cached(
+        wrapped_sources,
+        language_id=language_id,
+        language_family=language_family,
+        cpu_time_limit=cpu_time_limit,
+      )
+    )
 
-    if stop_on_first_failure and not case["passed"]:
-      break
+  time_limit_ms = int(cpu_time_limit * 1000)
+  with closing(results):
+    for index, test_case in enumerate(tests):
+      result, case_index = (compile_failure, None) if compile_failure is not None else next(results)
+      case = _evaluate_case(challenge, test_case, result, case_index=case_index, time_limit_ms=time_limit_ms)
+      if case["status_kind"] == "compile_error" and compile_failure is None:
+        compile_failure = result
+        results.close()
+        get_compile_failure_cache().set(failure_key, result)
+      case_results.append(case)
+      if on_case is not None:
+        on_case(index, case)
+
+      if case["compile_output"] and not compile_output:
+        compile_output = str(case["compile_output"])
+      if case["stderr"] and not stderr:
+        stderr = str(case["stderr"])
+      if isinstance(case["time_ms"], int):
+        peak_time_ms = max(peak_time_ms, case["time_ms"])
+      if isinstance(case["memory_kb"], int):
+        peak_memory_kb = max(peak_memory_kb, case["memory_kb"])
+
+      if case["status_kind"] not in {"ok", "wrong_answer"} and error_kind == "ok":
+        error_kind = case["status_kind"]
+
+      if stop_on_first_failure and not case["passed"]:
+        break
 
   passed_count = sum(1 for case in case_results if case["passed"])
   total = len(tests)
@@ -409,12 +640,173 @@ def _evaluate_test_group(
 }
 
 
-def _resolve_challenge_task(*, challenge_id: str, coding_module_id: int) -> Task | None:
-  return Task.query.filter_by(
-    module_id=coding_module_id,
-    challenge_id=challenge_id,
-    is_active=True,
-  ).first()
+def _complete_submission(user_id: int, challenge_id: str, evaluation: dict[str, Any]) -> dict[str, Any]:
+  passed_all_hidden = evaluation["passed_count"] == evaluation["total"]
+  task_completed = False
+
+  if passed_all_hidden:
+    task_id = (get_challenge_task_ids("coding") or {}).get(challenge_id)
+    if task_id is not None:
+      set_task_completion_internal(user_id, task_id, True)
+      task_completed = True
+
+  return {
+    "status": evaluation["status"],
+    "passed_all_hidden": passed_all_hidden,
+    "hidden_pass_count": evaluation["passed_count"],
+    "hidden_total": evaluation["total"],
+    "task_completed": task_completed,
+    "compile_output": evaluation["compile_output"],
+    "stderr": evaluation["stderr"],
+    "time_ms": evaluation["time_ms"],
+    "memory_kb": evaluation["memory_kb"],
+  }
+
+
+def _serialize_submit_job(job: ChallengeSubmissionJob) -> dict[str, Any]:
+  return {
+    "job_id": job.id,
+    "challenge_id": job.challenge_id,
+    "status": job.status,
+    "total_cases": job.total_cases,
+    "case_results": job.case_results,
+    "result": job.result,
+    "error": job.error_message,
+    "error_code": job.error_code,
+    "created_at": job.created_at.isoformat() if job.created_at else None,
+    "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+  }
+
+
+def _finish_submit_job(job_id: str, *, status: str, error_code: str | None = None, error_message: str | None = None) -> None:
+  job = db.session.get(ChallengeSubmissionJob, job_id)
+  if job is None:
+    return
+  job.status = status
+  job.error_code = error_code
+  job.error_message = error_message[:500] if error_message else None
+  db.session.commit()
+
+
+def _run_submit_job(
+  app,
+  *,
+  job_id: str,
+  user_id: int,
+  challenge_id: str,
+  source_code: str,
+  language_id: int,
+  language_family: str,
+) -> None:
+  with app.app_context():
+    try:
+      challenge = get_challenge_config(challenge_id)
+      job = db.session.get(ChallengeSubmissionJob, job_id)
+      if challenge is None or job is None or job.status != "queued":
+        return
+      job.status = "running"
+      job.claimed_at = job.heartbeat_at = datetime.utcnow()
+      db.session.commit()
+      streamed_cases: list[dict[str, Any]] = []
+
+      def _record_case(index: int, case: dict[str, Any]) -> None:
+        # Hidden cases stream pass/fail only; inputs and expected outputs stay private.
+        streamed_cases.append(
+          {
+            "index": index,
+            "passed": case["passed"],
+            "status": case["status_kind"],
+            "time_ms": case["time_ms"],
+          }
+        )
+        job.case_results_json = json.dumps(streamed_cases)
+        job.heartbeat_at = datetime.utcnow()
+        db.session.commit()
+
+      evaluation = _evaluate_test_group(
+        source_code=source_code,
+        language_id=language_id,
+        language_family=language_family,
+        challenge=challenge,
+        tests=challenge["hidden_cases"],
+        cpu_time_limit=float(challenge.get("cpu_time_limit") or 2.0),
+        stop_on_first_failure=True,
+        on_case=_record_case,
+      )
+      result = _complete_submission(user_id, challenge_id, evaluation)
+      job = db.session.get(ChallengeSubmissionJob, job_id)
+      job.result_json = json.dumps(result)
+      job.status = "completed"
+      db.session.commit()
+    except Judge0ProcessingTimeout as err:
+      db.session.rollback()
+      _finish_submit_job(job_id, status="failed", error_code="judge_processing_timeout", error_message=str(err))
+    except Judge0Error as err:
+      db.session.rollback()
+      _finish_submit_job(job_id, status="failed", error_code="judge_error", error_message=str(err))
+    except Exception:
+      db.session.rollback()
+      logger.exception("skills_submit_job_failed job_id=%s user_id=%s", job_id, user_id)
+      _finish_submit_job(job_id, status="failed", error_code="internal_error", error_message="Internal execution error.")
+    finally:
+      db.session.remove()
+      release_submit_job(job_id)
+      _release_in_flight(user_id, "submit")
+      _SUBMIT_JOB_SLOTS.release()
+
+
+def _enqueue_submit_job(
+  *,
+  user_id: int,
+  challenge_id: str,
+  challenge: dict[str, Any],
+  source_code: str,
+  language_id: int,
+  language_family: str,
+):
+  if not _SUBMIT_JOB_SLOTS.acquire(blocking=False):
+    _release_in_flight(user_id, "submit")
+    return _judge_timeout_response("The grader is busy. Please retry in a moment.")
+
+  job_id = uuid.uuid4().hex
+  try:
+    job = ChallengeSubmissionJob(
+      id=job_id,
+      user_id=user_id,
+      challenge_id=challenge_id,
+      language_id=language_id,
+      status="queued",
+      total_cases=len(challenge["hidden_cases"]),
+      heartbeat_at=datetime.utcnow(),
+    )
+    db.session.add(job)
+    db.session.commit()
+    # From here until the worker finishes, this process's sweeper keeps the job's heartbeat fresh.
+    own_submit_job(job.id)
+    _SUBMIT_EXECUTOR.submit(
+      _run_submit_job,
+      current_app._get_current_object(),
+      job_id=job.id,
+      user_id=user_id,
+      challenge_id=challenge_id,
+      source_code=source_code,
+      language_id=language_id,
+      language_family=language_family,
+    )
+  except Exception:
+    release_submit_job(job_id)
+    _SUBMIT_JOB_SLOTS.release()
+    _release_in_flight(user_id, "submit")
+    raise
+
+  return jsonify(
+    {
+      "job_id": job.id,
+      "status": job.status,
+      "status_url": f"{bp.url_prefix}/submit-jobs/{job.id}",
+      "stream_url": f"{bp.url_prefix}/submit-jobs/{job.id}/stream",
+    }
+  ), 202
 
 
 @bp.get("/challenges")
@@ -427,28 +819,29 @@ def challenges():
 @jwt_required()
 def progress():
   user_id = int(get_jwt_identity())
-  coding_module = Module.query.filter_by(key="coding").first()
-  if coding_module is None:
+  challenge_task_ids = get_challenge_task_ids("coding")
+  if challenge_task_ids is None:
     return jsonify({"error": "Coding module not found"}), 404
 
-  challenge_completion: dict[str, bool] = {}
-  completed_count = 0
-
-  for challenge_id in list_challenge_ids():
-    task = _resolve_challenge_task(challenge_id=challenge_id, coding_module_id=coding_module.id)
-    if task is None:
-      challenge_completion[challenge_id] = False
-      continue
+  challenge_ids = list_challenge_ids()
+  task_ids = {challenge_task_ids[challenge_id] for challenge_id in challenge_ids if challenge_id in challenge_task_ids}
+  completed_task_ids: set[int] = set()
+  if task_ids:
+    completed_task_ids = {
+      row.task_id
+      for row in db.session.query(UserTaskCompletion.task_id).filter(
+        UserTaskCompletion.user_id == user_id,
+        UserTaskCompletion.task_id.in_(task_ids),
+      )
+    }
 
-    is_completed = bool(
-      task.completions
-      and any(completion.user_id == user_id for completion in task.completions)
-    )
-    challenge_completion[challenge_id] = is_completed
-    if is_completed:
-      completed_count += 1
+  challenge_completion = {
+    challenge_id: challenge_task_ids.get(challenge_id) in completed_task_ids
+    for challenge_id in challenge_ids
+  }
+  completed_count = sum(1 for is_completed in challenge_completion.values() if is_completed)
 
-  total = len(list_challenge_ids())
+  total = len(challenge_ids)
   return jsonify(
     {
       "challenge_completion": challenge_completion,
@@ -458,6 +851,25 @@ def progress():
   )
 
 
+@bp.get("/admin/runtime-stats")
+@jwt_required()
+def runtime_stats():
+  user = User.query.get_or_404(int(get_jwt_identity()))
+  if not user.is_superuser:
+    return jsonify({"error": "Superuser access required."}), 403
+  return jsonify(
+    {
+      "judge0_transport": get_transport_stats(),
+      "execution_cache": get_execution_cache().stats(),
+      "compile_failure_cache": get_compile_failure_cache().stats(),
+      "judge0_polling": get_poll_stats(),
+      "judge0_languages": get_language_catalog_stats(),
+      "executor": get_executor_stats(),
+      "rate_limiter": get_rate_limiter().stats(),
+    }
+  )
+
+
 @bp.get("/languages")
 @jwt_required()
 def languages():
@@ -580,6 +992,17 @@ def submit_challenge(challenge_id: str):
   if not _acquire_in_flight(user_id, "submit", SUBMIT_CONCURRENT_LIMIT):
     return _rate_limited_response("A submit is already in progress. Please wait.", 1)
 
+  if payload.get("async") is True:
+    # The in-flight slot is released by the job worker once the run finishes.
+    return _enqueue_submit_job(
+      user_id=user_id,
+      challenge_id=challenge_id,
+      challenge=challenge,
+      source_code=source_code,
+      language_id=language_id,
+      language_family=language_family,
+    )
+
   hidden_tests = challenge["hidden_cases"]
   cpu_time_limit = float(challenge.get("cpu_time_limit") or 2.0)
 
@@ -599,29 +1022,61 @@ def submit_challenge(challenge_id: str):
     except Judge0Error as err:
       return jsonify({"error": str(err)}), 502
 
-    passed_all_hidden = evaluation["passed_count"] == evaluation["total"]
-    task_completed = False
-
-    if passed_all_hidden:
-      coding_module = Module.query.filter_by(key="coding").first()
-      if coding_module:
-        task = _resolve_challenge_task(challenge_id=challenge_id, coding_module_id=coding_module.id)
-        if task:
-          set_task_completion_internal(user_id, task.id, True)
-          task_completed = True
-
-    return jsonify(
-      {
-        "status": evaluation["status"],
-        "passed_all_hidden": passed_all_hidden,
-        "hidden_pass_count": evaluation["passed_count"],
-        "hidden_total": evaluation["total"],
-        "task_completed": task_completed,
-        "compile_output": evaluation["compile_output"],
-        "stderr": evaluation["stderr"],
-        "time_ms": evaluation["time_ms"],
-        "memory_kb": evaluation["memory_kb"],
-      }
-    )
+    return jsonify(_complete_submission(user_id, challenge_id, evaluation))
   finally:
     _release_in_flight(user_id, "submit")
+
+
+@bp.get("/submit-jobs/<job_id>")
+@jwt_required()
+def submit_job_status(job_id: str):
+  user_id = int(get_jwt_identity())
+  job = ChallengeSubmissionJob.query.filter_by(id=job_id, user_id=user_id).first()
+  if job is None:
+    return jsonify({"error": "Submit job not found"}), 404
+  return jsonify(_serialize_submit_job(job))
+
+
+@bp.get("/submit-jobs/<job_id>/stream")
+@jwt_required()
+def submit_job_stream(job_id: str):
+  """Server-sent events for one submit job: a ``case`` event per judged case, then ``done``.
+
+  Cases are emitted as the worker records them; when the executor judges a whole batch at once
+  they arrive together. The stream polls the job row with backoff and is capped per process at
+  MAX_SUBMIT_JOB_STREAMS, beyond which clients get a 503 and should poll the status endpoint.
+  """
+  user_id = int(get_jwt_identity())
+  if ChallengeSubmissionJob.query.filter_by(id=job_id, user_id=user_id).first() is None:
+    return jsonify({"error": "Submit job not found"}), 404
+  if not _SUBMIT_JOB_STREAM_SLOTS.acquire(blocking=False):
+    return _judge_timeout_response("Too many open result streams. Poll the job status instead.")
+
+  def _events():
+    sent_cases = 0
+    interval = SUBMIT_JOB_STREAM_INTERVAL_SECONDS
+    deadline = time.monotonic() + SUBMIT_JOB_STREAM_MAX_SECONDS
+    while True:
+      db.session.expire_all()
+      job = db.session.get(ChallengeSubmissionJob, job_id)
+      if job is None:
+        return
+      case_results = job.case_results
+      for case in case_results[sent_cases:]:
+        yield f"event: case\ndata: {json.dumps(case)}\n\n"
+      sent_cases = len(case_results)
+      if job.status in {"completed", "failed"}:
+        yield f"event: done\ndata: {json.dumps(_serialize_submit_job(job))}\n\n"
+        return
+      if time.monotonic() >= deadline:
+        yield f"event: timeout\ndata: {json.dumps({'job_id': job_id, 'status': job.status})}\n\n"
+        return
+      time.sleep(interval)
+      interval = min(interval * 2, SUBMIT_JOB_STREAM_MAX_INTERVAL_SECONDS)
+
+  response = Response(stream_with_context(_events()), mimetype="text/event-stream")
+  # call_on_close also runs when the client disconnects before the generator ever starts.
+  response.call_on_close(_SUBMIT_JOB_STREAM_SLOTS.release)
+  response.headers["Cache-Control"] = "no-cache"
+  response.headers["X-Accel-Buffering"] = "no"
+  return response
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+# Accepted, Wrong Answer, Compilation Error and the Runtime Error family are pure functions of the
+# program. Time limits, internal errors and queue states depend on sandbox load and are never cached.
+_CACHEABLE_STATUS_IDS = {3, 4, 6, 7, 8, 9, 10, 11, 12}
+
+
+def execution_cache_key(*, source_code: str, language_id: int, cpu_time_limit: float) -> str:
+  digest = hashlib.sha256()
+  digest.update(source_code.encode("utf-8"))
+  digest.update(f"\0{language_id}\0{float(cpu_time_limit):.3f}".encode("ascii"))
+  return digest.hexdigest()
+
+
+def compile_failure_key(*, source_code: str, language_id: int, signature: str) -> str:
+  """Key for "this user source does not compile", independent of which test cases it was wrapped for."""
+  digest = hashlib.sha256()
+  digest.update(source_code.encode("utf-8"))
+  digest.update(f"\0{language_id}\0{signature}".encode("utf-8"))
+  return digest.hexdigest()
+
+
+def is_cacheable_result(result: dict[str, Any]) -> bool:
+  status = result.get("status") if isinstance(result, dict) else None
+  if not isinstance(status, dict):
+    return False
+  try:
+    return int(status.get("id") or 0) in _CACHEABLE_STATUS_IDS
+  except (TypeError, ValueError):
+    return False
+
+
+class CacheBackend:
+  """Shared tier consulted when the in-process LRU misses (e.g. another gunicorn worker ran it)."""
+
+  def get(self, key: str) -> dict[str, Any] | None:
+    raise NotImplementedError
+
+  def set(self, key: str, value: dict[str, Any], *, ttl_seconds: float) -> None:
+    raise NotImplementedError
+
+  def clear(self) -> None:
+    raise NotImplementedError
+
+
+class SqliteCacheBackend(CacheBackend):
+  def __init__(self, path: str, *, purge_every: int = 200):
+    self.path = path
+    self.purge_every = max(1, purge_every)
+    self._local = threading.local()
+    self._writes = 0
+    self._writes_lock = threading.Lock()
+    with self._connection() as conn:
+      conn.execute(
+        "CREATE TABLE IF NOT EXISTS execution_results ("
+        " key TEXT PRIMARY KEY,"
+        " value TEXT NOT NULL,"
+        " expires_at REAL NOT NULL"
+        ")"
+      )
+
+  def _connection(self) -> sqlite3.Connection:
+    conn = getattr(self._local, "conn", None)
+    if conn is None or getattr(self._local, "pid", None) != os.getpid():
+      conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+      conn.execute("PRAGMA journal_mode=WAL")
+      conn.execute("PRAGMA synchronous=NORMAL")
+      self._local.conn = conn
+      self._local.pid = os.getpid()
+    return conn
+
+  def get(self, key: str) -> dict[str, Any] | None:
+    row = self._connection().execute(
+      "SELECT value FROM execution_results WHERE key = ? AND expires_at > ?",
+      (key, time.time()),
+    ).fetchone()
+    if row is None:
+      return None
+    try:
+      value = json.loads(row[0])
+    except ValueError:
+      return None
+    return value if isinstance(value, dict) else None
+
+  def set(self, key: str, value: dict[str, Any], *, ttl_seconds: float) -> None:
+    conn = self._connection()
+    conn.execute(
+      "INSERT OR REPLACE INTO execution_results (key, value, expires_at) VALUES (?, ?, ?)",
+      (key, json.dumps(value, separators=(",", ":")), time.time() + ttl_seconds),
+    )
+    with self._writes_lock:
+      self._writes += 1
+      should_purge = self._writes % self.purge_every == 0
+    if should_purge:
+      conn.execute("DELETE FROM execution_results WHERE expires_at <= ?", (time.time(),))
+
+  def clear(self) -> None:
+    self._connection().execute("DELETE FROM execution_results")
+
+
+class ExecutionResultCache:
+  """Content-addressed cache of Judge0 responses: bounded LRU with TTL, plus an optional shared tier."""
+
+  def __init__(
+    self,
+    *,
+    max_entries: int = 2048,
+    ttl_seconds: float = 900.0,
+    shared_backend: CacheBackend | None = None,
+  ):
+    self.max_entries = max(1, max_entries)
+    self.ttl_seconds = ttl_seconds
+    self.shared_backend = shared_backend
+    self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+    self._lock = threading.Lock()
+    self._stats = {"memory_hits": 0, "shared_hits": 0, "misses": 0, "stores": 0, "evictions": 0, "shared_errors": 0}
+
+  def get(self, key: str) -> dict[str, Any] | None:
+    now = time.monotonic()
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None:
+        expires_at, value = entry
+        if expires_at > now:
+          self._entries.move_to_end(key)
+          self._stats["memory_hits"] += 1
+          return copy.deepcopy(value)
+        del self._entries[key]
+
+    if self.shared_backend is not None:
+      try:
+        value = self.shared_backend.get(key)
+      except sqlite3.Error:
+        value = None
+        self._count("shared_errors")
+      if value is not None:
+        self._store_local(key, value)
+        self._count("shared_hits")
+        return copy.deepcopy(value)
+
+    self._count("misses")
+    return None
+
+  def set(self, key: str, result: dict[str, Any]) -> None:
+    if not is_cacheable_result(result):
+      return
+    value = copy.deepcopy(result)
+    self._store_local(key, value)
+    self._count("stores")
+    if self.shared_backend is not None:
+      try:
+        self.shared_backend.set(key, value, ttl_seconds=self.ttl_seconds)
+      except sqlite3.Error:
+        self._count("shared_errors")
+
+  def stats(self) -> dict[str, Any]:
+    with self._lock:
+      snapshot: dict[str, Any] = dict(self._stats)
+      snapshot["entries"] = len(self._entries)
+    snapshot["max_entries"] = self.max_entries
+    snapshot["ttl_seconds"] = self.ttl_seconds
+    snapshot["shared_backend"] = type(self.shared_backend).__name__ if self.shared_backend else None
+    lookups = snapshot["memory_hits"] + snapshot["shared_hits"] + snapshot["misses"]
+    snapshot["hit_rate"] = round((snapshot["memory_hits"] + snapshot["shared_hits"]) / lookups, 4) if lookups else None
+    return snapshot
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+    if self.shared_backend is not None:
+      self.shared_backend.clear()
+
+  def _store_local(self, key: str, value: dict[str, Any]) -> None:
+    with self._lock:
+      self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.max_entries:
+        self._entries.popitem(last=False)
+        self._stats["evictions"] += 1
+
+  def _count(self, name: str) -> None:
+    with self._lock:
+      self._stats[name] += 1
+
+
+_EXECUTION_CACHE: ExecutionResultCache | None = None
+_EXECUTION_CACHE_LOCK = threading.Lock()
+
+
+def get_execution_cache() -> ExecutionResultCache:
+  global _EXECUTION_CACHE
+
+  if _EXECUTION_CACHE is not None:
+    return _EXECUTION_CACHE
+  with _EXECUTION_CACHE_LOCK:
+    if _EXECUTION_CACHE is None:
+      sqlite_path = (os.getenv("EXECUTION_CACHE_SQLITE_PATH") or "").strip()
+      _EXECUTION_CACHE = ExecutionResultCache(
+        max_entries=int(os.getenv("EXECUTION_CACHE_MAX_ENTRIES") or 2048),
+        ttl_seconds=float(os.getenv("EXECUTION_CACHE_TTL_SECONDS") or 900),
+        shared_backend=SqliteCacheBackend(sqlite_path) if sqlite_path else None,
+      )
+  return _EXECUTION_CACHE
+
+
+_COMPILE_FAILURE_CACHE: ExecutionResultCache | None = None
+
+
+def get_compile_failure_cache() -> ExecutionResultCache:
+  """Short-lived, process-local record of sources that failed to compile, so a re-submit skips Judge0."""
+  global _COMPILE_FAILURE_CACHE
+
+  if _COMPILE_FAILURE_CACHE is not None:
+    return _COMPILE_FAILURE_CACHE
+  with _EXECUTION_CACHE_LOCK:
+    if _COMPILE_FAILURE_CACHE is None:
+      _COMPILE_FAILURE_CACHE = ExecutionResultCache(
+        max_entries=512,
+        ttl_seconds=float(os.getenv("COMPILE_FAILURE_CACHE_TTL_SECONDS") or 60),
+      )
+  return _COMPILE_FAILURE_CACHE
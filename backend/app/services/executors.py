@@ -0,0 +1,563 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import queue
+import select
+import shutil
+import signal
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from . import judge0
+
+logger = logging.getLogger(__name__)
+
+# "judge0" sends everything upstream; "local" runs supported families on this host under
+# local_sandbox.py (Linux namespaces) and everything else on Judge0.
+CODE_EXECUTOR = (os.getenv("CODE_EXECUTOR") or "judge0").strip().lower()
+LOCAL_EXECUTOR_MEMORY_MB = int(os.getenv("LOCAL_EXECUTOR_MEMORY_MB") or 256)
+LOCAL_EXECUTOR_OUTPUT_BYTES = 1024 * 1024
+# RLIMIT_NPROC inside the sandbox; it counts threads, and node alone starts about a dozen. The kernel
+# does not apply it to root, so run the server as an unprivileged user.
+LOCAL_EXECUTOR_MAX_PROCESSES = int(os.getenv("LOCAL_EXECUTOR_MAX_PROCESSES") or 64)
+LOCAL_EXECUTOR_PYTHON = os.getenv("LOCAL_EXECUTOR_PYTHON") or sys.executable
+LOCAL_EXECUTOR_NODE = os.getenv("LOCAL_EXECUTOR_NODE") or shutil.which("node")
+# Warm, pre-forked Python workers for the local executor; 0 starts a fresh interpreter per run.
+LOCAL_PYTHON_WORKERS = int(os.getenv("LOCAL_PYTHON_WORKERS") or 0)
+LOCAL_PYTHON_WORKER_MAX_JOBS = int(os.getenv("LOCAL_PYTHON_WORKER_MAX_JOBS") or 500)
+# How long a warm worker may take to start, or to answer past a job's wall-clock limit, before it
+# is treated as wedged and killed.
+LOCAL_PYTHON_WORKER_GRACE_SECONDS = float(os.getenv("LOCAL_PYTHON_WORKER_GRACE_SECONDS") or 5.0)
+# Executions (Judge0 requests or local runs) in flight from this process across every caller: runs,
+# submits, async jobs and case fan-out. A caller waits this long for a slot before being told to retry.
+MAX_OUTSTANDING_EXECUTIONS = int(os.getenv("MAX_OUTSTANDING_EXECUTIONS") or 8)
+EXECUTION_SLOT_WAIT_SECONDS = float(os.getenv("EXECUTION_SLOT_WAIT_SECONDS") or 10.0)
+
+
+class Executor:
+  """Runs one program and returns a Judge0-shaped result (status, stdout, stderr, time, memory)."""
+
+  name = "base"
+  # Whether run_batch executes programs together rather than one after another.
+  batches = False
+
+  def supports(self, language_family: str | None) -> bool:
+    return True
+
+  def run(
+    self,
+    *,
+    source_code: str,
+    language_id: int,
+    stdin: str,
+    expected_output: str | None = None,
+    cpu_time_limit: float = 2.0,
+    language_family: str | None = None,
+  ) -> dict[str, Any]:
+    raise NotImplementedError
+
+  def run_batch(
+    self,
+    *,
+    source_codes: list[str],
+    language_id: int,
+    stdin: str = "",
+    cpu_time_limit: float = 2.0,
+    language_family: str | None = None,
+  ) -> list[dict[str, Any]]:
+    return [
+      self.run(
+        source_code=source_code,
+        language_id=language_id,
+        stdin=stdin,
+        cpu_time_limit=cpu_time_limit,
+        language_family=language_family,
+      )
+      for source_code in source_codes
+    ]
+
+
+class Judge0Executor(Executor):
+  name = "judge0"
+
+  @property
+  def batches(self) -> bool:
+    return judge0.JUDGE0_BATCH_ENABLED
+
+  def run(self, **kwargs) -> dict[str, Any]:
+    return judge0.run_submission(**kwargs)
+
+  def run_batch(self, **kwargs) -> list[dict[str, Any]]:
+    return judge0.run_submission_batch(**kwargs)
+
+
+def _status(status_id: int, description: str) -> dict[str, Any]:
+  return {"id": status_id, "description": description}
+
+
+_SIGNAL_STATUSES = {
+  signal.SIGSEGV: _status(7, "Runtime Error (SIGSEGV)"),
+  signal.SIGXFSZ: _status(8, "Runtime Error (SIGXFSZ)"),
+  signal.SIGFPE: _status(9, "Runtime Error (SIGFPE)"),
+  signal.SIGABRT: _status(10, "Runtime Error (SIGABRT)"),
+}
+
+_SANDBOX_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "local_sandbox.py")
+_WARM_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "python_warm_worker.py")
+_WARM_HEADER = struct.Struct(">I")
+
+
+class _WarmPythonWorker:
+  """One ``python_warm_worker.py`` process; jobs are sent over its stdin and answered on its stdout."""
+
+  def __init__(self, python: str):
+    self.process = subprocess.Popen(
+      [python, "-I", "-S", _WARM_WORKER_SCRIPT],
+      stdin=subprocess.PIPE,
+      stdout=subprocess.PIPE,
+      env={"PATH": "/usr/bin:/bin", "LANG": "C.UTF-8"},
+      start_new_session=True,
+    )
+    self.jobs = 0
+    try:
+      ready = self._receive(time.monotonic() + LOCAL_PYTHON_WORKER_GRACE_SECONDS)
+    except (OSError, ValueError, EOFError):
+      self.close()
+      raise
+    if not ready.get("ready"):
+      self.close()
+      raise ValueError(ready.get("error") or "Warm Python worker did not start.")
+
+  def request(self, job: dict[str, Any]) -> dict[str, Any]:
+    body = json.dumps(job).encode("utf-8")
+    self.process.stdin.write(_WARM_HEADER.pack(len(body)) + body)
+    self.process.stdin.flush()
+    self.jobs += 1
+    return self._receive(time.monotonic() + job["wall_time_limit"] + LOCAL_PYTHON_WORKER_GRACE_SECONDS)
+
+  def _receive(self, deadline: float) -> dict[str, Any]:
+    (size,) = _WARM_HEADER.unpack(self._read_exact(_WARM_HEADER.size, deadline))
+    return json.loads(self._read_exact(size, deadline))
+
+  def _read_exact(self, size: int, deadline: float) -> bytes:
+    fd = self.process.stdout.fileno()
+    chunks = []
+    while size:
+      remaining = deadline - time.monotonic()
+      if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+        raise TimeoutError("Warm Python worker did not answer in time.")
+      chunk = os.read(fd, size)
+      if not chunk:
+        raise EOFError("Warm Python worker exited.")
+      chunks.append(chunk)
+      size -= len(chunk)
+    return b"".join(chunks)
+
+  def close(self) -> None:
+    try:
+      os.killpg(self.process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+      pass
+    self.process.wait()
+    for stream in (self.process.stdin, self.process.stdout):
+      try:
+        stream.close()
+      except OSError:
+        pass
+
+
+class WarmPythonPool:
+  """Bounded set of warm Python workers, recycled after a crashed job or ``max_jobs`` runs."""
+
+  def __init__(self, *, python: str, size: int, max_jobs: int):
+    self.python = python
+    self.size = max(1, size)
+    self.max_jobs = max(1, max_jobs)
+    self._idle: queue.LifoQueue[_WarmPythonWorker] = queue.LifoQueue()
+    self._slots = threading.BoundedSemaphore(self.size)
+    self._lock = threading.Lock()
+    self._stats = {"started": 0, "recycled": 0, "jobs": 0, "worker_failures": 0}
+
+  def run(self, job: dict[str, Any]) -> dict[str, Any]:
+    with self._slots:
+      try:
+        worker = self._idle.get_nowait()
+      except queue.Empty:
+        worker = self._start_worker()
+      try:
+        outcome = worker.request(job)
+      except (OSError, ValueError, EOFError) as err:
+        worker.close()
+        with self._lock:
+          self._stats["worker_failures"] += 1
+        raise judge0.Judge0Error("Local Python worker failed.") from err
+      if "error" in outcome:
+        worker.close()
+        with self._lock:
+          self._stats["worker_failures"] += 1
+        raise judge0.Judge0Error(f"Local Python worker failed: {outcome['error']}")
+
+      crashed = outcome["exit_code"] < 0 and not outcome["timed_out"]
+      with self._lock:
+        self._stats["jobs"] += 1
+        if crashed or worker.jobs >= self.max_jobs:
+          self._stats["recycled"] += 1
+      if crashed or worker.jobs >= self.max_jobs:
+        worker.close()
+      else:
+        self._idle.put(worker)
+      return outcome
+
+  def close(self) -> None:
+    while True:
+      try:
+        self._idle.get_nowait().close()
+      except queue.Empty:
+        return
+
+  def stats(self) -> dict[str, Any]:
+    with self._lock:
+      stats = dict(self._stats)
+    stats["idle"] = self._idle.qsize()
+    stats["size"] = self.size
+    return stats
+
+  def _start_worker(self) -> _WarmPythonWorker:
+    try:
+      worker = _WarmPythonWorker(self.python)
+    except (OSError, ValueError, EOFError) as err:
+      with self._lock:
+        self._stats["worker_failures"] += 1
+      raise judge0.Judge0Error(f"Local Python worker failed to start: {err}") from err
+    with self._lock:
+      self._stats["started"] += 1
+    return worker
+
+
+class LocalSubprocessExecutor(Executor):
+  """Runs Python and JavaScript harnesses on this host under ``local_sandbox.py``.
+
+  Each run gets fresh user, PID, mount, network, IPC and UTS namespaces, a root with only system
+  and runtime directories (read-only) plus its own workdir, no capabilities, and CPU, memory,
+  file-size and process limits. If the namespaces cannot be set up the run fails instead of
+  running unconfined. With ``python_workers`` set, Python runs fork from a pool of warm
+  interpreters instead of starting a new one.
+  """
+
+  name = "local"
+
+  def __init__(
+    self,
+    *,
+    python: str | None = LOCAL_EXECUTOR_PYTHON,
+    node: str | None = LOCAL_EXECUTOR_NODE,
+    memory_mb: int = LOCAL_EXECUTOR_MEMORY_MB,
+    output_bytes: int = LOCAL_EXECUTOR_OUTPUT_BYTES,
+    max_processes: int = LOCAL_EXECUTOR_MAX_PROCESSES,
+    python_workers: int = LOCAL_PYTHON_WORKERS,
+    python_worker_max_jobs: int = LOCAL_PYTHON_WORKER_MAX_JOBS,
+  ):
+    self.commands: dict[str, tuple[list[str], str]] = {}
+    if python:
+      self.commands["python"] = ([python, "-I", "-S"], "main.py")
+    if node:
+      self.commands["javascript"] = ([node, f"--max-old-space-size={memory_mb}"], "main.js")
+    self.memory_mb = memory_mb
+    self.output_bytes = output_bytes
+    self.max_processes = max_processes
+    self.python_pool = (
+      WarmPythonPool(python=python, size=python_workers, max_jobs=python_worker_max_jobs)
+      if python and python_workers > 0
+      else None
+    )
+
+  def supports(self, language_family: str | None) -> bool:
+    return language_family in self.commands
+
+  def _sandbox_command(self, family: str, cpu_time_limit: float, root: str, workdir: str, status_fd: int) -> list[str]:
+    command, file_name = self.commands[family]
+    cpu_seconds = max(1, math.ceil(cpu_time_limit))
+    # V8 reserves far more address space than it uses; node is capped by --max-old-space-size instead.
+    memory_bytes = 0 if family == "javascript" else self.memory_mb * 1024 * 1024
+    return [
+      sys.executable,
+      "-I",
+      "-S",
+      _SANDBOX_SCRIPT,
+      "--status-fd",
+      str(status_fd),
+      "--root",
+      root,
+      "--workdir",
+      workdir,
+      # An interpreter installed outside /usr (pyenv, nvm) needs its prefix visible in the sandbox.
+      "--ro",
+      os.path.dirname(os.path.dirname(os.path.realpath(command[0]))),
+      "--cpu-seconds",
+      str(cpu_seconds),
+      "--memory-bytes",
+      str(memory_bytes),
+      "--output-bytes",
+      str(self.output_bytes),
+      "--max-processes",
+      str(self.max_processes),
+      "--",
+      *command,
+      file_name,
+    ]
+
+  def run(
+    self,
+    *,
+    source_code: str,
+    language_id: int,
+    stdin: str,
+    expected_output: str | None = None,
+    cpu_time_limit: float = 2.0,
+    language_family: str | None = None,
+  ) -> dict[str, Any]:
+    if language_family not in self.commands:
+      raise judge0.Judge0Error(f"Local executor does not support {language_family}.")
+    wall_time_limit = max(cpu_time_limit * 2, 3.0)
+    if language_family == "python" and self.python_pool is not None:
+      outcome = self.python_pool.run(
+        {
+          "source": source_code,
+          "stdin": stdin,
+          "cpu_time_limit": cpu_time_limit,
+          "wall_time_limit": wall_time_limit,
+          "memory_bytes": self.memory_mb * 1024 * 1024,
+          "output_bytes": self.output_bytes,
+          "max_processes": self.max_processes,
+        }
+      )
+      return _judge0_result(
+        language_family=language_family,
+        exit_code=outcome["exit_code"],
+        timed_out=outcome["timed_out"],
+        cpu_seconds=outcome["cpu_seconds"],
+        wall_seconds=outcome["wall_seconds"],
+        max_rss_kb=outcome["max_rss_kb"],
+        stdout_text=outcome["stdout"],
+        stderr_text=outcome["stderr"],
+        cpu_time_limit=cpu_time_limit,
+        expected_output=expected_output,
+      )
+
+    _, file_name = self.commands[language_family]
+
+    with tempfile.TemporaryDirectory(prefix="ir-exec-") as tmpdir:
+      # Only workdir is visible to the program; its captured output stays outside.
+      workdir = os.path.join(tmpdir, "work")
+      root = os.path.join(tmpdir, "root")
+      os.mkdir(workdir)
+      os.mkdir(root)
+      with open(os.path.join(workdir, file_name), "w", encoding="utf-8") as handle:
+        handle.write(source_code)
+      stdout_path = os.path.join(tmpdir, "stdout")
+      stderr_path = os.path.join(tmpdir, "stderr")
+
+      status_read, status_write = os.pipe()
+      with open(stdout_path, "wb") as stdout, open(stderr_path, "wb") as stderr, os.fdopen(status_read, "rb") as status:
+        started = time.monotonic()
+        try:
+          process = subprocess.Popen(
+            self._sandbox_command(language_family, cpu_time_limit, root, workdir, status_write),
+            cwd=workdir,
+            stdin=subprocess.PIPE,
+            stdout=stdout,
+            stderr=stderr,
+            env={"PATH": "/usr/bin:/bin", "HOME": workdir, "LANG": "C.UTF-8"},
+            start_new_session=True,
+            pass_fds=(status_write,),
+          )
+        except (OSError, subprocess.SubprocessError) as err:
+          raise judge0.Judge0Error(f"Local executor failed to start: {err}") from err
+        finally:
+          os.close(status_write)
+        timed_out = threading.Event()
+
+        def _kill() -> None:
+          timed_out.set()
+          # The sandbox's init shares this process group; killing it tears down the PID namespace.
+          try:
+            os.killpg(process.pid, signal.SIGKILL)
+          except ProcessLookupError:
+            pass
+
+        timer = threading.Timer(wall_time_limit, _kill)
+        timer.start()
+        try:
+          try:
+            process.stdin.write(stdin.encode("utf-8"))
+            process.stdin.close()
+          except BrokenPipeError:
+            pass
+          _, wait_status, usage = os.wait4(process.pid, 0)
+        finally:
+          timer.cancel()
+        process.returncode = os.waitstatus_to_exitcode(wait_status)
+        wall_seconds = time.monotonic() - started
+        report = status.read()
+
+      stdout_text = _read_capped(stdout_path, self.output_bytes)
+      stderr_text = _read_capped(stderr_path, self.output_bytes)
+
+    if report:
+      outcome = json.loads(report)
+    elif timed_out.is_set():
+      outcome = {"exit_code": -signal.SIGKILL, "cpu_seconds": usage.ru_utime + usage.ru_stime, "max_rss_kb": usage.ru_maxrss}
+    else:
+      # The program never started: the sandbox could not be set up, so nothing ran.
+      logger.error("local_sandbox_failed exit_code=%s stderr=%s", process.returncode, stderr_text.strip())
+      raise judge0.Judge0Error(f"Local sandbox failed: {stderr_text.strip() or process.returncode}")
+
+    return _judge0_result(
+      language_family=language_family,
+      exit_code=outcome["exit_code"],
+      timed_out=timed_out.is_set(),
+      cpu_seconds=outcome["cpu_seconds"],
+      wall_seconds=wall_seconds,
+      max_rss_kb=outcome["max_rss_kb"],
+      stdout_text=stdout_text,
+      stderr_text=stderr_text,
+      cpu_time_limit=cpu_time_limit,
+      expected_output=expected_output,
+    )
+
+
+def _judge0_result(
+  *,
+  language_family: str,
+  exit_code: int,
+  timed_out: bool,
+  cpu_seconds: float,
+  wall_seconds: float,
+  max_rss_kb: int,
+  stdout_text: str,
+  stderr_text: str,
+  cpu_time_limit: float,
+  expected_output: str | None,
+) -> dict[str, Any]:
+  if timed_out or cpu_seconds >= cpu_time_limit or exit_code == -signal.SIGXCPU:
+    status = _status(5, "Time Limit Exceeded")
+  elif exit_code < 0:
+    status = _SIGNAL_STATUSES.get(-exit_code) or _status(12, "Runtime Error (Other)")
+  elif exit_code != 0:
+    status = _status(11, "Runtime Error (NZEC)")
+  elif expected_output is not None and stdout_text.strip() != expected_output.strip():
+    status = _status(4, "Wrong Answer")
+  else:
+    status = _status(3, "Accepted")
+
+  logger.debug(
+    "local_execution family=%s status=%s cpu_ms=%s wall_ms=%s",
+    language_family,
+    status["id"],
+    int(cpu_seconds * 1000),
+    int(wall_seconds * 1000),
+  )
+  return {
+    "token": None,
+    "status": status,
+    "stdout": stdout_text or None,
+    "stderr": stderr_text or None,
+    "compile_output": None,
+    "message": None,
+    "time": f"{cpu_seconds:.3f}",
+    # ru_maxrss is reported in KB on Linux, matching Judge0's memory field.
+    "memory": int(max_rss_kb),
+  }
+
+
+def _read_capped(path: str, limit: int) -> str:
+  with open(path, "rb") as handle:
+    return handle.read(limit).decode("utf-8", errors="replace")
+
+
+_JUDGE0_EXECUTOR = Judge0Executor()
+_LOCAL_EXECUTOR: LocalSubprocessExecutor | None = None
+_LOCAL_EXECUTOR_LOCK = threading.Lock()
+_EXECUTION_SLOTS = threading.BoundedSemaphore(MAX_OUTSTANDING_EXECUTIONS)
+
+
+@contextmanager
+def _execution_slot() -> Iterator[None]:
+  if not _EXECUTION_SLOTS.acquire(timeout=EXECUTION_SLOT_WAIT_SECONDS):
+    raise judge0.Judge0ProcessingTimeout("The grader is busy. Please retry in a moment.")
+  try:
+    yield
+  finally:
+    _EXECUTION_SLOTS.release()
+
+
+def get_executor(language_family: str | None) -> Executor:
+  global _LOCAL_EXECUTOR
+
+  if CODE_EXECUTOR == "local":
+    with _LOCAL_EXECUTOR_LOCK:
+      if _LOCAL_EXECUTOR is None:
+        _LOCAL_EXECUTOR = LocalSubprocessExecutor()
+    if _LOCAL_EXECUTOR.supports(language_family):
+      return _LOCAL_EXECUTOR
+  return _JUDGE0_EXECUTOR
+
+
+def supports_batch(language_family: str | None) -> bool:
+  return get_executor(language_family).batches
+
+
+def get_executor_stats() -> dict[str, Any]:
+  stats: dict[str, Any] = {"mode": CODE_EXECUTOR, "max_outstanding_executions": MAX_OUTSTANDING_EXECUTIONS}
+  local_executor = _LOCAL_EXECUTOR
+  if local_executor is not None and local_executor.python_pool is not None:
+    stats["python_pool"] = local_executor.python_pool.stats()
+  return stats
+
+
+def run_submission(
+  *,
+  source_code: str,
+  language_id: int,
+  stdin: str,
+  expected_output: str | None = None,
+  cpu_time_limit: float = 2.0,
+  language_family: str | None = None,
+) -> dict[str, Any]:
+  with _execution_slot():
+    return get_executor(language_family).run(
+      source_code=source_code,
+      language_id=language_id,
+      stdin=stdin,
+      expected_output=expected_output,
+      cpu_time_limit=cpu_time_limit,
+      language_family=language_family,
+    )
+
+
+def run_submission_batch(
+  *,
+  source_codes: list[str],
+  language_id: int,
+  stdin: str = "",
+  cpu_time_limit: float = 2.0,
+  language_family: str | None = None,
+) -> list[dict[str, Any]]:
+  # One slot per batch: Judge0 takes the batch in one request and judges it on its own workers.
+  with _execution_slot():
+    return get_executor(language_family).run_batch(
+      source_codes=source_codes,
+      language_id=language_id,
+      stdin=stdin,
+      cpu_time_limit=cpu_time_limit,
+      language_family=language_family,
+    )
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import os
+import select
+import ssl
+import threading
+import time
+from dataclasses import dataclass
+from http.client import HTTPConnection, HTTPException, HTTPSConnection, RemoteDisconnected
+from typing import Any
+from urllib.parse import urlsplit
+
+
+class HttpTransportError(RuntimeError):
+  pass
+
+
+@dataclass
+class HttpResponse:
+  status: int
+  headers: dict[str, str]
+  body: bytes
+
+
+# Errors that mean a pooled keep-alive socket was closed by the server while idle.
+_STALE_CONNECTION_ERRORS = (RemoteDisconnected, ConnectionResetError, BrokenPipeError, ConnectionAbortedError)
+# Methods that are safe to resend after the server may already have received them.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def _peer_closed(conn: HTTPConnection) -> bool:
+  # An idle keep-alive socket has nothing to read unless the server closed it (EOF) or misbehaved.
+  if conn.sock is None:
+    return True
+  try:
+    readable, _, _ = select.select([conn.sock], [], [], 0)
+  except (OSError, ValueError):
+    return True
+  return bool(readable)
+
+
+class _HostPool:
+  def __init__(self) -> None:
+    self.idle: list[tuple[HTTPConnection, float]] = []
+    self.open_count = 0
+    self.condition = threading.Condition()
+
+
+class PooledHttpTransport:
+  """Thread-safe HTTP/1.1 client that keeps a bounded pool of keep-alive connections per host."""
+
+  def __init__(
+    self,
+    *,
+    max_connections_per_host: int = 8,
+    connect_timeout: float = 5.0,
+    read_timeout: float = 20.0,
+    acquire_timeout: float = 10.0,
+    idle_timeout: float = 30.0,
+  ):
+    self.max_connections_per_host = max(1, max_connections_per_host)
+    self.connect_timeout = connect_timeout
+    self.read_timeout = read_timeout
+    self.acquire_timeout = acquire_timeout
+    self.idle_timeout = idle_timeout
+    self._pools: dict[tuple[str, str, int], _HostPool] = {}
+    self._pools_lock = threading.Lock()
+    self._stats = {"new_connections": 0, "reuses": 0, "waits": 0, "discarded": 0, "requests": 0, "retries": 0}
+    self._stats_lock = threading.Lock()
+    self._pid = os.getpid()
+    self._ssl_context = ssl.create_default_context()
+
+  def request(
+    self,
+    method: str,
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    body: bytes | None = None,
+    read_timeout: float | None = None,
+  ) -> HttpResponse:
+    parts = urlsplit(url)
+    scheme = (parts.scheme or "http").lower()
+    if scheme not in {"http", "https"} or not parts.hostname:
+      raise HttpTransportError(f"Unsupported URL: {url}")
+    port = parts.port or (443 if scheme == "https" else 80)
+    key = (scheme, parts.hostname, port)
+    target = parts.path or "/"
+    if parts.query:
+      target = f"{target}?{parts.query}"
+    timeout = self.read_timeout if read_timeout is None else read_timeout
+
+    self._count("requests")
+    idempotent = method.upper() in _IDEMPOTENT_METHODS
+    # A reused socket may have been closed by the server while idle; retry once on a fresh one.
+    for attempt in range(2):
+      conn, reused = self._acquire(key)
+      sent = False
+      try:
+        if conn.sock is not None:
+          conn.sock.settimeout(timeout)
+        conn.request(method, target, body=body, headers=headers or {})
+        sent = True
+        response = conn.getresponse()
+        payload = response.read()
+      except _STALE_CONNECTION_ERRORS as err:
+        self._release(key, conn, reusable=False)
+        # Once the request is fully written the server may already have acted on it (e.g. created a
+        # Judge0 submission), so only idempotent requests are resent after that point.
+        if reused and attempt == 0 and (idempotent or not sent):
+          self._count("retries")
+          continue
+        raise HttpTransportError(f"connection dropped: {err}") from err
+      except TimeoutError as err:
+        self._release(key, conn, reusable=False)
+        raise HttpTransportError("request timed out") from err
+      except (OSError, HTTPException) as err:
+        self._release(key, conn, reusable=False)
+        raise HttpTransportError(str(err) or err.__class__.__name__) from err
+
+      self._release(key, conn, reusable=not response.will_close)
+      return HttpResponse(
+        status=response.status,
+        headers={name.lower(): value for name, value in response.getheaders()},
+        body=payload,
+      )
+
+    raise HttpTransportError("connection dropped")
+
+  def stats(self) -> dict[str, Any]:
+    with self._stats_lock:
+      snapshot: dict[str, Any] = dict(self._stats)
+    with self._pools_lock:
+      pools = list(self._pools.items())
+    hosts = {}
+    for (scheme, host, port), pool in pools:
+      with pool.condition:
+        hosts[f"{scheme}://{host}:{port}"] = {"open": pool.open_count, "idle": len(pool.idle)}
+    snapshot["hosts"] = hosts
+    return snapshot
+
+  def close(self) -> None:
+    with self._pools_lock:
+      pools = list(self._pools.values())
+      self._pools = {}
+    for pool in pools:
+      with pool.condition:
+        for conn, _ in pool.idle:
+          conn.close()
+        pool.open_count -= len(pool.idle)
+        pool.idle = []
+
+  def _count(self, name: str) -> None:
+    with self._stats_lock:
+      self._stats[name] += 1
+
+  def _host_pool(self, key: tuple[str, str, int]) -> _HostPool:
+    with self._pools_lock:
+      if self._pid != os.getpid():
+        # Sockets inherited across a worker fork must not be shared with the parent.
+        self._pools = {}
+        self._pid = os.getpid()
+      pool = self._pools.get(key)
+      if pool is None:
+        pool = _HostPool()
+        self._pools[key] = pool
+      return pool
+
+  def _acquire(self, key: tuple[str, str, int]) -> tuple[HTTPConnection, bool]:
+    pool = self._host_pool(key)
+    deadline = time.monotonic() + self.acquire_timeout
+    waited = False
+    with pool.condition:
+      while True:
+        now = time.monotonic()
+        while pool.idle:
+          conn, last_used = pool.idle.pop()
+          if now - last_used <= self.idle_timeout and not _peer_closed(conn):
+            self._count("reuses")
+            return conn, True
+          conn.close()
+          pool.open_count -= 1
+          self._count("discarded")
+        if pool.open_count < self.max_connections_per_host:
+          pool.open_count += 1
+          break
+        if not waited:
+          waited = True
+          self._count("waits")
+        remaining = deadline - now
+        if remaining <= 0:
+          raise HttpTransportError("connection pool exhausted")
+        pool.condition.wait(remaining)
+
+    try:
+      conn = self._connect(key)
+    except Exception:
+      with pool.condition:
+        pool.open_count -= 1
+        pool.condition.notify()
+      raise
+    self._count("new_connections")
+    return conn, False
+
+  def _connect(self, key: tuple[str, str, int]) -> HTTPConnection:
+    scheme, host, port = key
+    if scheme == "https":
+      conn: HTTPConnection = HTTPSConnection(host, port, timeout=self.connect_timeout, context=self._ssl_context)
+    else:
+      conn = HTTPConnection(host, port, timeout=self.connect_timeout)
+    try:
+      conn.connect()
+    except TimeoutError as err:
+      conn.close()
+      raise HttpTransportError("connect timed out") from err
+    except OSError as err:
+      conn.close()
+      raise HttpTransportError(str(err) or err.__class__.__name__) from err
+    return conn
+
+  def _release(self, key: tuple[str, str, int], conn: HTTPConnection, *, reusable: bool) -> None:
+    pool = self._host_pool(key)
+    with pool.condition:
+      if reusable:
+        pool.idle.append((conn, time.monotonic()))
+      else:
+        conn.close()
+        pool.open_count = max(0, pool.open_count - 1)
+        self._count("discarded")
+      pool.condition.notify()
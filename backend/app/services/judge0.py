@@ -3,10 +3,13 @@ from __future__ import annotations
 import json
 import os
 import re
+import tempfile
 import time
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+
+from .http_transport import HttpTransportError, PooledHttpTransport
+from .judge0_languages import LanguageCatalog
+from .judge0_polling import AdaptivePoller
 
 
 class Judge0Error(RuntimeError):
@@ -17,8 +20,29 @@ class Judge0ProcessingTimeout(Judge0Error):
   pass
 
 
-_LANGUAGE_CACHE: list[dict[str, Any]] | None = None
-_LANGUAGE_CACHE_EXPIRES_AT = 0.0
+_PENDING_STATUS_IDS = {1, 2}  # In Queue / Processing
+# Judge0's default MAX_SUBMISSION_BATCH_SIZE.
+MAX_BATCH_SIZE = 20
+# Deployments without /submissions/batch set this to false; callers then fan cases out instead.
+JUDGE0_BATCH_ENABLED = (os.getenv("JUDGE0_BATCH_ENABLED") or "true").strip().lower() not in {"0", "false", "no", "off"}
+_SUBMISSION_FIELDS = "token,stdout,stderr,compile_output,message,status,time,memory"
+
+
+def _env_number(name: str, default: float) -> float:
+  try:
+    return float(os.getenv(name) or default)
+  except ValueError:
+    return default
+
+
+# Shared keep-alive pool so submissions and polls skip a TCP/TLS handshake per request.
+_TRANSPORT = PooledHttpTransport(
+  max_connections_per_host=int(_env_number("JUDGE0_POOL_SIZE", 8)),
+  connect_timeout=_env_number("JUDGE0_CONNECT_TIMEOUT_SECONDS", 5.0),
+  read_timeout=_env_number("JUDGE0_READ_TIMEOUT_SECONDS", 20.0),
+)
+
+_POLLER = AdaptivePoller()
 
 _COMPACT_LANGUAGE_ORDER = [
   "python",
@@ -143,52 +167,90 @@ def _headers() -> dict[str, str]:
 
 def _request_json(method: str, path: str, payload: dict[str, Any] | None = None, *, timeout: float = 20.0) -> Any:
   url = f"{_base_url()}{path}"
+  headers = _headers()
   data = None
   if payload is not None:
     data = json.dumps(payload).encode("utf-8")
+    headers.setdefault("Content-Type", "application/json")
 
-  req = Request(url=url, method=method, headers=_headers(), data=data)
   try:
-    with urlopen(req, timeout=timeout) as res:
-      raw = res.read().decode("utf-8")
-      return json.loads(raw) if raw else {}
-  except HTTPError as err:
-    body = ""
-    try:
-      body = err.read().decode("utf-8")
-    except Exception:
-      body = ""
-    message = f"Judge0 HTTP {err.code}"
-    if body:
-      message = f"{message}: {body[:240]}"
-    raise Judge0Error(message) from err
-  except URLError as err:
+    response = _TRANSPORT.request(method, url, headers=headers, body=data, read_timeout=timeout)
+  except HttpTransportError as err:
     raise Judge0Error(f"Judge0 connection error: {err}") from err
 
+  raw = response.body.decode("utf-8", errors="replace")
+  if response.status >= 400:
+    message = f"Judge0 HTTP {response.status}"
+    if raw:
+      message = f"{message}: {raw[:240]}"
+    raise Judge0Error(message)
+  try:
+    return json.loads(raw) if raw else {}
+  except ValueError as err:
+    raise Judge0Error("Judge0 returned a non-JSON response.") from err
 
-def _poll_submission(token: str, *, max_attempts: int = 25, interval_seconds: float = 0.35) -> dict[str, Any]:
-  last_response: dict[str, Any] = {}
-  for _ in range(max_attempts):
-    response = _request_json("GET", f"/submissions/{token}?base64_encoded=false")
-    status_id = int(response.get("status", {}).get("id") or 0)
-    last_response = response
-    if status_id not in {1, 2}:  # In Queue / Processing
-      return response
-    time.sleep(interval_seconds)
-  status = last_response.get("status") if isinstance(last_response, dict) else {}
-  status_id = int((status or {}).get("id") or 0)
-  if status_id in {1, 2}:
-    raise Judge0ProcessingTimeout("Execution is still processing on Judge0. Please retry in a moment.")
-  return last_response
+
+def get_transport_stats() -> dict[str, Any]:
+  return _TRANSPORT.stats()
+
+
+def get_poll_stats() -> dict[str, Any]:
+  return _POLLER.stats()
 
 
-def get_languages(*, cache_seconds: int = 3600) -> list[dict[str, Any]]:
-  global _LANGUAGE_CACHE, _LANGUAGE_CACHE_EXPIRES_AT
+def _poll_submission(token: str, *, language_family: str | None = None, started_at: float | None = None) -> dict[str, Any]:
+  return _poll_submission_batch([token], language_family=language_family, started_at=started_at)[token]
 
-  now = time.time()
-  if _LANGUAGE_CACHE is not None and now < _LANGUAGE_CACHE_EXPIRES_AT:
-    return _LANGUAGE_CACHE
 
+def _poll_submission_batch(
+  tokens: list[str],
+  *,
+  language_family: str | None = None,
+  started_at: float | None = None,
+) -> dict[str, dict[str, Any]]:
+  started = time.monotonic() if started_at is None else started_at
+  deadline = started + _POLLER.budget(language_family)
+  delay = _POLLER.initial_delay(language_family)
+  finished: dict[str, dict[str, Any]] = {}
+  pending = list(tokens)
+  polls = 0
+
+  while True:
+    _POLLER.sleep(_POLLER.jittered(min(delay, max(0.0, deadline - time.monotonic()))))
+    for offset in range(0, len(pending), MAX_BATCH_SIZE):
+      chunk = pending[offset:offset + MAX_BATCH_SIZE]
+      polls += 1
+      response = _request_json(
+        "GET",
+        f"/submissions/batch?tokens={','.join(chunk)}&base64_encoded=false&fields={_SUBMISSION_FIELDS}",
+      )
+      submissions = response.get("submissions") if isinstance(response, dict) else None
+      if not isinstance(submissions, list):
+        raise Judge0Error("Unexpected Judge0 batch status response.")
+
+      for token, submission in zip(chunk, submissions):
+        if isinstance(submission, dict) and not _is_pending(submission):
+          finished[token] = submission
+    pending = [token for token in pending if token not in finished]
+    if not pending:
+      _POLLER.record_polls(language_family, polls)
+      _POLLER.record_latency(language_family, time.monotonic() - started)
+      return finished
+    if time.monotonic() >= deadline:
+      _POLLER.record_polls(language_family, polls)
+      _POLLER.record_timeout(language_family)
+      raise Judge0ProcessingTimeout("Execution is still processing on Judge0. Please retry in a moment.")
+    delay = _POLLER.next_delay(delay)
+
+
+def _is_pending(response: Any) -> bool:
+  if not isinstance(response, dict):
+    return False
+  status = response.get("status") or {}
+  return int(status.get("id") or 0) in _PENDING_STATUS_IDS
+
+
+def _fetch_languages() -> list[dict[str, Any]]:
   payload = _request_json("GET", "/languages")
   if not isinstance(payload, list):
     raise Judge0Error("Unexpected Judge0 /languages response.")
@@ -203,13 +265,32 @@ def get_languages(*, cache_seconds: int = 3600) -> list[dict[str, Any]]:
       normalized.append({"id": language_id, "name": name})
 
   normalized.sort(key=lambda lang: lang["name"].lower())
-  _LANGUAGE_CACHE = normalized
-  _LANGUAGE_CACHE_EXPIRES_AT = now + cache_seconds
   return normalized
 
 
-def get_compact_languages(*, cache_seconds: int = 3600) -> list[dict[str, Any]]:
-  raw_languages = get_languages(cache_seconds=cache_seconds)
+_LANGUAGE_CATALOG = LanguageCatalog(
+  _fetch_languages,
+  _language_family,
+  source=_base_url(),
+  snapshot_path=os.getenv("JUDGE0_LANGUAGE_SNAPSHOT_PATH") or os.path.join(tempfile.gettempdir(), "judge0-languages.json"),
+  ttl_seconds=_env_number("JUDGE0_LANGUAGE_TTL_SECONDS", 3600.0),
+)
+
+
+def warm_language_catalog() -> None:
+  _LANGUAGE_CATALOG.warm()
+
+
+def get_language_catalog_stats() -> dict[str, Any]:
+  return _LANGUAGE_CATALOG.stats()
+
+
+def get_languages() -> list[dict[str, Any]]:
+  return _LANGUAGE_CATALOG.languages()
+
+
+def get_compact_languages() -> list[dict[str, Any]]:
+  raw_languages = get_languages()
 
   by_family: dict[str, list[dict[str, Any]]] = {}
   for language in raw_languages:
@@ -238,20 +319,17 @@ def get_compact_languages(*, cache_seconds: int = 3600) -> list[dict[str, Any]]:
   return compact
 
 
-def get_language_family(language_id: int, *, cache_seconds: int = 3600) -> str | None:
-  for language in get_languages(cache_seconds=cache_seconds):
-    if language["id"] == language_id:
-      return _language_family(language["name"])
-  return None
+def get_language_family(language_id: int) -> str | None:
+  return _LANGUAGE_CATALOG.family(language_id)
 
 
-def run_submission(
+def _submission_payload(
   *,
   source_code: str,
   language_id: int,
   stdin: str,
-  expected_output: str | None = None,
-  cpu_time_limit: float = 2.0,
+  expected_output: str | None,
+  cpu_time_limit: float,
 ) -> dict[str, Any]:
   payload = {
     "source_code": source_code,
@@ -262,16 +340,76 @@ def run_submission(
   }
   if expected_output is not None:
     payload["expected_output"] = expected_output
+  return payload
+
+
+def run_submission(
+  *,
+  source_code: str,
+  language_id: int,
+  stdin: str,
+  expected_output: str | None = None,
+  cpu_time_limit: float = 2.0,
+  language_family: str | None = None,
+) -> dict[str, Any]:
+  started = time.monotonic()
+  payload = _submission_payload(
+    source_code=source_code,
+    language_id=language_id,
+    stdin=stdin,
+    expected_output=expected_output,
+    cpu_time_limit=cpu_time_limit,
+  )
   response = _request_json("POST", "/submissions?base64_encoded=false&wait=true", payload=payload)
 
   # Some deployments ignore wait=true and return only token.
   if isinstance(response, dict) and "token" in response and "status" not in response:
-    return _poll_submission(str(response["token"]))
+    return _poll_submission(str(response["token"]), language_family=language_family, started_at=started)
 
-  if isinstance(response, dict):
-    status = response.get("status") or {}
-    status_id = int(status.get("id") or 0)
-    if status_id in {1, 2}:
-      raise Judge0ProcessingTimeout("Execution is still processing on Judge0. Please retry in a moment.")
+  if _is_pending(response):
+    raise Judge0ProcessingTimeout("Execution is still processing on Judge0. Please retry in a moment.")
+
+  _POLLER.record_latency(language_family, time.monotonic() - started)
 
   return response if isinstance(response, dict) else {}
+
+
+def run_submission_batch(
+  *,
+  source_codes: list[str],
+  language_id: int,
+  stdin: str = "",
+  cpu_time_limit: float = 2.0,
+  language_family: str | None = None,
+) -> list[dict[str, Any]]:
+  """Execute several programs through /submissions/batch; results keep input order."""
+  if not source_codes:
+    return []
+
+  started = time.monotonic()
+  tokens: list[str] = []
+  for offset in range(0, len(source_codes), MAX_BATCH_SIZE):
+    chunk = source_codes[offset:offset + MAX_BATCH_SIZE]
+    payload = {
+      "submissions": [
+        _submission_payload(
+          source_code=source_code,
+          language_id=language_id,
+          stdin=stdin,
+          expected_output=None,
+          cpu_time_limit=cpu_time_limit,
+        )
+        for source_code in chunk
+      ]
+    }
+    response = _request_json("POST", "/submissions/batch?base64_encoded=false", payload=payload)
+    if not isinstance(response, list) or len(response) != len(chunk):
+      raise Judge0Error("Unexpected Judge0 batch submission response.")
+    for item in response:
+      token = item.get("token") if isinstance(item, dict) else None
+      if not token:
+        raise Judge0Error(f"Judge0 rejected batch submission: {json.dumps(item)[:240]}")
+      tokens.append(str(token))
+
+  finished = _poll_submission_batch(tokens, language_family=language_family, started_at=started)
+  return [finished[token] for token in tokens]
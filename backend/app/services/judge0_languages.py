@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+  languages: list[dict[str, Any]]
+  families: Mapping[int, str | None]
+  fetched_at: float
+
+
+class LanguageCatalog:
+  """Judge0 language list with a disk snapshot, single-flight refresh and stale-on-error reads.
+
+  Readers never wait on the network once any snapshot (fetched or loaded from disk) exists:
+  an expired snapshot is served while one background thread refreshes it, and a failed refresh
+  keeps the old data and retries after ``retry_seconds``.
+  """
+
+  def __init__(
+    self,
+    fetch: Callable[[], list[dict[str, Any]]],
+    family_of: Callable[[str], str | None],
+    *,
+    source: str,
+    snapshot_path: str | None = None,
+    ttl_seconds: float = 3600.0,
+    retry_seconds: float = 60.0,
+    clock: Callable[[], float] = time.time,
+  ):
+    self.fetch = fetch
+    self.family_of = family_of
+    self.source = source
+    self.snapshot_path = snapshot_path
+    self.ttl_seconds = ttl_seconds
+    self.retry_seconds = retry_seconds
+    self.clock = clock
+    self._snapshot: _Snapshot | None = None
+    self._next_refresh_at = 0.0
+    self._refreshing = False
+    self._lock = threading.Lock()
+    self._fetch_lock = threading.Lock()
+    self._stats = {"fetches": 0, "fetch_errors": 0, "stale_reads": 0, "snapshot_loads": 0}
+
+  def languages(self) -> list[dict[str, Any]]:
+    return self._current().languages
+
+  def family(self, language_id: int) -> str | None:
+    return self._current().families.get(language_id)
+
+  def warm(self) -> None:
+    """Loads the disk snapshot if nothing is cached and refreshes in the background when due."""
+    if self._snapshot is None:
+      self._load_snapshot_file()
+    if self._snapshot is None or self.clock() >= self._next_refresh_at:
+      self._refresh_in_background()
+
+  def stats(self) -> dict[str, Any]:
+    snapshot = self._snapshot
+    with self._lock:
+      stats = dict(self._stats)
+    stats["languages"] = len(snapshot.languages) if snapshot else 0
+    stats["age_seconds"] = round(self.clock() - snapshot.fetched_at, 1) if snapshot else None
+    stats["refreshing"] = self._refreshing
+    return stats
+
+  def _current(self) -> _Snapshot:
+    snapshot = self._snapshot
+    if snapshot is None:
+      return self._load_blocking()
+    if self.clock() >= self._next_refresh_at:
+      with self._lock:
+        self._stats["stale_reads"] += 1
+      self._refresh_in_background()
+    return snapshot
+
+  def _load_blocking(self) -> _Snapshot:
+    # Only one thread fetches on a cold start; the rest wait for its result instead of stampeding.
+    with self._fetch_lock:
+      if self._snapshot is None:
+        self._load_snapshot_file()
+      if self._snapshot is None:
+        self._refresh()
+      return self._snapshot
+
+  def _refresh_in_background(self) -> None:
+    with self._lock:
+      if self._refreshing:
+        return
+      self._refreshing = True
+    threading.Thread(target=self._background_refresh, name="judge0-languages", daemon=True).start()
+
+  def _background_refresh(self) -> None:
+    try:
+      with self._fetch_lock:
+        self._refresh()
+    except Exception:
+      logger.warning("judge0_languages_refresh_failed source=%s", self.source, exc_info=True)
+    finally:
+      with self._lock:
+        self._refreshing = False
+
+  def _refresh(self) -> None:
+    try:
+      languages = self.fetch()
+    except Exception:
+      with self._lock:
+        self._stats["fetch_errors"] += 1
+        self._next_refresh_at = self.clock() + self.retry_seconds
+      raise
+    fetched_at = self.clock()
+    self._install(languages, fetched_at)
+    with self._lock:
+      self._stats["fetches"] += 1
+    self._write_snapshot_file(languages, fetched_at)
+
+  def _install(self, languages: list[dict[str, Any]], fetched_at: float) -> None:
+    families = MappingProxyType({language["id"]: self.family_of(language["name"]) for language in languages})
+    self._snapshot = _Snapshot(languages=languages, families=families, fetched_at=fetched_at)
+    self._next_refresh_at = fetched_at + self.ttl_seconds
+
+  def _load_snapshot_file(self) -> None:
+    if not self.snapshot_path:
+      return
+    try:
+      with open(self.snapshot_path, encoding="utf-8") as handle:
+        payload = json.load(handle)
+      if payload.get("source") != self.source:
+        return
+      languages = [
+        {"id": int(item["id"]), "name": str(item["name"])}
+        for item in payload["languages"]
+      ]
+      fetched_at = float(payload["fetched_at"])
+    except FileNotFoundError:
+      return
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+      logger.warning("judge0_languages_snapshot_unreadable path=%s", self.snapshot_path, exc_info=True)
+      return
+    if not languages:
+      return
+    self._install(languages, fetched_at)
+    with self._lock:
+      self._stats["snapshot_loads"] += 1
+
+  def _write_snapshot_file(self, languages: list[dict[str, Any]], fetched_at: float) -> None:
+    if not self.snapshot_path:
+      return
+    directory = os.path.dirname(os.path.abspath(self.snapshot_path))
+    try:
+      os.makedirs(directory, exist_ok=True)
+      fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".judge0-languages-")
+      with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        json.dump({"source": self.source, "fetched_at": fetched_at, "languages": languages}, handle)
+      os.replace(temp_path, self.snapshot_path)
+    except OSError:
+      logger.warning("judge0_languages_snapshot_write_failed path=%s", self.snapshot_path, exc_info=True)
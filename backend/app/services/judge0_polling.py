@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any, Callable
+
+# Typical submit-to-finish latency before any history exists; compiled toolchains start slower.
+_PRIOR_LATENCY_SECONDS = {
+  "python": 0.6,
+  "javascript": 0.6,
+  "ruby": 0.6,
+  "php": 0.6,
+  "c": 1.2,
+  "cpp": 1.5,
+  "go": 1.5,
+  "typescript": 2.0,
+  "java": 2.0,
+  "csharp": 2.5,
+  "rust": 3.0,
+  "kotlin": 4.0,
+  "swift": 4.0,
+}
+_DEFAULT_PRIOR_LATENCY_SECONDS = 1.0
+
+
+class AdaptivePoller:
+  """Chooses Judge0 poll delays from per-family latency history.
+
+  The first poll waits roughly half the family's smoothed latency, later polls back off
+  geometrically with multiplicative jitter, and the overall budget stretches for families that
+  are known to be slow so long compiles are not cut off at a fixed attempt count.
+  """
+
+  def __init__(
+    self,
+    *,
+    min_delay: float = 0.05,
+    max_delay: float = 2.0,
+    backoff: float = 1.6,
+    jitter: float = 0.2,
+    min_budget: float = 9.0,
+    max_budget: float = 25.0,
+    smoothing: float = 0.2,
+    sleep: Callable[[float], None] = time.sleep,
+  ):
+    self.min_delay = min_delay
+    self.max_delay = max_delay
+    self.backoff = backoff
+    self.jitter = jitter
+    self.min_budget = min_budget
+    self.max_budget = max_budget
+    self.smoothing = smoothing
+    self.sleep = sleep
+    self._latency: dict[str, float] = {}
+    self._polls: dict[str, dict[str, int]] = {}
+    self._lock = threading.Lock()
+
+  def expected_latency(self, family: str | None) -> float:
+    key = family or "default"
+    with self._lock:
+      observed = self._latency.get(key)
+    if observed is not None:
+      return observed
+    return _PRIOR_LATENCY_SECONDS.get(key, _DEFAULT_PRIOR_LATENCY_SECONDS)
+
+  def initial_delay(self, family: str | None) -> float:
+    return self._clamp_delay(self.expected_latency(family) * 0.5)
+
+  def next_delay(self, delay: float) -> float:
+    return self._clamp_delay(delay * self.backoff)
+
+  def budget(self, family: str | None) -> float:
+    return max(self.min_budget, min(self.max_budget, self.expected_latency(family) * 5))
+
+  def jittered(self, delay: float) -> float:
+    return max(0.0, delay * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+  def record_latency(self, family: str | None, seconds: float) -> None:
+    key = family or "default"
+    with self._lock:
+      previous = self._latency.get(key)
+      if previous is None:
+        self._latency[key] = seconds
+      else:
+        self._latency[key] = previous + self.smoothing * (seconds - previous)
+
+  def record_polls(self, family: str | None, polls: int) -> None:
+    key = family or "default"
+    with self._lock:
+      bucket = self._polls.setdefault(key, {"executions": 0, "polls": 0, "max_polls": 0, "timeouts": 0})
+      bucket["executions"] += 1
+      bucket["polls"] += polls
+      bucket["max_polls"] = max(bucket["max_polls"], polls)
+
+  def record_timeout(self, family: str | None) -> None:
+    key = family or "default"
+    with self._lock:
+      bucket = self._polls.setdefault(key, {"executions": 0, "polls": 0, "max_polls": 0, "timeouts": 0})
+      bucket["timeouts"] += 1
+
+  def stats(self) -> dict[str, Any]:
+    with self._lock:
+      families = set(self._latency) | set(self._polls)
+      snapshot: dict[str, Any] = {}
+      for family in sorted(families):
+        bucket = dict(self._polls.get(family) or {"executions": 0, "polls": 0, "max_polls": 0, "timeouts": 0})
+        executions = bucket["executions"]
+        bucket["avg_polls"] = round(bucket["polls"] / executions, 2) if executions else None
+        latency = self._latency.get(family)
+        bucket["latency_seconds"] = round(latency, 3) if latency is not None else None
+        snapshot[family] = bucket
+    return snapshot
+
+  def _clamp_delay(self, delay: float) -> float:
+    return max(self.min_delay, min(self.max_delay, delay))
@@ -0,0 +1,299 @@
+"""Namespace sandbox for the local executor; Linux only, standard library only.
+
+``executors.LocalSubprocessExecutor`` runs every program through this file as a script::
+
+  python -I -S local_sandbox.py --status-fd N --root DIR --workdir DIR [--ro PATH ...] -- CMD ...
+
+The script moves into fresh user, mount, PID, network, IPC and UTS namespaces, builds a new root on
+a tmpfs (system and runtime directories read-only, the workdir writable, private /tmp and /proc)
+and runs the command under a small init that is PID 1 of the new PID namespace. When that init
+exits or is killed, the kernel kills every process left in the namespace, detached or not. The
+program runs as an unprivileged uid with no capabilities and rlimits including RLIMIT_NPROC.
+
+Any step that fails raises ``SandboxError``; the command is never run with partial isolation.
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+import platform
+import resource
+import sys
+
+CLONE_NEWNS = 0x00020000
+CLONE_NEWUTS = 0x04000000
+CLONE_NEWIPC = 0x08000000
+CLONE_NEWUSER = 0x10000000
+CLONE_NEWPID = 0x20000000
+CLONE_NEWNET = 0x40000000
+
+_MS_RDONLY = 0x1
+_MS_NOSUID = 0x2
+_MS_NODEV = 0x4
+_MS_NOEXEC = 0x8
+_MS_REMOUNT = 0x20
+_MS_NOATIME = 0x400
+_MS_NODIRATIME = 0x800
+_MS_BIND = 0x1000
+_MS_REC = 0x4000
+_MS_PRIVATE = 0x40000
+_MS_RELATIME = 0x200000
+_MNT_DETACH = 0x2
+_PR_SET_PDEATHSIG = 1
+_PR_SET_NO_NEW_PRIVS = 38
+_LINUX_CAPABILITY_VERSION_3 = 0x20080522
+_SYS_PIVOT_ROOT = {"x86_64": 155, "aarch64": 41}
+# Mount flags a read-only remount must keep, or the kernel refuses it inside a user namespace.
+_KEPT_MOUNT_FLAGS = (
+  (os.ST_NOSUID, _MS_NOSUID),
+  (os.ST_NODEV, _MS_NODEV),
+  (os.ST_NOEXEC, _MS_NOEXEC),
+  (os.ST_NOATIME, _MS_NOATIME),
+  (os.ST_NODIRATIME, _MS_NODIRATIME),
+  (os.ST_RELATIME, _MS_RELATIME),
+)
+
+# What a dynamically linked runtime under /usr needs; paths missing on this host are skipped.
+SYSTEM_PATHS = (
+  "/usr",
+  "/bin",
+  "/sbin",
+  "/lib",
+  "/lib32",
+  "/lib64",
+  "/etc/alternatives",
+  "/etc/ld.so.cache",
+  "/etc/ld.so.conf",
+  "/etc/ld.so.conf.d",
+  "/etc/localtime",
+)
+_DEVICES = ("/dev/null", "/dev/zero", "/dev/random", "/dev/urandom")
+_DEVICE_LINKS = {
+  "/dev/fd": "/proc/self/fd",
+  "/dev/stdin": "/proc/self/fd/0",
+  "/dev/stdout": "/proc/self/fd/1",
+  "/dev/stderr": "/proc/self/fd/2",
+}
+# Kernel knobs under /proc that stay writable to the mapped uid unless bound read-only.
+_READONLY_PROC = ("/proc/sys", "/proc/sysrq-trigger", "/proc/irq", "/proc/bus")
+# Programs run as nobody inside the namespace, so exec never keeps namespace capabilities.
+_SANDBOX_ID = 65534
+_TMP_SIZE = "16m"
+
+_libc = None
+
+
+class SandboxError(OSError):
+  pass
+
+
+def _call(name, *args):
+  global _libc
+  if _libc is None:
+    _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+  if getattr(_libc, name)(*args) != 0:
+    errno = ctypes.get_errno()
+    raise SandboxError(errno, f"{name} failed: {os.strerror(errno)}")
+
+
+def _path(value):
+  return None if value is None else os.fsencode(value)
+
+
+def _mount(source, target, fstype, flags, data=None):
+  _call("mount", _path(source), _path(target), _path(fstype), ctypes.c_ulong(flags), _path(data))
+
+
+def unshare(flags):
+  _call("unshare", ctypes.c_int(flags))
+
+
+def die_with_parent():
+  _call("prctl", _PR_SET_PDEATHSIG, 9, 0, 0, 0)
+
+
+def enter_namespaces():
+  """Moves this process into new namespaces; its next child is PID 1 of the new PID namespace."""
+  if not sys.platform.startswith("linux"):
+    raise SandboxError("The local sandbox needs Linux namespaces.")
+  uid, gid = os.getuid(), os.getgid()
+  unshare(CLONE_NEWUSER | CLONE_NEWNS | CLONE_NEWPID | CLONE_NEWNET | CLONE_NEWIPC | CLONE_NEWUTS)
+  with open("/proc/self/setgroups", "w") as handle:
+    handle.write("deny")
+  with open("/proc/self/uid_map", "w") as handle:
+    handle.write(f"{_SANDBOX_ID} {uid} 1")
+  with open("/proc/self/gid_map", "w") as handle:
+    handle.write(f"{_SANDBOX_ID} {gid} 1")
+
+
+def _remount_readonly(target):
+  flags = _MS_REMOUNT | _MS_BIND | _MS_RDONLY | _MS_NOSUID
+  mounted = os.statvfs(target).f_flag
+  for statvfs_flag, mount_flag in _KEPT_MOUNT_FLAGS:
+    if mounted & statvfs_flag:
+      flags |= mount_flag
+  _mount(None, target, None, flags)
+
+
+def _bind(source, target, *, readonly):
+  if os.path.islink(source):
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    os.symlink(os.readlink(source), target)
+    return
+  if os.path.isdir(source):
+    os.makedirs(target, exist_ok=True)
+  else:
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    open(target, "a").close()
+  _mount(source, target, None, _MS_BIND | _MS_REC)
+  if readonly:
+    _remount_readonly(target)
+
+
+def mount_proc(root=""):
+  """Mounts a /proc for the current PID namespace; call from a process inside that namespace."""
+  proc = root + "/proc"
+  os.makedirs(proc, exist_ok=True)
+  _mount("proc", proc, "proc", _MS_NOSUID | _MS_NODEV | _MS_NOEXEC)
+  for path in _READONLY_PROC:
+    if os.path.exists(root + path):
+      _bind(root + path, root + path, readonly=True)
+
+
+def mount_tmp(path):
+  _mount("tmpfs", path, "tmpfs", _MS_NOSUID | _MS_NODEV, f"size={_TMP_SIZE},mode=1777")
+
+
+def build_root(root, *, readonly_paths=(), workdir=None):
+  """Makes ``root`` the new ``/`` of this mount namespace.
+
+  Only ``SYSTEM_PATHS`` and ``readonly_paths`` (read-only), ``workdir`` (writable), a few devices and
+  fresh /tmp and /proc are visible afterwards; the host tree is detached. Call it as PID 1 of the
+  new PID namespace so /proc lists only the sandbox.
+  """
+  _mount(None, "/", None, _MS_REC | _MS_PRIVATE)
+  _mount("tmpfs", root, "tmpfs", _MS_NOSUID | _MS_NODEV, "size=1m,mode=0755")
+
+  bound = []
+  for path in sorted({os.path.normpath(path) for path in (*SYSTEM_PATHS, *readonly_paths)}):
+    if not os.path.lexists(path) or any(path == done or path.startswith(done + "/") for done in bound):
+      continue
+    _bind(path, root + path, readonly=True)
+    bound.append(path)
+
+  os.makedirs(root + "/tmp", exist_ok=True)
+  mount_tmp(root + "/tmp")
+  if workdir is not None:
+    _bind(workdir, root + workdir, readonly=False)
+  for device in _DEVICES:
+    if os.path.exists(device):
+      _bind(device, root + device, readonly=False)
+  for link, target in _DEVICE_LINKS.items():
+    os.symlink(target, root + link)
+  mount_proc(root)
+
+  syscall = _SYS_PIVOT_ROOT.get(platform.machine())
+  if syscall is None:
+    raise SandboxError(f"pivot_root is not wired up for {platform.machine()}.")
+  os.chdir(root)
+  _call("syscall", syscall, b".", b".")
+  _call("umount2", b".", _MNT_DETACH)
+  os.chdir("/")
+  _remount_readonly("/")
+
+
+def confine(*, cpu_seconds, memory_bytes, output_bytes, max_processes):
+  """Applies the program's rlimits and drops every capability; call in the program's own process."""
+  resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+  resource.setrlimit(resource.RLIMIT_FSIZE, (output_bytes, output_bytes))
+  resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+  resource.setrlimit(resource.RLIMIT_NOFILE, (64, 64))
+  resource.setrlimit(resource.RLIMIT_NPROC, (max_processes, max_processes))
+  if memory_bytes:
+    resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+  _call("prctl", _PR_SET_NO_NEW_PRIVS, 1, 0, 0, 0)
+  header = (ctypes.c_uint32 * 2)(_LINUX_CAPABILITY_VERSION_3, 0)
+  _call("capset", header, (ctypes.c_uint32 * 6)())
+
+
+def run_as_init(target, status_fd):
+  """Runs ``target`` in a child, reaping every orphan until that child exits; never returns.
+
+  The child's exit code and resource usage go to ``status_fd`` as JSON. Exiting this process then
+  takes down everything else in the PID namespace.
+  """
+  try:
+    pid = os.fork()
+    if pid == 0:
+      try:
+        os.close(status_fd)
+        target()
+      except BaseException as err:
+        print(f"sandbox: {err}", file=sys.stderr)
+      finally:
+        os._exit(127)
+    while True:
+      reaped, wait_status, usage = os.wait4(-1, 0)
+      if reaped == pid:
+        break
+    status = {
+      "exit_code": os.waitstatus_to_exitcode(wait_status),
+      "cpu_seconds": usage.ru_utime + usage.ru_stime,
+      "max_rss_kb": usage.ru_maxrss,
+    }
+    os.write(status_fd, json.dumps(status).encode("utf-8"))
+  except BaseException:
+    os._exit(70)
+  os._exit(0)
+
+
+def _exec_command(args):
+  confine(
+    cpu_seconds=args.cpu_seconds,
+    memory_bytes=args.memory_bytes,
+    output_bytes=args.output_bytes,
+    max_processes=args.max_processes,
+  )
+  os.execv(args.command[0], args.command)
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(prog="local_sandbox")
+  parser.add_argument("--status-fd", type=int, required=True)
+  parser.add_argument("--root", required=True)
+  parser.add_argument("--workdir", required=True)
+  parser.add_argument("--ro", action="append", default=[])
+  parser.add_argument("--cpu-seconds", type=int, required=True)
+  parser.add_argument("--memory-bytes", type=int, default=0)
+  parser.add_argument("--output-bytes", type=int, required=True)
+  parser.add_argument("--max-processes", type=int, required=True)
+  parser.add_argument("command", nargs="+")
+  args = parser.parse_args(argv)
+  # The program must not inherit the status pipe.
+  os.set_inheritable(args.status_fd, False)
+
+  try:
+    enter_namespaces()
+    pid = os.fork()
+  except OSError as err:
+    print(f"sandbox: {err}", file=sys.stderr)
+    return 125
+  if pid == 0:
+    try:
+      die_with_parent()
+      build_root(args.root, readonly_paths=args.ro, workdir=args.workdir)
+      os.chdir(args.workdir)
+    except BaseException as err:
+      print(f"sandbox: {err}", file=sys.stderr)
+      os._exit(125)
+    run_as_init(lambda: _exec_command(args), args.status_fd)
+
+  os.close(args.status_fd)
+  _, wait_status = os.waitpid(pid, 0)
+  return 0 if os.waitstatus_to_exitcode(wait_status) == 0 else 125
+
+
+if __name__ == "__main__":
+  sys.exit(main())
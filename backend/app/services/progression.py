@@ -1,11 +1,34 @@
 from __future__ import annotations
 
+import hashlib
+import logging
+import os
+import random
+import threading
+import time
 from dataclasses import dataclass
 from math import floor
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping
+
+from sqlalchemy import event
 
 from ..extensions import db
-from ..models import Module, ProjectSubmission, ResumeSubmission, Task, User, UserProgress, UserTaskCompletion
+from ..models import (
+  Module,
+  ProjectSubmission,
+  ResumeSubmission,
+  Task,
+  User,
+  UserModuleProgress,
+  UserProgress,
+  UserTaskCompletion,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fraction of incremental task toggles that are re-verified against a full recompute.
+PROGRESS_CONSISTENCY_SAMPLE_RATE = float(os.getenv("PROGRESS_CONSISTENCY_SAMPLE_RATE") or 0.01)
 
 
 @dataclass
@@ -18,6 +41,8 @@ class ModuleState:
   unlock_threshold: int
   has_tasks: bool
   has_bonus_tasks: bool
+  completed_weight: int = 0
+  catalog_version: str | None = None
 
   def to_dict(self) -> dict[str, Any]:
     return {
@@ -31,6 +56,179 @@ class ModuleState:
     }
 
 
+@dataclass(frozen=True)
+class CatalogTask:
+  id: int
+  module_id: int
+  challenge_id: str | None
+  title: str
+  description: str | None
+  weight: int
+  is_bonus: bool
+  sort_order: int
+
+
+@dataclass(frozen=True)
+class CatalogModule:
+  id: int
+  key: str
+  name: str
+  category: str
+  overall_weight: int
+  unlock_threshold: int
+  sort_order: int
+  tasks: tuple[CatalogTask, ...]
+  total_weight: int
+  has_bonus_tasks: bool
+  tasks_by_challenge_id: Mapping[str, CatalogTask]
+  # Digest of the active task ids and weights; stored module progress is only valid for the same value.
+  catalog_version: str
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+  fingerprint: tuple[Any, ...]
+  modules: tuple[CatalogModule, ...]
+  modules_by_key: Mapping[str, CatalogModule]
+  modules_by_id: Mapping[int, CatalogModule]
+  tasks_by_id: Mapping[int, CatalogTask]
+
+
+# Modules and tasks are seeded by migrations and almost never change, so each process keeps one
+# immutable snapshot. ORM writes drop it immediately; other processes notice through a cheap
+# fingerprint query that runs at most once per CATALOG_VERSION_CHECK_SECONDS.
+CATALOG_VERSION_CHECK_SECONDS = 30.0
+_CATALOG: CatalogSnapshot | None = None
+_CATALOG_CHECKED_AT = 0.0
+_CATALOG_LOCK = threading.Lock()
+
+
+def invalidate_catalog() -> None:
+  global _CATALOG
+
+  with _CATALOG_LOCK:
+    _CATALOG = None
+
+
+@event.listens_for(Task, "after_insert")
+@event.listens_for(Task, "after_update")
+@event.listens_for(Task, "after_delete")
+@event.listens_for(Module, "after_insert")
+@event.listens_for(Module, "after_update")
+@event.listens_for(Module, "after_delete")
+def _on_catalog_write(mapper, connection, target) -> None:
+  invalidate_catalog()
+
+
+def _catalog_fingerprint() -> tuple[Any, ...]:
+  # Migrations edit the catalog with plain UPDATEs that skip updated_at, so aggregate the columns
+  # scoring depends on instead of relying on timestamps alone.
+  active_weight = db.case((Task.is_active.is_(True), Task.weight), else_=0)
+  active_id = db.case((Task.is_active.is_(True), Task.id), else_=0)
+  bonus_id = db.case((db.and_(Task.is_active.is_(True), Task.is_bonus.is_(True)), Task.id), else_=0)
+  task_row = db.session.query(
+    db.func.count(Task.id),
+    db.func.sum(active_weight),
+    db.func.sum(active_id),
+    db.func.sum(bonus_id),
+    db.func.sum(Task.sort_order * Task.id),
+    db.func.max(Task.updated_at),
+  ).one()
+  module_row = db.session.query(
+    db.func.count(Module.id),
+    db.func.sum(Module.overall_weight * Module.id),
+    db.func.sum(Module.sort_order * Module.id),
+    db.func.sum(Module.unlock_threshold * Module.id),
+    db.func.max(Module.updated_at),
+  ).one()
+  return tuple(task_row) + tuple(module_row)
+
+
+def _module_catalog_version(tasks: Iterable[CatalogTask]) -> str:
+  weights = ",".join(f"{task.id}:{task.weight}" for task in sorted(tasks, key=lambda task: task.id))
+  return hashlib.sha1(weights.encode("utf-8")).hexdigest()[:16]
+
+
+def _load_catalog(fingerprint: tuple[Any, ...]) -> CatalogSnapshot:
+  modules = Module.query.order_by(Module.sort_order.asc(), Module.id.asc()).all()
+  tasks = Task.query.filter(Task.is_active.is_(True)).order_by(Task.sort_order.asc(), Task.id.asc()).all()
+
+  tasks_by_module: dict[int, list[CatalogTask]] = {}
+  for task in tasks:
+    tasks_by_module.setdefault(task.module_id, []).append(
+      CatalogTask(
+        id=task.id,
+        module_id=task.module_id,
+        challenge_id=task.challenge_id,
+        title=task.title,
+        description=task.description,
+        weight=task.weight,
+        is_bonus=bool(task.is_bonus),
+        sort_order=task.sort_order,
+      )
+    )
+
+  catalog_modules: list[CatalogModule] = []
+  tasks_by_id: dict[int, CatalogTask] = {}
+  for module in modules:
+    module_tasks = tuple(tasks_by_module.get(module.id, ()))
+    by_challenge: dict[str, CatalogTask] = {}
+    for task in module_tasks:
+      tasks_by_id[task.id] = task
+      if task.challenge_id is not None:
+        by_challenge.setdefault(task.challenge_id, task)
+    catalog_modules.append(
+      CatalogModule(
+        id=module.id,
+        key=module.key,
+        name=module.name,
+        category=module.category,
+        overall_weight=module.overall_weight,
+        unlock_threshold=module.unlock_threshold,
+        sort_order=module.sort_order,
+        tasks=module_tasks,
+        total_weight=sum(max(0, task.weight) for task in module_tasks),
+        has_bonus_tasks=any(task.is_bonus for task in module_tasks),
+        tasks_by_challenge_id=MappingProxyType(by_challenge),
+        catalog_version=_module_catalog_version(module_tasks),
+      )
+    )
+
+  return CatalogSnapshot(
+    fingerprint=fingerprint,
+    modules=tuple(catalog_modules),
+    modules_by_key=MappingProxyType({module.key: module for module in catalog_modules}),
+    modules_by_id=MappingProxyType({module.id: module for module in catalog_modules}),
+    tasks_by_id=MappingProxyType(tasks_by_id),
+  )
+
+
+def get_catalog() -> CatalogSnapshot:
+  global _CATALOG, _CATALOG_CHECKED_AT
+
+  with _CATALOG_LOCK:
+    catalog = _CATALOG
+    due = time.monotonic() - _CATALOG_CHECKED_AT >= CATALOG_VERSION_CHECK_SECONDS
+  if catalog is not None and not due:
+    return catalog
+
+  fingerprint = _catalog_fingerprint()
+  if catalog is None or catalog.fingerprint != fingerprint:
+    catalog = _load_catalog(fingerprint)
+  with _CATALOG_LOCK:
+    _CATALOG = catalog
+    _CATALOG_CHECKED_AT = time.monotonic()
+  return catalog
+
+
+def get_challenge_task_ids(module_key: str) -> dict[str, int] | None:
+  """Active task id per challenge id for a module, or None when the module does not exist."""
+  module = get_catalog().modules_by_key.get(module_key)
+  if module is None:
+    return None
+  return {challenge_id: task.id for challenge_id, task in module.tasks_by_challenge_id.items()}
+
+
 def get_or_create_user_progress(user_id: int) -> UserProgress:
   progress = UserProgress.query.filter_by(user_id=user_id).first()
   if progress:
@@ -46,6 +244,7 @@ def set_coding_override_for_advanced(user_id: int, score: int = 80) -> None:
   progress = get_or_create_user_progress(user_id)
   progress.coding_override_score = max(0, min(100, score))
   progress.coding_override_source = "advanced_onboarding"
+  progress.needs_recompute = True
   db.session.flush()
 
 
@@ -53,6 +252,7 @@ def clear_coding_override(user_id: int) -> None:
   progress = get_or_create_user_progress(user_id)
   progress.coding_override_score = None
   progress.coding_override_source = None
+  progress.needs_recompute = True
   db.session.flush()
 
 
@@ -63,7 +263,7 @@ def _score_from_weights(total_weight: int, completed_weight: int) -> int:
   return max(0, min(100, raw))
 
 
-def _compute_category_score(module_states: list[ModuleState], modules: list[Module], category: str) -> int:
+def _compute_category_score(module_states: list[ModuleState], modules: tuple[CatalogModule, ...], category: str) -> int:
   weighted_sum = 0
   total_weight = 0
   module_by_id = {module.id: module for module in modules}
@@ -80,7 +280,7 @@ def _compute_category_score(module_states: list[ModuleState], modules: list[Modu
   return round(weighted_sum / total_weight)
 
 
-def _compute_overall_score(module_states: list[ModuleState], modules: list[Module]) -> int:
+def _compute_overall_score(module_states: list[ModuleState], modules: tuple[CatalogModule, ...]) -> int:
   module_by_id = {module.id: module for module in modules}
   weighted_total = 0
   for state in module_states:
@@ -109,127 +309,255 @@ def _best_successful_resume_score(user_id: int) -> int:
   return max(0, min(100, int(best_score or 0)))
 
 
-def _build_module_states(user: User, progress: UserProgress) -> list[ModuleState]:
-  modules = Module.query.order_by(Module.sort_order.asc()).all()
-  if not modules:
-    return []
+def _completed_task_ids(user_id: int, task_ids: Iterable[int]) -> set[int]:
+  task_ids = list(task_ids)
+  if not task_ids:
+    return set()
+  return {
+    row.task_id
+    for row in db.session.query(UserTaskCompletion.task_id).filter(
+      UserTaskCompletion.user_id == user_id,
+      UserTaskCompletion.task_id.in_(task_ids),
+    )
+  }
 
-  module_ids = [module.id for module in modules]
-  tasks = Task.query.filter(
-    Task.module_id.in_(module_ids),
-    Task.is_active.is_(True),
-  ).order_by(Task.sort_order.asc(), Task.id.asc()).all()
-
-  task_ids = [task.id for task in tasks]
-  completed_ids: set[int] = set()
-  if task_ids:
-    completed_ids = {
-      row.task_id
-      for row in UserTaskCompletion.query.filter(
-        UserTaskCompletion.user_id == user.id,
-        UserTaskCompletion.task_id.in_(task_ids),
-      ).all()
-    }
 
-  tasks_by_module: dict[int, list[Task]] = {module_id: [] for module_id in module_ids}
-  for task in tasks:
-    tasks_by_module.setdefault(task.module_id, []).append(task)
+def _coding_override(score: int | None, source: str | None) -> int | None:
+  if score is None or source != "advanced_onboarding":
+    return None
+  return max(0, min(100, score))
 
-  scores_by_module_id: dict[int, int] = {}
-  has_tasks_by_module_id: dict[int, bool] = {}
-  has_bonus_by_module_id: dict[int, bool] = {}
 
-  for module in modules:
-    module_tasks = tasks_by_module.get(module.id, [])
-    has_tasks = len(module_tasks) > 0
-    has_bonus = any(task.is_bonus for task in module_tasks)
-    has_tasks_by_module_id[module.id] = has_tasks
-    has_bonus_by_module_id[module.id] = has_bonus
+def _module_states_from_weights(
+  catalog: CatalogSnapshot,
+  *,
+  completed_weight_by_module: Mapping[int, int],
+  resume_score: int,
+  coding_override: int | None,
+) -> list[ModuleState]:
+  states: list[ModuleState] = []
+  for module in catalog.modules:
+    has_tasks = len(module.tasks) > 0
+    completed_weight = completed_weight_by_module.get(module.id, 0)
 
     if module.key == "resume":
       # Resume readiness should reflect the user's best score achieved so far.
-      score = _best_successful_resume_score(user.id)
+      score = resume_score
     elif has_tasks:
-      total_weight = sum(max(0, task.weight) for task in module_tasks)
-      completed_weight = sum(max(0, task.weight) for task in module_tasks if task.id in completed_ids)
-      score = _score_from_weights(total_weight, completed_weight)
-    elif (
-      module.key == "coding"
-      and progress.coding_override_score is not None
-      and progress.coding_override_source == "advanced_onboarding"
-    ):
-      score = max(0, min(100, progress.coding_override_score))
+      score = _score_from_weights(module.total_weight, completed_weight)
+    elif module.key == "coding" and coding_override is not None:
+      score = coding_override
     else:
       score = 0
 
-    scores_by_module_id[module.id] = score
-
-  states: list[ModuleState] = []
-  for module in modules:
     states.append(
       ModuleState(
         module_id=module.id,
         module_key=module.key,
         module_name=module.name,
-        score=scores_by_module_id.get(module.id, 0),
+        score=score,
         is_unlocked=True,
         unlock_threshold=module.unlock_threshold,
-        has_tasks=has_tasks_by_module_id.get(module.id, False),
-        has_bonus_tasks=has_bonus_by_module_id.get(module.id, False),
+        has_tasks=has_tasks,
+        has_bonus_tasks=module.has_bonus_tasks,
+        completed_weight=completed_weight,
+        catalog_version=module.catalog_version,
       )
     )
 
   return states
 
 
-def recompute_and_persist_user_progress(user_id: int, *, commit: bool = True) -> dict[str, Any]:
-  user = User.query.get_or_404(user_id)
-  progress = get_or_create_user_progress(user.id)
-  modules = Module.query.order_by(Module.sort_order.asc()).all()
-  module_states = _build_module_states(user, progress)
+def _module_rows_current(catalog: CatalogSnapshot, rows: Mapping[int, UserModuleProgress]) -> bool:
+  # A completed weight summed under other task weights cannot be rescaled: which tasks it came from
+  # is unknown, so rows from an older catalog are recomputed from completions instead.
+  return all(
+    module.id in rows and rows[module.id].catalog_version == module.catalog_version
+    for module in catalog.modules
+  )
 
-  overall = _compute_overall_score(module_states, modules) if modules else 0
-  category_coding = _compute_category_score(module_states, modules, "coding") if modules else 0
-  category_projects = _compute_category_score(module_states, modules, "projects") if modules else 0
-  category_resume = _compute_category_score(module_states, modules, "resume") if modules else 0
 
-  progress.readiness_score = overall
-  progress.category_coding = category_coding
-  progress.category_projects = category_projects
-  progress.category_resume = category_resume
+def _module_states_from_rows(catalog: CatalogSnapshot, rows: Mapping[int, UserModuleProgress]) -> list[ModuleState]:
+  return [
+    ModuleState(
+      module_id=module.id,
+      module_key=module.key,
+      module_name=module.name,
+      score=rows[module.id].score,
+      is_unlocked=True,
+      unlock_threshold=module.unlock_threshold,
+      has_tasks=len(module.tasks) > 0,
+      has_bonus_tasks=module.has_bonus_tasks,
+      completed_weight=rows[module.id].completed_weight,
+      catalog_version=rows[module.id].catalog_version,
+    )
+    for module in catalog.modules
+  ]
 
-  if commit:
-    db.session.commit()
-  else:
-    db.session.flush()
 
+def _build_module_states(user: User, progress: UserProgress, catalog: CatalogSnapshot) -> list[ModuleState]:
+  if not catalog.modules:
+    return []
+
+  completed_weight_by_module: dict[int, int] = {}
+  for task_id in _completed_task_ids(user.id, catalog.tasks_by_id):
+    task = catalog.tasks_by_id[task_id]
+    completed_weight_by_module[task.module_id] = completed_weight_by_module.get(task.module_id, 0) + max(0, task.weight)
+
+  return _module_states_from_weights(
+    catalog,
+    completed_weight_by_module=completed_weight_by_module,
+    resume_score=_best_successful_resume_score(user.id) if "resume" in catalog.modules_by_key else 0,
+    coding_override=_coding_override(progress.coding_override_score, progress.coding_override_source),
+  )
+
+
+def _summarize_progress(module_states: list[ModuleState], modules: tuple[CatalogModule, ...]) -> dict[str, Any]:
   return {
-    "progress": overall,
+    "progress": _compute_overall_score(module_states, modules) if modules else 0,
     "category_readiness": {
-      "coding": category_coding,
-      "projects": category_projects,
-      "resume": category_resume,
+      "coding": _compute_category_score(module_states, modules, "coding") if modules else 0,
+      "projects": _compute_category_score(module_states, modules, "projects") if modules else 0,
+      "resume": _compute_category_score(module_states, modules, "resume") if modules else 0,
     },
     "module_progress": [state.to_dict() for state in module_states],
     "next_action": _next_action(module_states),
   }
 
+
+def _stored_scores_match(progress: UserProgress, summary: dict[str, Any]) -> bool:
+  categories = summary["category_readiness"]
+  return (
+    progress.readiness_score == summary["progress"]
+    and progress.category_coding == categories["coding"]
+    and progress.category_projects == categories["projects"]
+    and progress.category_resume == categories["resume"]
+  )
+
+
+def _apply_scores(progress: UserProgress, summary: dict[str, Any]) -> None:
+  categories = summary["category_readiness"]
+  progress.readiness_score = summary["progress"]
+  progress.category_coding = categories["coding"]
+  progress.category_projects = categories["projects"]
+  progress.category_resume = categories["resume"]
+  progress.needs_recompute = False
+
+
+def _user_module_rows(user_id: int, *, for_update: bool = False) -> dict[int, UserModuleProgress]:
+  query = UserModuleProgress.query.filter_by(user_id=user_id)
+  if for_update:
+    query = query.with_for_update()
+  return {row.module_id: row for row in query}
+
+
+def _write_module_rows(user_id: int, module_states: list[ModuleState]) -> None:
+  existing = _user_module_rows(user_id)
+  for state in module_states:
+    row = existing.pop(state.module_id, None)
+    if row is None:
+      db.session.add(
+        UserModuleProgress(
+          user_id=user_id,
+          module_id=state.module_id,
+          score=state.score,
+          completed_weight=state.completed_weight,
+          catalog_version=state.catalog_version,
+        )
+      )
+    else:
+      row.score = state.score
+      row.completed_weight = state.completed_weight
+      row.catalog_version = state.catalog_version
+  for row in existing.values():
+    db.session.delete(row)
+
+
+def _persist_summary(
+  progress: UserProgress,
+  module_states: list[ModuleState],
+  summary: dict[str, Any],
+  *,
+  commit: bool,
+) -> None:
+  _apply_scores(progress, summary)
+  _write_module_rows(progress.user_id, module_states)
+
+  if commit:
+    db.session.commit()
+  else:
+    db.session.flush()
+
+
+def mark_user_progress_stale(user_id: int) -> None:
+  progress = get_or_create_user_progress(user_id)
+  progress.needs_recompute = True
+
+
+def recompute_and_persist_user_progress(user_id: int, *, commit: bool = True) -> dict[str, Any]:
+  user = User.query.get_or_404(user_id)
+  progress = get_or_create_user_progress(user.id)
+  catalog = get_catalog()
+  module_states = _build_module_states(user, progress, catalog)
+  summary = _summarize_progress(module_states, catalog.modules)
+  _persist_summary(progress, module_states, summary, commit=commit)
+  return summary
+
+
+def get_user_progress_summary(user_id: int) -> dict[str, Any]:
+  """Read path for the dashboard: serves stored module progress and only writes when it is behind."""
+  progress = UserProgress.query.filter_by(user_id=user_id).first()
+  if progress is None or progress.needs_recompute:
+    return recompute_and_persist_user_progress(user_id, commit=True)
+
+  catalog = get_catalog()
+  rows = _user_module_rows(user_id)
+  if not _module_rows_current(catalog, rows):
+    return recompute_and_persist_user_progress(user_id, commit=True)
+
+  module_states = _module_states_from_rows(catalog, rows)
+  summary = _summarize_progress(module_states, catalog.modules)
+  if not _stored_scores_match(progress, summary):
+    # Module weights changed since user_progress was written; store the re-aggregated scores.
+    _persist_summary(progress, module_states, summary, commit=True)
+  return summary
+
+
+def get_users_below_threshold(module_key: str, *, threshold: int | None = None, limit: int = 100) -> dict[str, Any] | None:
+  module = get_catalog().modules_by_key.get(module_key)
+  if module is None:
+    return None
+
+  cutoff = module.unlock_threshold if threshold is None else threshold
+  rows = (
+    db.session.query(UserModuleProgress.user_id, UserModuleProgress.score, UserModuleProgress.updated_at, User.email)
+    .join(User, User.id == UserModuleProgress.user_id)
+    .filter(UserModuleProgress.module_id == module.id, UserModuleProgress.score < cutoff)
+    .order_by(UserModuleProgress.score.asc(), UserModuleProgress.user_id.asc())
+    .limit(limit)
+    .all()
+  )
+  return {
+    "module_key": module.key,
+    "threshold": cutoff,
+    "users": [
+      {
+        "user_id": user_id,
+        "email": email,
+        "score": score,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+      }
+      for user_id, score, updated_at, email in rows
+    ],
+  }
+
+
 def get_tasks_for_user_module(user_id: int, module_key: str) -> dict[str, Any] | None:
-  module = Module.query.filter_by(key=module_key).first()
+  module = get_catalog().modules_by_key.get(module_key)
   if module is None:
     return None
 
-  tasks = Task.query.filter_by(module_id=module.id, is_active=True).order_by(Task.sort_order.asc(), Task.id.asc()).all()
-  task_ids = [task.id for task in tasks]
-  completed_ids: set[int] = set()
-  if task_ids:
-    completed_ids = {
-      row.task_id
-      for row in UserTaskCompletion.query.filter(
-        UserTaskCompletion.user_id == user_id,
-        UserTaskCompletion.task_id.in_(task_ids),
-      ).all()
-    }
+  completed_ids = _completed_task_ids(user_id, (task.id for task in module.tasks))
 
   return {
     "module_key": module.key,
@@ -242,31 +570,119 @@ def get_tasks_for_user_module(user_id: int, module_key: str) -> dict[str, Any] |
         "is_bonus": task.is_bonus,
         "is_completed": task.id in completed_ids,
       }
-      for task in tasks
+      for task in module.tasks
     ],
   }
 
 
+def _apply_task_delta(user_id: int, task_id: int, weight_delta: int) -> dict[str, Any] | None:
+  """Incremental scoring for a single toggle; returns None when stored state cannot be trusted."""
+  catalog = get_catalog()
+  task = catalog.tasks_by_id.get(task_id)
+  # Locking the progress row first serializes concurrent toggles for this user (a no-op on SQLite).
+  progress = UserProgress.query.filter_by(user_id=user_id).with_for_update().first()
+  if task is None or progress is None or progress.needs_recompute:
+    return None
+  rows = _user_module_rows(user_id, for_update=True)
+  # The delta is the task's current weight, which only adds up against rows scored with current weights.
+  if not _module_rows_current(catalog, rows):
+    return None
+
+  module = catalog.modules_by_id[task.module_id]
+  row = rows[module.id]
+  if weight_delta:
+    # Increment in SQL so a concurrent toggle's write is never replaced by a stale read, then score
+    # from the refreshed total.
+    completed_weight = UserModuleProgress.completed_weight + weight_delta
+    db.session.execute(
+      db.update(UserModuleProgress)
+      .where(UserModuleProgress.user_id == user_id, UserModuleProgress.module_id == module.id)
+      .values(completed_weight=db.case((completed_weight < 0, 0), else_=completed_weight))
+      .execution_options(synchronize_session=False)
+    )
+    db.session.refresh(row, ["completed_weight"])
+    # The resume module is scored from resume submissions, not from its task weights.
+    if module.key != "resume":
+      row.score = _score_from_weights(module.total_weight, row.completed_weight)
+
+  summary = _summarize_progress(_module_states_from_rows(catalog, rows), catalog.modules)
+  _apply_scores(progress, summary)
+  db.session.commit()
+  return summary
+
+
 def set_task_completion_internal(user_id: int, task_id: int, completed: bool) -> dict[str, Any]:
   completion = UserTaskCompletion.query.filter_by(user_id=user_id, task_id=task_id).first()
+  task = get_catalog().tasks_by_id.get(task_id)
+  weight_delta = 0
   if completed and completion is None:
     db.session.add(UserTaskCompletion(user_id=user_id, task_id=task_id))
+    weight_delta = max(0, task.weight) if task else 0
   if not completed and completion is not None:
     db.session.delete(completion)
+    weight_delta = -max(0, task.weight) if task else 0
+
+  summary = _apply_task_delta(user_id, task_id, weight_delta)
+  if summary is None:
+    mark_user_progress_stale(user_id)
+    return recompute_and_persist_user_progress(user_id, commit=True)
+
+  if random.random() < PROGRESS_CONSISTENCY_SAMPLE_RATE and verify_user_progress(user_id):
+    return recompute_and_persist_user_progress(user_id, commit=True)
+  return summary
+
+
+def verify_user_progress(user_id: int, *, repair: bool = False) -> list[str]:
+  """Compares stored progress with a full recompute and returns the keys that disagree."""
+  user = User.query.get_or_404(user_id)
+  progress = UserProgress.query.filter_by(user_id=user.id).first()
+  if progress is None:
+    return ["user_progress"]
+
+  catalog = get_catalog()
+  module_states = _build_module_states(user, progress, catalog)
+  summary = _summarize_progress(module_states, catalog.modules)
+
+  mismatches: list[str] = []
+  if not _stored_scores_match(progress, summary):
+    mismatches.append("user_progress")
+  rows = _user_module_rows(user.id)
+  for state in module_states:
+    row = rows.get(state.module_id)
+    if (
+      row is None
+      or row.score != state.score
+      or row.completed_weight != state.completed_weight
+      or row.catalog_version != state.catalog_version
+    ):
+      mismatches.append(state.module_key)
 
-  return recompute_and_persist_user_progress(user_id, commit=True)
+  if mismatches:
+    logger.warning("Progress drift for user %s in %s", user.id, ", ".join(mismatches))
+    if repair:
+      _persist_summary(progress, module_states, summary, commit=True)
+  return mismatches
+
+
+def check_progress_consistency(*, limit: int | None = None, repair: bool = False) -> dict[str, Any]:
+  checked = 0
+  drifted: list[int] = []
+  query = db.session.query(UserProgress.user_id).order_by(UserProgress.user_id.asc())
+  if limit is not None:
+    query = query.limit(limit)
+  for (user_id,) in query.all():
+    checked += 1
+    if verify_user_progress(user_id, repair=repair):
+      drifted.append(user_id)
+  return {"checked": checked, "drifted": drifted}
 
 
 def sync_projects_submission_progress(user_id: int, *, commit: bool = True) -> dict[str, Any]:
-  module = Module.query.filter_by(key="projects").first()
+  module = get_catalog().modules_by_key.get("projects")
   if module is None:
     return recompute_and_persist_user_progress(user_id, commit=commit)
 
-  keyed_tasks = {
-    task.challenge_id: task
-    for task in Task.query.filter_by(module_id=module.id, is_active=True).all()
-    if task.challenge_id in {"projects_core_1", "projects_core_2", "projects_bonus_real_user"}
-  }
+  keyed_tasks = module.tasks_by_challenge_id
 
   passed_count = (
     ProjectSubmission.query
@@ -298,19 +714,16 @@ def sync_projects_submission_progress(user_id: int, *, commit: bool = True) -> d
     if not is_completed and completion is not None:
       db.session.delete(completion)
 
+  mark_user_progress_stale(user_id)
   return recompute_and_persist_user_progress(user_id, commit=commit)
 
 
 def sync_resume_submission_progress(user_id: int, *, commit: bool = True) -> dict[str, Any]:
-  module = Module.query.filter_by(key="resume").first()
+  module = get_catalog().modules_by_key.get("resume")
   if module is None:
     return recompute_and_persist_user_progress(user_id, commit=commit)
 
-  task = (
-    Task.query
-    .filter_by(module_id=module.id, is_active=True, challenge_id="resume_pass_threshold")
-    .first()
-  )
+  task = module.tasks_by_challenge_id.get("resume_pass_threshold")
   if task is None:
     return recompute_and_persist_user_progress(user_id, commit=commit)
 
@@ -323,4 +736,130 @@ def sync_resume_submission_progress(user_id: int, *, commit: bool = True) -> dic
   if not is_completed and completion is not None:
     db.session.delete(completion)
 
+  mark_user_progress_stale(user_id)
   return recompute_and_persist_user_progress(user_id, commit=commit)
+
+
+def _chunk_completed_weights(user_ids: list[int]) -> dict[int, dict[int, int]]:
+  positive_weight = db.case((Task.weight > 0, Task.weight), else_=0)
+  rows = (
+    db.session.query(UserTaskCompletion.user_id, Task.module_id, db.func.sum(positive_weight))
+    .join(Task, Task.id == UserTaskCompletion.task_id)
+    .filter(UserTaskCompletion.user_id.in_(user_ids), Task.is_active.is_(True))
+    .group_by(UserTaskCompletion.user_id, Task.module_id)
+    .all()
+  )
+  weights: dict[int, dict[int, int]] = {}
+  for user_id, module_id, completed_weight in rows:
+    weights.setdefault(user_id, {})[module_id] = int(completed_weight or 0)
+  return weights
+
+
+def _chunk_best_resume_scores(user_ids: list[int]) -> dict[int, int]:
+  rows = (
+    db.session.query(ResumeSubmission.user_id, db.func.max(ResumeSubmission.overall_score))
+    .filter(ResumeSubmission.user_id.in_(user_ids), ResumeSubmission.status == "succeeded")
+    .group_by(ResumeSubmission.user_id)
+    .all()
+  )
+  return {user_id: max(0, min(100, int(best or 0))) for user_id, best in rows}
+
+
+def bulk_recompute_user_progress(*, chunk_size: int = 1000, on_chunk: Callable[[int], None] | None = None) -> dict[str, int]:
+  """Recompute user_progress and user_module_progress for every user with set-based queries per chunk.
+
+  Completion weights and best resume scores are aggregated per (user, module) in SQL, scores are
+  derived from the catalog snapshot in memory, and rows are written back with bulk UPDATE/INSERT.
+  """
+  chunk_size = max(1, chunk_size)
+  catalog = get_catalog()
+  stats = {"users": 0, "updated": 0, "created": 0, "chunks": 0}
+  last_user_id = 0
+
+  while True:
+    user_ids = [
+      row[0]
+      for row in db.session.query(User.id)
+      .filter(User.id > last_user_id)
+      .order_by(User.id.asc())
+      .limit(chunk_size)
+      .all()
+    ]
+    if not user_ids:
+      break
+    last_user_id = user_ids[-1]
+
+    progress_rows = {
+      row.user_id: row
+      for row in db.session.query(
+        UserProgress.id,
+        UserProgress.user_id,
+        UserProgress.coding_override_score,
+        UserProgress.coding_override_source,
+      ).filter(UserProgress.user_id.in_(user_ids))
+    }
+    module_row_ids = {
+      (row.user_id, row.module_id): row.id
+      for row in db.session.query(
+        UserModuleProgress.id,
+        UserModuleProgress.user_id,
+        UserModuleProgress.module_id,
+      ).filter(UserModuleProgress.user_id.in_(user_ids))
+    }
+    weights = _chunk_completed_weights(user_ids)
+    resume_scores = _chunk_best_resume_scores(user_ids) if "resume" in catalog.modules_by_key else {}
+
+    updates: list[dict[str, Any]] = []
+    inserts: list[dict[str, Any]] = []
+    module_updates: list[dict[str, Any]] = []
+    module_inserts: list[dict[str, Any]] = []
+    for user_id in user_ids:
+      row = progress_rows.get(user_id)
+      states = _module_states_from_weights(
+        catalog,
+        completed_weight_by_module=weights.get(user_id, {}),
+        resume_score=resume_scores.get(user_id, 0),
+        coding_override=_coding_override(row.coding_override_score, row.coding_override_source) if row else None,
+      )
+      summary = _summarize_progress(states, catalog.modules)
+      values = {
+        "readiness_score": summary["progress"],
+        "category_coding": summary["category_readiness"]["coding"],
+        "category_projects": summary["category_readiness"]["projects"],
+        "category_resume": summary["category_readiness"]["resume"],
+        "needs_recompute": False,
+      }
+      if row is None:
+        inserts.append({"user_id": user_id, **values})
+      else:
+        updates.append({"id": row.id, **values})
+      for state in states:
+        module_values = {
+          "score": state.score,
+          "completed_weight": state.completed_weight,
+          "catalog_version": state.catalog_version,
+        }
+        module_row_id = module_row_ids.get((user_id, state.module_id))
+        if module_row_id is None:
+          module_inserts.append({"user_id": user_id, "module_id": state.module_id, **module_values})
+        else:
+          module_updates.append({"id": module_row_id, **module_values})
+
+    if updates:
+      db.session.execute(db.update(UserProgress), updates)
+    if inserts:
+      db.session.execute(db.insert(UserProgress), inserts)
+    if module_updates:
+      db.session.execute(db.update(UserModuleProgress), module_updates)
+    if module_inserts:
+      db.session.execute(db.insert(UserModuleProgress), module_inserts)
+    db.session.commit()
+
+    stats["users"] += len(user_ids)
+    stats["updated"] += len(updates)
+    stats["created"] += len(inserts)
+    stats["chunks"] += 1
+    if on_chunk is not None:
+      on_chunk(stats["users"])
+
+  return stats
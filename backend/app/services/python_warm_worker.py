@@ -0,0 +1,245 @@
+"""Warm Python worker started by ``app.services.executors``; standard library only.
+
+The process confines itself with ``local_sandbox`` (its own namespaces and a root holding only the
+system and Python directories), then reads length-prefixed JSON jobs on stdin. Each job forks into
+fresh PID, mount and IPC namespaces with a private /tmp and /proc, under an init that takes every
+process the job starts down with it, so each run skips interpreter startup without sharing state
+with the last one. The harness's own imports (json, time, traceback) are modules this worker loads
+anyway, so a job pays only for what the submission imports. Results go back as length-prefixed
+JSON on stdout.
+"""
+
+import builtins
+import io
+import json
+import math
+import os
+import resource
+import select
+import signal
+import struct
+import sys
+import tempfile
+import time
+import traceback
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import local_sandbox  # noqa: E402
+
+_HEADER = struct.Struct(">I")
+
+
+def _read_exact(fd, size):
+  chunks = []
+  while size:
+    chunk = os.read(fd, size)
+    if not chunk:
+      return None
+    chunks.append(chunk)
+    size -= len(chunk)
+  return b"".join(chunks)
+
+
+def _read_message(fd):
+  header = _read_exact(fd, _HEADER.size)
+  if header is None:
+    return None
+  body = _read_exact(fd, _HEADER.unpack(header)[0])
+  return None if body is None else json.loads(body)
+
+
+def _write_message(fd, payload):
+  body = json.dumps(payload).encode("utf-8")
+  view = memoryview(_HEADER.pack(len(body)) + body)
+  while view:
+    view = view[os.write(fd, view):]
+
+
+def _run_child(job, stdin_file, stdout_file, stderr_file, protocol_fds):
+  os.setsid()
+  for fd in protocol_fds:
+    os.close(fd)
+  os.chdir("/tmp")
+  os.dup2(stdin_file.fileno(), 0)
+  os.dup2(stdout_file.fileno(), 1)
+  os.dup2(stderr_file.fileno(), 2)
+
+  local_sandbox.confine(
+    cpu_seconds=max(1, math.ceil(job["cpu_time_limit"])),
+    memory_bytes=job["memory_bytes"],
+    output_bytes=job["output_bytes"],
+    max_processes=job["max_processes"],
+  )
+
+  sys.stdin = io.TextIOWrapper(io.FileIO(0, "r", closefd=False), encoding="utf-8")
+  sys.stdout = io.TextIOWrapper(io.FileIO(1, "w", closefd=False), encoding="utf-8")
+  sys.stderr = io.TextIOWrapper(io.FileIO(2, "w", closefd=False), encoding="utf-8")
+  sys.argv = ["main.py"]
+
+  status = 0
+  try:
+    code = compile(job["source"], "main.py", "exec")
+    exec(code, {"__name__": "__main__", "__builtins__": builtins})
+  except SystemExit as exc:
+    if exc.code is None or isinstance(exc.code, int):
+      status = exc.code or 0
+    else:
+      print(exc.code, file=sys.stderr)
+      status = 1
+  except BaseException:
+    traceback.print_exc()
+    status = 1
+  try:
+    sys.stdout.flush()
+    sys.stderr.flush()
+  except BaseException:
+    status = status or 1
+  os._exit(status & 0xFF)
+
+
+def _start_job(job, stdio, protocol_fds, status_fd):
+  """Runs in the job's forked process and never returns; the result arrives on ``status_fd``."""
+  try:
+    local_sandbox.unshare(local_sandbox.CLONE_NEWPID | local_sandbox.CLONE_NEWNS | local_sandbox.CLONE_NEWIPC)
+    local_sandbox.mount_tmp("/tmp")
+    init = os.fork()
+    if init == 0:
+      local_sandbox.die_with_parent()
+      local_sandbox.mount_proc()
+      local_sandbox.run_as_init(lambda: _run_child(job, *stdio, protocol_fds), status_fd)
+  except BaseException as err:
+    os.write(status_fd, json.dumps({"error": f"job sandbox failed: {err}"}).encode("utf-8"))
+    os._exit(70)
+  os.close(status_fd)
+  os.waitpid(init, 0)
+  os._exit(0)
+
+
+def _kill_group(pid):
+  try:
+    os.killpg(pid, signal.SIGKILL)
+  except OSError:
+    try:
+      os.kill(pid, signal.SIGKILL)
+    except OSError:
+      pass
+
+
+def _wait_for_exit(pid, timeout):
+  """Returns True if the child had to be killed at the wall-clock deadline."""
+  try:
+    pidfd = os.pidfd_open(pid)
+  except (AttributeError, OSError):
+    pidfd = None
+  if pidfd is not None:
+    try:
+      ready, _, _ = select.select([pidfd], [], [], timeout)
+    finally:
+      os.close(pidfd)
+    if ready:
+      return False
+  else:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+      if os.waitid(os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT) is not None:
+        return False
+      time.sleep(0.002)
+  _kill_group(pid)
+  return True
+
+
+def _read_capped(handle, limit):
+  handle.seek(0)
+  return handle.read(limit).decode("utf-8", errors="replace")
+
+
+def _run_job(job, protocol_fds):
+  with tempfile.TemporaryFile() as stdin_file, \
+      tempfile.TemporaryFile() as stdout_file, \
+      tempfile.TemporaryFile() as stderr_file:
+    stdin_file.write(job["stdin"].encode("utf-8"))
+    stdin_file.seek(0)
+
+    status_read, status_write = os.pipe()
+    started = time.monotonic()
+    pid = os.fork()
+    if pid == 0:
+      try:
+        os.setpgid(0, 0)
+        os.close(status_read)
+        _start_job(job, (stdin_file, stdout_file, stderr_file), protocol_fds, status_write)
+      finally:
+        os._exit(70)
+    try:
+      os.setpgid(pid, pid)
+    except OSError:
+      pass
+    os.close(status_write)
+
+    timed_out = _wait_for_exit(pid, job["wall_time_limit"])
+    _, _, usage = os.wait4(pid, 0)
+    wall_seconds = time.monotonic() - started
+    with os.fdopen(status_read, "rb") as status:
+      report = status.read()
+
+    if report:
+      outcome = json.loads(report)
+    elif timed_out:
+      # The job's init died with the group, so fall back to what the kernel charged the job process.
+      outcome = {"exit_code": -signal.SIGKILL, "cpu_seconds": usage.ru_utime + usage.ru_stime, "max_rss_kb": usage.ru_maxrss}
+    else:
+      outcome = {"error": "job sandbox exited without a result"}
+    if "error" in outcome:
+      return outcome
+
+    return {
+      "exit_code": outcome["exit_code"],
+      "timed_out": timed_out,
+      "cpu_seconds": outcome["cpu_seconds"],
+      "wall_seconds": wall_seconds,
+      "max_rss_kb": outcome["max_rss_kb"],
+      "stdout": _read_capped(stdout_file, job["output_bytes"]),
+      "stderr": _read_capped(stderr_file, job["output_bytes"]),
+    }
+
+
+def main():
+  # Keep the protocol off fds 0/1 so nothing a job prints can corrupt it.
+  protocol_in = os.dup(0)
+  protocol_out = os.dup(1)
+  devnull = os.open(os.devnull, os.O_RDWR)
+  os.dup2(devnull, 0)
+  os.dup2(devnull, 1)
+  os.close(devnull)
+  resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+
+  try:
+    local_sandbox.enter_namespaces()
+    pid = os.fork()
+  except OSError as err:
+    _write_message(protocol_out, {"ready": False, "error": f"sandbox: {err}"})
+    return
+  if pid != 0:
+    # Stays outside the worker's PID namespace only to wait for it.
+    os.close(protocol_in)
+    os.close(protocol_out)
+    os.waitpid(pid, 0)
+    return
+  try:
+    local_sandbox.die_with_parent()
+    # Mounted over /tmp in this private mount namespace, so nothing is created on the host.
+    local_sandbox.build_root(tempfile.gettempdir(), readonly_paths=(sys.base_prefix,))
+  except BaseException as err:
+    _write_message(protocol_out, {"ready": False, "error": f"sandbox: {err}"})
+    os._exit(1)
+
+  _write_message(protocol_out, {"ready": True})
+  while True:
+    job = _read_message(protocol_in)
+    if job is None:
+      return
+    _write_message(protocol_out, _run_job(job, (protocol_in, protocol_out)))
+
+
+if __name__ == "__main__":
+  main()
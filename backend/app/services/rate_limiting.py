@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_IDLE_TTL_SECONDS = 600.0
+# In-flight counts older than this are assumed to belong to a crashed worker and are reset.
+DEFAULT_IN_FLIGHT_STALE_SECONDS = 300.0
+
+
+@dataclass
+class _WindowState:
+  window_start: float
+  current: int
+  previous: int
+  touched_at: float
+
+
+def _sliding_window_decision(
+  state: _WindowState | None,
+  *,
+  limit: int,
+  window_seconds: float,
+  now: float,
+) -> tuple[_WindowState, int | None]:
+  """Sliding-window counter: O(1) state per key, weighting the previous window by overlap.
+
+  Returns the new state and, when the request is rejected, the seconds until it would pass.
+  """
+  window_start = math.floor(now / window_seconds) * window_seconds
+  if state is None or state.window_start < window_start - window_seconds:
+    current, previous = 0, 0
+  elif state.window_start < window_start:
+    current, previous = 0, state.current
+  else:
+    current, previous = state.current, state.previous
+
+  elapsed = now - window_start
+  if limit <= 0:
+    # A zero limit admits nothing; there is no count to wait out, so report the window length.
+    return _WindowState(window_start, current, previous, now), max(1, math.ceil(window_seconds))
+  estimate = previous * (1 - elapsed / window_seconds) + current
+  if estimate + 1 <= limit:
+    return _WindowState(window_start, current + 1, previous, now), None
+
+  allowed = limit - 1
+  if current > allowed:
+    # Even once this window becomes "previous" it must decay far enough to admit one more request.
+    wait = (window_start + window_seconds - now) + window_seconds * (1 - allowed / current)
+  else:
+    wait = window_seconds * (1 - (allowed - current) / previous) - elapsed
+  retry_after = max(1, math.ceil(wait))
+  return _WindowState(window_start, current, previous, now), retry_after
+
+
+class RateLimitBackend:
+  def hit(self, key: str, *, limit: int, window_seconds: float) -> int | None:
+    raise NotImplementedError
+
+  def acquire(self, key: str, *, limit: int) -> bool:
+    raise NotImplementedError
+
+  def release(self, key: str) -> None:
+    raise NotImplementedError
+
+  def evict_idle(self, *, idle_seconds: float) -> int:
+    raise NotImplementedError
+
+  def size(self) -> dict[str, int]:
+    raise NotImplementedError
+
+
+class InProcessRateLimitBackend(RateLimitBackend):
+  def __init__(self) -> None:
+    self._windows: dict[str, _WindowState] = {}
+    self._in_flight: dict[str, int] = {}
+    self._lock = threading.Lock()
+
+  def hit(self, key: str, *, limit: int, window_seconds: float) -> int | None:
+    now = time.time()
+    with self._lock:
+      state, retry_after = _sliding_window_decision(
+        self._windows.get(key),
+        limit=limit,
+        window_seconds=window_seconds,
+        now=now,
+      )
+      self._windows[key] = state
+    return retry_after
+
+  def acquire(self, key: str, *, limit: int) -> bool:
+    with self._lock:
+      current = self._in_flight.get(key, 0)
+      if current >= limit:
+        return False
+      self._in_flight[key] = current + 1
+    return True
+
+  def release(self, key: str) -> None:
+    with self._lock:
+      current = self._in_flight.get(key, 0)
+      if current <= 1:
+        self._in_flight.pop(key, None)
+      else:
+        self._in_flight[key] = current - 1
+
+  def evict_idle(self, *, idle_seconds: float) -> int:
+    cutoff = time.time() - idle_seconds
+    with self._lock:
+      stale = [key for key, state in self._windows.items() if state.touched_at < cutoff]
+      for key in stale:
+        del self._windows[key]
+    return len(stale)
+
+  def size(self) -> dict[str, int]:
+    with self._lock:
+      return {"window_keys": len(self._windows), "in_flight_keys": len(self._in_flight)}
+
+
+class SqliteRateLimitBackend(RateLimitBackend):
+  """Cross-process limiter state in a local SQLite file; writes serialize on the database lock."""
+
+  def __init__(self, path: str, *, in_flight_stale_seconds: float = DEFAULT_IN_FLIGHT_STALE_SECONDS):
+    self.path = path
+    self.in_flight_stale_seconds = in_flight_stale_seconds
+    self._local = threading.local()
+    conn = self._connection()
+    conn.execute(
+      "CREATE TABLE IF NOT EXISTS rate_limit_windows ("
+      " key TEXT PRIMARY KEY,"
+      " window_start REAL NOT NULL,"
+      " current INTEGER NOT NULL,"
+      " previous INTEGER NOT NULL,"
+      " touched_at REAL NOT NULL"
+      ")"
+    )
+    conn.execute(
+      "CREATE TABLE IF NOT EXISTS rate_limit_in_flight ("
+      " key TEXT PRIMARY KEY,"
+      " count INTEGER NOT NULL,"
+      " touched_at REAL NOT NULL"
+      ")"
+    )
+
+  def _connection(self) -> sqlite3.Connection:
+    conn = getattr(self._local, "conn", None)
+    if conn is None or getattr(self._local, "pid", None) != os.getpid():
+      conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+      conn.execute("PRAGMA journal_mode=WAL")
+      self._local.conn = conn
+      self._local.pid = os.getpid()
+    return conn
+
+  def hit(self, key: str, *, limit: int, window_seconds: float) -> int | None:
+    conn = self._connection()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+      row = conn.execute(
+        "SELECT window_start, current, previous, touched_at FROM rate_limit_windows WHERE key = ?",
+        (key,),
+      ).fetchone()
+      state, retry_after = _sliding_window_decision(
+        _WindowState(*row) if row else None,
+        limit=limit,
+        window_seconds=window_seconds,
+        now=time.time(),
+      )
+      conn.execute(
+        "INSERT OR REPLACE INTO rate_limit_windows (key, window_start, current, previous, touched_at)"
+        " VALUES (?, ?, ?, ?, ?)",
+        (key, state.window_start, state.current, state.previous, state.touched_at),
+      )
+      conn.execute("COMMIT")
+    except Exception:
+      conn.execute("ROLLBACK")
+      raise
+    return retry_after
+
+  def acquire(self, key: str, *, limit: int) -> bool:
+    conn = self._connection()
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+      row = conn.execute("SELECT count, touched_at FROM rate_limit_in_flight WHERE key = ?", (key,)).fetchone()
+      current = 0
+      if row is not None and now - row[1] < self.in_flight_stale_seconds:
+        current = int(row[0])
+      acquired = current < limit
+      if acquired:
+        conn.execute(
+          "INSERT OR REPLACE INTO rate_limit_in_flight (key, count, touched_at) VALUES (?, ?, ?)",
+          (key, current + 1, now),
+        )
+      conn.execute("COMMIT")
+    except Exception:
+      conn.execute("ROLLBACK")
+      raise
+    return acquired
+
+  def release(self, key: str) -> None:
+    conn = self._connection()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+      conn.execute(
+        "UPDATE rate_limit_in_flight SET count = count - 1, touched_at = ? WHERE key = ?",
+        (time.time(), key),
+      )
+      conn.execute("DELETE FROM rate_limit_in_flight WHERE key = ? AND count <= 0", (key,))
+      conn.execute("COMMIT")
+    except Exception:
+      conn.execute("ROLLBACK")
+      raise
+
+  def evict_idle(self, *, idle_seconds: float) -> int:
+    now = time.time()
+    conn = self._connection()
+    removed = conn.execute("DELETE FROM rate_limit_windows WHERE touched_at < ?", (now - idle_seconds,)).rowcount
+    conn.execute("DELETE FROM rate_limit_in_flight WHERE touched_at < ?", (now - self.in_flight_stale_seconds,))
+    return removed
+
+  def size(self) -> dict[str, int]:
+    conn = self._connection()
+    windows = conn.execute("SELECT COUNT(*) FROM rate_limit_windows").fetchone()[0]
+    in_flight = conn.execute("SELECT COUNT(*) FROM rate_limit_in_flight").fetchone()[0]
+    return {"window_keys": int(windows), "in_flight_keys": int(in_flight)}
+
+
+class RateLimiter:
+  """Per-user request limits and concurrency caps shared by the skills and resume endpoints."""
+
+  def __init__(
+    self,
+    backend: RateLimitBackend,
+    *,
+    idle_ttl_seconds: float = DEFAULT_IDLE_TTL_SECONDS,
+    eviction_interval_seconds: float = 60.0,
+  ):
+    self.backend = backend
+    self.idle_ttl_seconds = idle_ttl_seconds
+    self.eviction_interval_seconds = eviction_interval_seconds
+    self._next_eviction_at = time.monotonic() + eviction_interval_seconds
+    self._eviction_lock = threading.Lock()
+    self._stats = {"allowed": 0, "limited": 0, "evicted": 0}
+    self._stats_lock = threading.Lock()
+
+  def check(self, key: str, *, limit: int, window_seconds: float = 60.0) -> int | None:
+    self._maybe_evict()
+    retry_after = self.backend.hit(key, limit=limit, window_seconds=window_seconds)
+    self._count("allowed" if retry_after is None else "limited")
+    return retry_after
+
+  def acquire(self, key: str, *, limit: int) -> bool:
+    return self.backend.acquire(key, limit=limit)
+
+  def release(self, key: str) -> None:
+    self.backend.release(key)
+
+  def stats(self) -> dict[str, Any]:
+    with self._stats_lock:
+      snapshot: dict[str, Any] = dict(self._stats)
+    snapshot["backend"] = type(self.backend).__name__
+    snapshot.update(self.backend.size())
+    return snapshot
+
+  def _maybe_evict(self) -> None:
+    now = time.monotonic()
+    if now < self._next_eviction_at or not self._eviction_lock.acquire(blocking=False):
+      return
+    try:
+      self._next_eviction_at = now + self.eviction_interval_seconds
+      removed = self.backend.evict_idle(idle_seconds=self.idle_ttl_seconds)
+    finally:
+      self._eviction_lock.release()
+    self._count("evicted", removed)
+
+  def _count(self, name: str, amount: int = 1) -> None:
+    with self._stats_lock:
+      self._stats[name] += amount
+
+
+_RATE_LIMITER: RateLimiter | None = None
+_RATE_LIMITER_LOCK = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+  global _RATE_LIMITER
+
+  if _RATE_LIMITER is not None:
+    return _RATE_LIMITER
+  with _RATE_LIMITER_LOCK:
+    if _RATE_LIMITER is None:
+      sqlite_path = (os.getenv("RATE_LIMIT_SQLITE_PATH") or "").strip()
+      backend: RateLimitBackend = (
+        SqliteRateLimitBackend(sqlite_path) if sqlite_path else InProcessRateLimitBackend()
+      )
+      _RATE_LIMITER = RateLimiter(backend)
+  return _RATE_LIMITER
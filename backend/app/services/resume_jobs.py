@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Callable
+
+from ..extensions import db
+from ..models import ResumeSubmission
+
+logger = logging.getLogger(__name__)
+
+RESUME_JOB_WORKERS = int(os.getenv("RESUME_JOB_WORKERS") or 2)
+RESUME_JOB_POLL_SECONDS = float(os.getenv("RESUME_JOB_POLL_SECONDS") or 2.0)
+# A running job whose worker died is reclaimed after this long, up to MAX_RESUME_JOB_ATTEMPTS times.
+RESUME_JOB_STALE_SECONDS = float(os.getenv("RESUME_JOB_STALE_SECONDS") or 300.0)
+MAX_RESUME_JOB_ATTEMPTS = 3
+
+
+def claim_next_resume_job() -> ResumeSubmission | None:
+  """Atomically moves the oldest queued (or abandoned) submission to running and returns it.
+
+  Postgres skips rows locked by other workers; SQLite ignores FOR UPDATE, so the claim is a
+  compare-and-set UPDATE that only one worker can win.
+  """
+  stale_before = datetime.utcnow() - timedelta(seconds=RESUME_JOB_STALE_SECONDS)
+  claimable = db.or_(
+    ResumeSubmission.status == "queued",
+    db.and_(ResumeSubmission.status == "running", ResumeSubmission.claimed_at < stale_before),
+  )
+  while True:
+    candidate = (
+      db.session.query(ResumeSubmission.id, ResumeSubmission.status, ResumeSubmission.claimed_at)
+      .filter(claimable)
+      .order_by(ResumeSubmission.id.asc())
+      .limit(1)
+      .with_for_update(skip_locked=True)
+      .first()
+    )
+    if candidate is None:
+      db.session.rollback()
+      return None
+
+    claimed = (
+      db.session.query(ResumeSubmission)
+      .filter(
+        ResumeSubmission.id == candidate.id,
+        ResumeSubmission.status == candidate.status,
+        ResumeSubmission.claimed_at.is_(None)
+        if candidate.claimed_at is None
+        else ResumeSubmission.claimed_at == candidate.claimed_at,
+      )
+      .update(
+        {
+          "status": "running",
+          "claimed_at": datetime.utcnow(),
+          "attempts": ResumeSubmission.attempts + 1,
+        },
+        synchronize_session=False,
+      )
+    )
+    db.session.commit()
+    if claimed:
+      return db.session.get(ResumeSubmission, candidate.id, populate_existing=True)
+
+
+def process_next_resume_job(handler: Callable[[ResumeSubmission], None]) -> bool:
+  submission = claim_next_resume_job()
+  if submission is None:
+    return False
+  if submission.attempts > MAX_RESUME_JOB_ATTEMPTS:
+    submission.status = "failed"
+    submission.error_code = "resume_scoring_abandoned"
+    submission.error_message = "Resume scoring did not finish. Please try again."
+    submission.pdf_bytes = None
+    db.session.commit()
+    return True
+  handler(submission)
+  return True
+
+
+class ResumeJobWorkerPool:
+  """Background threads that drain the resume_submissions queue inside an app context."""
+
+  def __init__(self, app, handler: Callable[[ResumeSubmission], None], *, workers: int, poll_seconds: float):
+    self.app = app
+    self.handler = handler
+    self.workers = max(0, workers)
+    self.poll_seconds = poll_seconds
+    self._wakeup = threading.Event()
+    self._stopping = threading.Event()
+    self._threads: list[threading.Thread] = []
+    self._lock = threading.Lock()
+
+  def start(self) -> None:
+    with self._lock:
+      if self._threads:
+        return
+      for index in range(self.workers):
+        thread = threading.Thread(target=self._run, name=f"resume-job-{index}", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+  def notify(self) -> None:
+    self._wakeup.set()
+
+  def stop(self, timeout: float | None = None) -> None:
+    self._stopping.set()
+    self._wakeup.set()
+    for thread in self._threads:
+      thread.join(timeout)
+
+  def _run(self) -> None:
+    while not self._stopping.is_set():
+      self._wakeup.clear()
+      try:
+        with self.app.app_context():
+          while not self._stopping.is_set() and process_next_resume_job(self.handler):
+            pass
+      except Exception:
+        logger.exception("resume_job_worker_error")
+      self._wakeup.wait(self.poll_seconds)
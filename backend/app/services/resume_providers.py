@@ -3,12 +3,15 @@ from __future__ import annotations
 import base64
 import json
 import os
-from typing import Any
+from typing import Any, BinaryIO, Iterator
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
 
 DEFAULT_OPENAI_MODEL = "gpt-4.1"
+PDF_DATA_URL_PREFIX = "data:application/pdf;base64,"
+# A multiple of 3 so each chunk encodes to base64 without padding.
+BASE64_CHUNK_BYTES = 3 * 16 * 1024
 
 
 SYSTEM_PROMPT = """
@@ -268,12 +271,94 @@ class ResumeScoringProvider:
     *,
     resume_text: str,
     page_count: int,
-    pdf_bytes: bytes,
+    pdf_bytes: bytes | BinaryIO,
     file_name: str,
   ) -> dict[str, Any]:
     raise NotImplementedError
 
 
+class _PdfDataUrl:
+  """Payload value serialized as the PDF's base64 data URL, streamed from the file at encode time."""
+
+  def __repr__(self) -> str:
+    return "PDF_DATA_URL"
+
+
+PDF_DATA_URL = _PdfDataUrl()
+
+
+def _pdf_size(pdf: bytes | BinaryIO) -> int:
+  if isinstance(pdf, (bytes, bytearray, memoryview)):
+    return len(pdf)
+  pdf.seek(0, os.SEEK_END)
+  size = pdf.tell()
+  pdf.seek(0)
+  return size
+
+
+def _base64_chunks(pdf: bytes | BinaryIO) -> Iterator[bytes]:
+  if isinstance(pdf, (bytes, bytearray, memoryview)):
+    view = memoryview(pdf)
+    for offset in range(0, len(view), BASE64_CHUNK_BYTES):
+      yield base64.b64encode(view[offset:offset + BASE64_CHUNK_BYTES])
+    return
+  pdf.seek(0)
+  while True:
+    chunk = pdf.read(BASE64_CHUNK_BYTES)
+    if not chunk:
+      return
+    yield base64.b64encode(chunk)
+
+
+def _json_fragments(value: Any, out: list[Any]) -> None:
+  # Mirrors json.dumps' default separators; PDF_DATA_URL itself is kept as a fragment so the body
+  # is split around that value, never by searching serialized (user-controlled) text.
+  if value is PDF_DATA_URL:
+    out.append(json.dumps(PDF_DATA_URL_PREFIX)[:-1])
+    out.append(PDF_DATA_URL)
+    out.append('"')
+  elif isinstance(value, dict):
+    out.append("{")
+    for index, (key, item) in enumerate(value.items()):
+      if index:
+        out.append(", ")
+      out.append(json.dumps(str(key)))
+      out.append(": ")
+      _json_fragments(item, out)
+    out.append("}")
+  elif isinstance(value, (list, tuple)):
+    out.append("[")
+    for index, item in enumerate(value):
+      if index:
+        out.append(", ")
+      _json_fragments(item, out)
+    out.append("]")
+  else:
+    out.append(json.dumps(value))
+
+
+def encode_json_body(payload: dict[str, Any], *, pdf: bytes | BinaryIO | None = None) -> tuple[Iterator[bytes], int]:
+  """Serializes ``payload`` as chunks plus total length, streaming ``pdf`` as base64 at ``PDF_DATA_URL``."""
+  if pdf is None:
+    encoded = json.dumps(payload).encode("utf-8")
+    return iter((encoded,)), len(encoded)
+  fragments: list[Any] = []
+  _json_fragments(payload, fragments)
+  if fragments.count(PDF_DATA_URL) != 1:
+    raise ValueError("payload must contain PDF_DATA_URL exactly once when a pdf is given")
+  slot = fragments.index(PDF_DATA_URL)
+  prefix = "".join(fragments[:slot]).encode("utf-8")
+  suffix = "".join(fragments[slot + 1:]).encode("utf-8")
+  pdf_size = _pdf_size(pdf)
+
+  def _chunks() -> Iterator[bytes]:
+    yield prefix
+    yield from _base64_chunks(pdf)
+    yield suffix
+
+  return _chunks(), len(prefix) + 4 * ((pdf_size + 2) // 3) + len(suffix)
+
+
 def _request_json(
   *,
   method: str,
@@ -281,8 +366,10 @@ def _request_json(
   headers: dict[str, str],
   payload: dict[str, Any],
   timeout_seconds: float,
+  pdf: bytes | BinaryIO | None = None,
 ) -> Any:
-  data = json.dumps(payload).encode("utf-8")
+  data, content_length = encode_json_body(payload, pdf=pdf)
+  headers = {**headers, "Content-Length": str(content_length)}
   request = Request(url=url, method=method, headers=headers, data=data)
   try:
     with urlopen(request, timeout=timeout_seconds) as response:
@@ -364,10 +451,9 @@ class OpenAIResumeProvider(ResumeScoringProvider):
     *,
     resume_text: str,
     page_count: int,
-    pdf_bytes: bytes,
+    pdf_bytes: bytes | BinaryIO,
     file_name: str,
   ) -> dict[str, Any]:
-    encoded_pdf = base64.b64encode(pdf_bytes).decode("ascii")
     safe_name = file_name.strip() or "resume.pdf"
     payload: dict[str, Any] = {
       "model": self.model_name,
@@ -384,7 +470,7 @@ class OpenAIResumeProvider(ResumeScoringProvider):
             {
               "type": "input_file",
               "filename": safe_name,
-              "file_data": f"data:application/pdf;base64,{encoded_pdf}",
+              "file_data": PDF_DATA_URL,
             },
             {
               "type": "input_text",
@@ -403,6 +489,7 @@ class OpenAIResumeProvider(ResumeScoringProvider):
       },
       payload=payload,
       timeout_seconds=self.timeout_seconds,
+      pdf=pdf_bytes,
     )
     if not isinstance(response, dict):
       raise ResumeProviderError("Unexpected OpenAI response shape.")
@@ -418,9 +505,15 @@ class OpenAIResumeProvider(ResumeScoringProvider):
     return parsed
 
 
+def resume_scoring_provider_identity() -> tuple[str, str]:
+  """Returns the (provider, model) names ``build_resume_scoring_provider`` would use, from config alone."""
+  model_name = (os.getenv("RESUME_LLM_MODEL") or DEFAULT_OPENAI_MODEL).strip()
+  return OpenAIResumeProvider.provider_name, model_name
+
+
 def build_resume_scoring_provider() -> ResumeScoringProvider:
   api_key = (os.getenv("OPENAI_API_KEY") or "").strip()
   if not api_key:
     raise ResumeProviderError("OPENAI_API_KEY is required for resume scoring.")
-  model_name = (os.getenv("RESUME_LLM_MODEL") or DEFAULT_OPENAI_MODEL).strip()
+  _, model_name = resume_scoring_provider_identity()
   return OpenAIResumeProvider(api_key=api_key, model_name=model_name)
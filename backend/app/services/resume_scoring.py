@@ -1,16 +1,31 @@
 from __future__ import annotations
 
+import hashlib
 import io
-from dataclasses import dataclass
-from typing import Any
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from multiprocessing.reduction import DupFd
+from typing import Any, BinaryIO
 
 from pypdf import PdfReader
 
 from .resume_providers import ResumeProviderError, ResumeScoringProvider
 
+logger = logging.getLogger(__name__)
 
 MAX_RESUME_FILE_SIZE_BYTES = 5 * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 64 * 1024
 MAX_EXTRACTED_TEXT_CHARS = 18000
+MAX_EXTRACTED_PAGES = 10
+PDF_EXTRACTION_TIMEOUT_SECONDS = float(os.getenv("PDF_EXTRACTION_TIMEOUT_SECONDS") or 10.0)
+# 0 extracts in the calling thread (no isolation or timeout); useful for local development.
+PDF_EXTRACTION_WORKERS = int(os.getenv("PDF_EXTRACTION_WORKERS") or 2)
 PROMPT_VERSION = "resume_v1"
 PASS_THRESHOLD_SCORE = 80
 MAX_PROVIDER_ATTEMPTS = 2
@@ -50,11 +65,26 @@ class ResumeProviderRequestError(ResumeScoringError):
     super().__init__(message, code=code, status_code=502)
 
 
+@dataclass
+class SpooledUpload:
+  file: BinaryIO
+  size_bytes: int
+  sha256: str
+
+  def read_bytes(self) -> bytes:
+    self.file.seek(0)
+    return self.file.read()
+
+  def close(self) -> None:
+    self.file.close()
+
+
 @dataclass
 class PreparedResumeContent:
   text_for_prompt: str
   page_count: int
   extracted_char_count: int
+  page_timings_ms: list[float] = field(default_factory=list)
 
 
 @dataclass
@@ -113,25 +143,183 @@ def validate_pdf_upload(*, filename: str | None, mimetype: str | None, file_size
     raise ResumeValidationError("Please upload a PDF file.", code="invalid_file_type")
 
 
-def prepare_resume_content(pdf_bytes: bytes) -> PreparedResumeContent:
-  try:
-    reader = PdfReader(io.BytesIO(pdf_bytes))
-  except Exception as err:
-    raise ResumeExtractionError("Could not parse PDF file.") from err
+def hash_upload(stream: BinaryIO, *, max_bytes: int = MAX_RESUME_FILE_SIZE_BYTES) -> SpooledUpload:
+  """Hashes an upload Werkzeug has already spooled, in chunks, and rewinds it for reading.
 
-  page_count = len(reader.pages)
-  if page_count <= 0:
-    raise ResumeExtractionError("PDF does not contain readable pages.", code="pdf_has_no_pages")
+  The multipart parser keeps small parts in memory and larger ones in a temp file, so the stream
+  is used in place rather than copied again. Reading stops one byte past ``max_bytes``;
+  ``validate_pdf_upload`` then rejects it from the returned size.
+  """
+  digest = hashlib.sha256()
+  size_bytes = 0
+  while True:
+    chunk = stream.read(min(UPLOAD_CHUNK_BYTES, max_bytes + 1 - size_bytes))
+    if not chunk:
+      break
+    size_bytes += len(chunk)
+    if size_bytes > max_bytes:
+      break
+    digest.update(chunk)
+  stream.seek(0)
+  return SpooledUpload(file=stream, size_bytes=size_bytes, sha256=digest.hexdigest())
+
+
+def _extract_pages(pdf: bytes | BinaryIO, max_pages: int, max_chars: int) -> tuple[int, list[str], list[float]]:
+  """Extracts page text until ``max_chars`` is reached or ``max_pages`` have been read.
 
+  Runs inside the extraction pool, so it only takes and returns picklable values.
+  """
+  reader = PdfReader(io.BytesIO(pdf) if isinstance(pdf, bytes) else pdf)
+  page_count = len(reader.pages)
   pages_text: list[str] = []
-  for page in reader.pages:
+  page_timings_ms: list[float] = []
+  char_count = 0
+  for index in range(min(page_count, max_pages)):
+    started = time.perf_counter()
     try:
-      extracted = page.extract_text() or ""
+      extracted = reader.pages[index].extract_text() or ""
     except Exception:
       extracted = ""
+    page_timings_ms.append(round((time.perf_counter() - started) * 1000, 1))
     cleaned = extracted.strip()
     if cleaned:
       pages_text.append(cleaned)
+      char_count += len(cleaned)
+      if char_count >= max_chars:
+        break
+  return page_count, pages_text, page_timings_ms
+
+
+# Each extraction runs in its own short-lived process so a runaway parse can be killed without
+# touching anyone else's; the semaphore bounds how many run at once. Processes fork from a
+# forkserver that has this module preloaded, so starting one is cheap and never forks the
+# threaded web process itself.
+_EXTRACTION_SLOTS = threading.BoundedSemaphore(max(1, PDF_EXTRACTION_WORKERS))
+# Bound on process start-up alone, which is not charged to PDF_EXTRACTION_TIMEOUT_SECONDS.
+PDF_EXTRACTION_STARTUP_SECONDS = 30.0
+_EXTRACTION_CONTEXT: multiprocessing.context.BaseContext | None = None
+_EXTRACTION_CONTEXT_LOCK = threading.Lock()
+
+
+def _extraction_context() -> multiprocessing.context.BaseContext:
+  global _EXTRACTION_CONTEXT
+
+  with _EXTRACTION_CONTEXT_LOCK:
+    if _EXTRACTION_CONTEXT is None:
+      if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+      else:
+        context = multiprocessing.get_context("spawn")
+      _EXTRACTION_CONTEXT = context
+    return _EXTRACTION_CONTEXT
+
+
+class _InheritedFd:
+  """A descriptor handed to the extraction process when it starts, the way Connections are."""
+
+  def __init__(self, fd: int):
+    self.fd = fd
+
+  def __reduce__(self):
+    # Pickled inside Process.start(), so DupFd passes the fd along with the child's start-up.
+    return _InheritedFd._rebuild, (DupFd(self.fd),)
+
+  @staticmethod
+  def _rebuild(dup_fd) -> "_InheritedFd":
+    return _InheritedFd(dup_fd.detach())
+
+
+def _extract_in_child(conn, pdf_fd: _InheritedFd, max_pages: int, max_chars: int) -> None:
+  # Report the start first so the parent's deadline covers extraction only, not process start-up.
+  try:
+    conn.send(("started", None))
+    # The fd shares its offset with the parent's file, which waits for this process before reading.
+    with os.fdopen(pdf_fd.fd, "rb") as pdf:
+      pdf.seek(0)
+      conn.send(("ok", _extract_pages(pdf, max_pages, max_chars)))
+  except Exception as err:
+    conn.send(("error", f"{err.__class__.__name__}: {err}"))
+  finally:
+    conn.close()
+
+
+def _receive(conn, timeout: float) -> tuple[str, Any]:
+  if not conn.poll(timeout):
+    raise TimeoutError
+  return conn.recv()
+
+
+def _file_for_child(pdf: BinaryIO) -> tuple[BinaryIO, bool]:
+  """Returns a file with a real descriptor holding ``pdf`` and whether the caller must close it.
+
+  Werkzeug's on-disk spools (and SpooledTemporaryFile, which rolls over on ``fileno()``) are used
+  as they are; in-memory uploads are copied to a temp file in chunks.
+  """
+  try:
+    pdf.fileno()
+    return pdf, False
+  except (AttributeError, OSError, ValueError):
+    pass
+  spool = tempfile.TemporaryFile()
+  shutil.copyfileobj(pdf, spool, UPLOAD_CHUNK_BYTES)
+  spool.flush()
+  return spool, True
+
+
+def _run_extraction(pdf: BinaryIO) -> tuple[int, list[str], list[float]]:
+  if PDF_EXTRACTION_WORKERS <= 0:
+    return _extract_pages(pdf, MAX_EXTRACTED_PAGES, MAX_EXTRACTED_TEXT_CHARS)
+
+  context = _extraction_context()
+  with _EXTRACTION_SLOTS:
+    handle, owned = _file_for_child(pdf)
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    try:
+      # The child gets a duplicate of the descriptor and opens the PDF itself; no bytes are pickled.
+      process = context.Process(
+        target=_extract_in_child,
+        args=(child_conn, _InheritedFd(handle.fileno()), MAX_EXTRACTED_PAGES, MAX_EXTRACTED_TEXT_CHARS),
+        daemon=True,
+      )
+      process.start()
+    finally:
+      if owned:
+        handle.close()
+    # Only the child may hold the write end, so its exit shows up here as EOF.
+    child_conn.close()
+    try:
+      _receive(parent_conn, PDF_EXTRACTION_STARTUP_SECONDS)
+      kind, value = _receive(parent_conn, PDF_EXTRACTION_TIMEOUT_SECONDS)
+    except TimeoutError as err:
+      raise ResumeExtractionError("PDF took too long to process.", code="pdf_extraction_timeout") from err
+    except EOFError as err:
+      raise RuntimeError(f"PDF extraction process exited with code {process.exitcode}") from err
+    finally:
+      parent_conn.close()
+      if process.is_alive():
+        process.kill()
+      process.join()
+      pdf.seek(0)
+  if kind != "ok":
+    raise RuntimeError(value)
+  return value
+
+
+def prepare_resume_content(pdf: bytes | BinaryIO) -> PreparedResumeContent:
+  if isinstance(pdf, (bytes, bytearray, memoryview)):
+    pdf = io.BytesIO(pdf)
+  pdf.seek(0)
+  started = time.perf_counter()
+  try:
+    page_count, pages_text, page_timings_ms = _run_extraction(pdf)
+  except ResumeExtractionError:
+    raise
+  except Exception as err:
+    raise ResumeExtractionError("Could not parse PDF file.") from err
+
+  if page_count <= 0:
+    raise ResumeExtractionError("PDF does not contain readable pages.", code="pdf_has_no_pages")
 
   merged_text = "\n\n".join(pages_text).strip()
   if not merged_text:
@@ -140,14 +328,24 @@ def prepare_resume_content(pdf_bytes: bytes) -> PreparedResumeContent:
       code="pdf_text_extraction_empty",
     )
 
+  # Counts only the pages read before the budget was hit, not the whole document.
   extracted_char_count = len(merged_text)
   if extracted_char_count > MAX_EXTRACTED_TEXT_CHARS:
     merged_text = merged_text[:MAX_EXTRACTED_TEXT_CHARS]
 
+  logger.info(
+    "resume_pdf_extracted page_count=%s pages_read=%s chars=%s page_ms=%s elapsed_ms=%s",
+    page_count,
+    len(page_timings_ms),
+    extracted_char_count,
+    page_timings_ms,
+    int((time.perf_counter() - started) * 1000),
+  )
   return PreparedResumeContent(
     text_for_prompt=merged_text,
     page_count=page_count,
     extracted_char_count=extracted_char_count,
+    page_timings_ms=page_timings_ms,
   )
 
 
@@ -374,7 +572,7 @@ def score_prepared_resume(
   *,
   prepared_content: PreparedResumeContent,
   provider: ResumeScoringProvider,
-  pdf_bytes: bytes,
+  pdf_bytes: bytes | BinaryIO,
   file_name: str,
 ) -> ResumeScoringResult:
   llm_scores: dict[str, int] | None = None
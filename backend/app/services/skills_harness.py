@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable
 
 RESULT_MARKER = "__IR_RESULT__:"
+ERROR_MARKER = "__IR_ERROR__:"
+# Multi-case programs print ``TIME_MARKER<index>:<ms>`` before each result so cases are timed individually.
+TIME_MARKER = "__IR_TIME__:"
+
+# Families whose per-case cost is dominated by compilation; these run every case in one program.
+MULTI_CASE_FAMILIES = frozenset({"java", "kotlin", "rust", "swift", "csharp", "cpp", "c", "go", "typescript"})
 
 
 def format_case_preview(parameters: list[dict[str, str]], args: list[Any]) -> str:
@@ -14,6 +22,280 @@ def format_case_preview(parameters: list[dict[str, str]], args: list[Any]) -> st
   return ", ".join(parts)
 
 
+@dataclass(frozen=True)
+class _Frame:
+  """Static layout of a harness program around the user source for one language family."""
+
+  head: str
+  imports: str
+  helper_indent: str
+  main_open: str
+  body_indent: str
+  tail: str
+  call_prefix: str = ""
+
+
+_C_HEAD = "#include <stdio.h>\n#include <string.h>\n#include <stdlib.h>\n#include <time.h>\n\n"
+_CPP_HEAD = "#include <bits/stdc++.h>\nusing namespace std;\n\n"
+_CSHARP_HEAD = (
+  "using System;\n"
+  "using System.Collections;\n"
+  "using System.Collections.Generic;\n"
+  "using System.Globalization;\n"
+  "using System.Text;\n\n"
+)
+
+# Single-case frames: the call expression is spliced between ``call_prefix`` and ``tail``.
+# ``{c_type}`` and ``{c_emit}`` are resolved per return type when the template is compiled.
+_SINGLE_CASE_FRAMES: dict[str, _Frame] = {
+  "python": _Frame(
+    head="",
+    imports="import json\n\n",
+    helper_indent="",
+    main_open="def __internroute_main():\n",
+    body_indent="  ",
+    call_prefix="  __result = ",
+    tail=(
+      "\n  __payload = __internroute_to_json(__result)\n"
+      f"  print(\"{RESULT_MARKER}\" + __payload, end=\"\")\n\n"
+      "if __name__ == \"__main__\":\n"
+      "  __internroute_main()\n"
+    ),
+  ),
+  "javascript": _Frame(
+    head="",
+    imports="",
+    helper_indent="",
+    main_open="(function () {\n",
+    body_indent="    ",
+    call_prefix="    const __result = ",
+    tail=(
+      ";\n    const __payload = __internroute_to_json(__result);\n"
+      f"    process.stdout.write(\"{RESULT_MARKER}\" + __payload);\n"
+      "})();\n"
+    ),
+  ),
+  "java": _Frame(
+    head="",
+    imports="public class Main {\n",
+    helper_indent="  ",
+    main_open="  public static void main(String[] args) {\n",
+    body_indent="    ",
+    call_prefix="    Object __result = ",
+    tail=(
+      ";\n    String __payload = __internroute_to_json(__result);\n"
+      f"    System.out.print(\"{RESULT_MARKER}\" + __payload);\n"
+      "  }\n"
+      "}\n"
+    ),
+  ),
+  "cpp": _Frame(
+    head=_CPP_HEAD,
+    imports="",
+    helper_indent="",
+    main_open="int main() {\n  ios::sync_with_stdio(false);\n  cin.tie(nullptr);\n",
+    body_indent="  ",
+    call_prefix="  auto __result = ",
+    tail=(
+      ";\n  string __payload = __internroute_to_json(__result);\n"
+      f"  cout << \"{RESULT_MARKER}\" << __payload;\n"
+      "  return 0;\n"
+      "}\n"
+    ),
+  ),
+  "csharp": _Frame(
+    head=_CSHARP_HEAD,
+    imports="public class Program {\n",
+    helper_indent="  ",
+    main_open="  public static void Main() {\n",
+    body_indent="    ",
+    call_prefix="    object __result = ",
+    tail=(
+      ";\n    string __payload = __internroute_to_json(__result);\n"
+      f"    Console.Write(\"{RESULT_MARKER}\" + __payload);\n"
+      "  }\n"
+      "}\n"
+    ),
+  ),
+  "go": _Frame(
+    head="package main\n\nimport (\n\t\"encoding/json\"\n\t\"fmt\"\n)\n\n",
+    imports="",
+    helper_indent="",
+    main_open="func main() {\n",
+    body_indent="\t",
+    call_prefix="\t__result := ",
+    tail=(
+      "\n\t__payload := __internroute_to_json(__result)\n"
+      f"\tfmt.Print(\"{RESULT_MARKER}\" + __payload)\n"
+      "}\n"
+    ),
+  ),
+  "rust": _Frame(
+    head="",
+    imports="",
+    helper_indent="",
+    main_open="fn main() {\n",
+    body_indent="    ",
+    call_prefix="    let __result = ",
+    tail=(
+      ";\n    let __payload = __internroute_to_json(__result);\n"
+      f"    print!(\"{RESULT_MARKER}{{}}\", __payload);\n"
+      "}\n"
+    ),
+  ),
+  "kotlin": _Frame(
+    head="",
+    imports="",
+    helper_indent="",
+    main_open="fun main() {\n",
+    body_indent="",
+    call_prefix="val __result = ",
+    tail=(
+      "\nval __payload = __internroute_to_json(__result)\n"
+      f"print(\"{RESULT_MARKER}\" + __payload)\n"
+      "}\n"
+    ),
+  ),
+  "swift": _Frame(
+    head="import Foundation\n\n",
+    imports="",
+    helper_indent="",
+    main_open="",
+    body_indent="",
+    call_prefix="let __result = ",
+    tail=(
+      "\nlet __payload = __internroute_to_json(__result)\n"
+      f"print(\"{RESULT_MARKER}\" + __payload, terminator: \"\")\n"
+    ),
+  ),
+  "php": _Frame(
+    head="<?php\n",
+    imports="",
+    helper_indent="",
+    main_open="",
+    body_indent="",
+    call_prefix="$__result = ",
+    tail=(
+      ";\n$__payload = __internroute_to_json($__result);\n"
+      f"echo '{RESULT_MARKER}' . $__payload;\n"
+    ),
+  ),
+  "ruby": _Frame(
+    head="",
+    imports="",
+    helper_indent="",
+    main_open="",
+    body_indent="",
+    call_prefix="__result = ",
+    tail=(
+      "\n__payload = __internroute_to_json(__result)\n"
+      f"print(\"{RESULT_MARKER}\" + __payload)\n"
+    ),
+  ),
+  "c": _Frame(
+    head=_C_HEAD,
+    imports="",
+    helper_indent="",
+    main_open="int main(void) {\n",
+    body_indent="  ",
+    call_prefix="  {c_type} __result = ",
+    tail=";\n  {c_emit}\n  return 0;\n}\n",
+  ),
+}
+_SINGLE_CASE_FRAMES["typescript"] = _SINGLE_CASE_FRAMES["javascript"]
+
+# Multi-case frames: the per-case blocks from ``_multi_case_block`` go between ``main_open`` and ``tail``.
+_MULTI_CASE_FRAMES: dict[str, _Frame] = {
+  "python": _Frame(
+    head="",
+    imports="import json\nimport time\nimport traceback\n\n",
+    helper_indent="",
+    main_open="def __internroute_main():\n",
+    body_indent="  ",
+    tail="\nif __name__ == \"__main__\":\n  __internroute_main()\n",
+  ),
+  "javascript": _Frame(head="", imports="", helper_indent="", main_open="(function () {\n", body_indent="    ", tail="})();\n"),
+  "java": _Frame(
+    head="",
+    imports="public class Main {\n",
+    helper_indent="  ",
+    main_open="  public static void main(String[] args) {\n",
+    body_indent="    ",
+    tail="  }\n}\n",
+  ),
+  "cpp": _Frame(head=_CPP_HEAD, imports="", helper_indent="", main_open="int main() {\n", body_indent="  ", tail="  return 0;\n}\n"),
+  "csharp": _Frame(
+    head=_CSHARP_HEAD,
+    imports="public class Program {\n",
+    helper_indent="  ",
+    main_open="  public static void Main() {\n",
+    body_indent="    ",
+    tail="  }\n}\n",
+  ),
+  "go": _Frame(
+    head="package main\n\nimport (\n\t\"encoding/json\"\n\t\"fmt\"\n\t\"os\"\n\t\"time\"\n)\n\n",
+    imports="",
+    helper_indent="",
+    main_open="func main() {\n",
+    body_indent="\t",
+    tail="}\n",
+  ),
+  "rust": _Frame(head="", imports="", helper_indent="", main_open="fn main() {\n", body_indent="    ", tail="}\n"),
+  "kotlin": _Frame(head="", imports="", helper_indent="", main_open="fun main() {\n", body_indent="", tail="}\n"),
+  "swift": _Frame(head="import Foundation\n\n", imports="", helper_indent="", main_open="", body_indent="", tail=""),
+  "php": _Frame(head="<?php\n", imports="", helper_indent="", main_open="", body_indent="", tail=""),
+  "ruby": _Frame(head="", imports="", helper_indent="", main_open="", body_indent="", tail=""),
+  "c": _Frame(head=_C_HEAD, imports="", helper_indent="", main_open="int main(void) {\n", body_indent="  ", tail="  return 0;\n}\n"),
+}
+_MULTI_CASE_FRAMES["typescript"] = _MULTI_CASE_FRAMES["javascript"]
+
+
+@dataclass(frozen=True)
+class _HarnessTemplate:
+  head: str
+  # Everything between the user source and the per-request body: imports, serializer helpers, main().
+  middle: str
+  body_indent: str
+  call_prefix: str
+  tail: str
+
+
+def _compile_template(frame: _Frame, *, family: str, return_type: str) -> _HarnessTemplate:
+  serializer_helpers = _serializer_helpers_for_family(family=family, return_type=return_type)
+  call_prefix, tail = frame.call_prefix, frame.tail
+  if family == "c":
+    call_prefix = call_prefix.replace("{c_type}", _c_return_type_for_challenge(return_type))
+    tail = tail.replace("{c_emit}", _c_emit_call(return_type))
+  return _HarnessTemplate(
+    head=frame.head,
+    middle=(
+      "\n\n"
+      + frame.imports
+      + _indented_block(serializer_helpers, indent=frame.helper_indent)
+      + frame.main_open
+    ),
+    body_indent=frame.body_indent,
+    call_prefix=call_prefix,
+    tail=tail,
+  )
+
+
+@lru_cache(maxsize=None)
+def _single_case_template(family: str, return_type: str) -> _HarnessTemplate:
+  frame = _SINGLE_CASE_FRAMES.get(family)
+  if frame is None:
+    raise ValueError(f"Unsupported language family: {family}")
+  return _compile_template(frame, family=family, return_type=return_type)
+
+
+@lru_cache(maxsize=None)
+def _multi_case_template(family: str, return_type: str) -> _HarnessTemplate:
+  frame = _MULTI_CASE_FRAMES.get(family)
+  if frame is None:
+    raise ValueError(f"Unsupported language family: {family}")
+  return _compile_template(frame, family=family, return_type=return_type)
+
+
 def build_harness_source(
   *,
   family: str,
@@ -25,204 +307,242 @@ def build_harness_source(
 ) -> str:
   prelude, call_args = _call_args_and_prelude(family=family, parameters=parameters, args=args)
   call_expr = _call_expression(family=family, function_name=function_name, call_args=call_args)
-  serializer_helpers = _serializer_helpers_for_family(family=family, return_type=return_type)
+  template = _single_case_template(family, return_type)
+  return "".join(
+    (
+      template.head,
+      user_source,
+      template.middle,
+      _indented_block(prelude, indent=template.body_indent),
+      template.call_prefix,
+      call_expr,
+      template.tail,
+    )
+  )
 
-  if family == "python":
-    prelude_block = _indented_block(prelude, indent="  ")
-    helper_block = _indented_block(serializer_helpers, indent="")
-    return (
-      f"{user_source}\n\n"
-      "import json\n\n"
-      f"{helper_block}"
-      "def __internroute_main():\n"
-      f"{prelude_block}"
-      f"  __result = {call_expr}\n"
-      "  __payload = __internroute_to_json(__result)\n"
-      f"  print(\"{RESULT_MARKER}\" + __payload, end=\"\")\n\n"
-      "if __name__ == \"__main__\":\n"
-      "  __internroute_main()\n"
+
+def build_multi_case_harness_source(
+  *,
+  family: str,
+  function_name: str,
+  parameters: list[dict[str, str]],
+  return_type: str,
+  cases_args: list[list[Any]],
+  user_source: str,
+) -> str:
+  """Build one program that calls the user function once per case.
+
+  Each case prints ``RESULT_MARKER<index>:<json>`` on its own line, or ``ERROR_MARKER<index>``
+  when the call raised. Swift and C cannot trap runtime failures, so a crash there ends the run
+  and the remaining cases simply produce no marker.
+  """
+  template = _multi_case_template(family, return_type)
+  case_lines: list[str] = []
+  for index, args in enumerate(cases_args):
+    prelude, call_args = _call_args_and_prelude(family=family, parameters=parameters, args=args)
+    call_expr = _call_expression(family=family, function_name=function_name, call_args=call_args)
+    case_lines.extend(
+      _multi_case_block(family=family, return_type=return_type, index=index, prelude=prelude, call_expr=call_expr)
+    )
+  return "".join(
+    (
+      template.head,
+      user_source,
+      template.middle,
+      _indented_block(case_lines, indent=template.body_indent),
+      template.tail,
     )
+  )
+
+
+def _multi_case_block(
+  *,
+  family: str,
+  return_type: str,
+  index: int,
+  prelude: list[str],
+  call_expr: str,
+) -> list[str]:
+  result_prefix = f"{RESULT_MARKER}{index}:"
+  error_line = f"{ERROR_MARKER}{index}"
+  # Elapsed milliseconds around the call only, so argument setup is not charged to the case.
+  time_prefix = f"{TIME_MARKER}{index}:"
+
+  if family == "python":
+    return [
+      "try:",
+      *(f"  {line}" for line in prelude),
+      "  __started = time.perf_counter()",
+      f"  __result = {call_expr}",
+      f"  print(\"{time_prefix}\" + str(int((time.perf_counter() - __started) * 1000)), flush=True)",
+      f"  print(\"{result_prefix}\" + __internroute_to_json(__result), flush=True)",
+      "except Exception:",
+      "  traceback.print_exc()",
+      f"  print(\"{error_line}\", flush=True)",
+    ]
 
   if family in {"javascript", "typescript"}:
-    prelude_block = _indented_block(prelude, indent="    ")
-    helper_block = _indented_block(serializer_helpers, indent="")
-    return (
-      f"{user_source}\n\n"
-      f"{helper_block}"
-      "(function () {\n"
-      f"{prelude_block}"
-      f"    const __result = {call_expr};\n"
-      "    const __payload = __internroute_to_json(__result);\n"
-      f"    process.stdout.write(\"{RESULT_MARKER}\" + __payload);\n"
-      "})();\n"
-    )
+    return [
+      "try {",
+      *(f"    {line}" for line in prelude),
+      "    const __started = Date.now();",
+      f"    const __result = {call_expr};",
+      f"    process.stdout.write(\"{time_prefix}\" + (Date.now() - __started) + \"\\n\");",
+      f"    process.stdout.write(\"{result_prefix}\" + __internroute_to_json(__result) + \"\\n\");",
+      "} catch (__err) {",
+      "    process.stderr.write(String(__err) + \"\\n\");",
+      f"    process.stdout.write(\"{error_line}\\n\");",
+      "}",
+    ]
 
   if family == "java":
-    prelude_block = _indented_block(prelude, indent="    ")
-    helper_block = _indented_block(serializer_helpers, indent="  ")
-    return (
-      f"{user_source}\n\n"
-      "public class Main {\n"
-      f"{helper_block}"
-      "  public static void main(String[] args) {\n"
-      f"{prelude_block}"
-      f"    Object __result = {call_expr};\n"
-      "    String __payload = __internroute_to_json(__result);\n"
-      f"    System.out.print(\"{RESULT_MARKER}\" + __payload);\n"
-      "  }\n"
-      "}\n"
-    )
+    return [
+      "try {",
+      *(f"  {line}" for line in prelude),
+      "  long __started = System.nanoTime();",
+      f"  Object __result = {call_expr};",
+      f"  System.out.print(\"{time_prefix}\" + ((System.nanoTime() - __started) / 1000000L) + \"\\n\");",
+      f"  System.out.print(\"{result_prefix}\" + __internroute_to_json(__result) + \"\\n\");",
+      "} catch (Throwable __err) {",
+      "  __err.printStackTrace();",
+      f"  System.out.print(\"{error_line}\\n\");",
+      "}",
+      "System.out.flush();",
+    ]
 
   if family == "cpp":
-    prelude_block = _indented_block(prelude, indent="  ")
-    helper_block = _indented_block(serializer_helpers, indent="")
-    return (
-      "#include <bits/stdc++.h>\n"
-      "using namespace std;\n\n"
-      f"{user_source}\n\n"
-      f"{helper_block}"
-      "int main() {\n"
-      "  ios::sync_with_stdio(false);\n"
-      "  cin.tie(nullptr);\n"
-      f"{prelude_block}"
-      f"  auto __result = {call_expr};\n"
-      "  string __payload = __internroute_to_json(__result);\n"
-      f"  cout << \"{RESULT_MARKER}\" << __payload;\n"
-      "  return 0;\n"
-      "}\n"
-    )
+    return [
+      "try {",
+      *(f"  {line}" for line in prelude),
+      "  auto __started = chrono::steady_clock::now();",
+      f"  auto __result = {call_expr};",
+      f"  cout << \"{time_prefix}\" << chrono::duration_cast<chrono::milliseconds>(chrono::steady_clock::now() - __started).count() << endl;",
+      f"  cout << \"{result_prefix}\" << __internroute_to_json(__result) << endl;",
+      "} catch (const exception &__err) {",
+      "  cerr << __err.what() << endl;",
+      f"  cout << \"{error_line}\" << endl;",
+      "} catch (...) {",
+      "  cerr << \"Unknown exception\" << endl;",
+      f"  cout << \"{error_line}\" << endl;",
+      "}",
+    ]
 
   if family == "csharp":
-    prelude_block = _indented_block(prelude, indent="    ")
-    helper_block = _indented_block(serializer_helpers, indent="  ")
-    return (
-      "using System;\n"
-      "using System.Collections;\n"
-      "using System.Collections.Generic;\n"
-      "using System.Globalization;\n"
-      "using System.Text;\n\n"
-      f"{user_source}\n\n"
-      "public class Program {\n"
-      f"{helper_block}"
-      "  public static void Main() {\n"
-      f"{prelude_block}"
-      f"    object __result = {call_expr};\n"
-      "    string __payload = __internroute_to_json(__result);\n"
-      f"    Console.Write(\"{RESULT_MARKER}\" + __payload);\n"
-      "  }\n"
-      "}\n"
-    )
+    return [
+      "try {",
+      *(f"  {line}" for line in prelude),
+      "  var __started = System.Diagnostics.Stopwatch.StartNew();",
+      f"  object __result = {call_expr};",
+      f"  Console.Write(\"{time_prefix}\" + __started.ElapsedMilliseconds + \"\\n\");",
+      f"  Console.Write(\"{result_prefix}\" + __internroute_to_json(__result) + \"\\n\");",
+      "} catch (Exception __err) {",
+      "  Console.Error.WriteLine(__err.ToString());",
+      f"  Console.Write(\"{error_line}\\n\");",
+      "}",
+    ]
 
   if family == "go":
-    prelude_block = _indented_block(prelude, indent="\t")
-    helper_block = _indented_block(serializer_helpers, indent="")
-    return (
-      "package main\n\n"
-      "import (\n"
-      "\t\"encoding/json\"\n"
-      "\t\"fmt\"\n"
-      ")\n\n"
-      f"{user_source}\n\n"
-      f"{helper_block}"
-      "func main() {\n"
-      f"{prelude_block}"
-      f"\t__result := {call_expr}\n"
-      "\t__payload := __internroute_to_json(__result)\n"
-      f"\tfmt.Print(\"{RESULT_MARKER}\" + __payload)\n"
-      "}\n"
-    )
+    return [
+      "func() {",
+      "\tdefer func() {",
+      "\t\tif __err := recover(); __err != nil {",
+      "\t\t\tfmt.Fprintln(os.Stderr, __err)",
+      f"\t\t\tfmt.Print(\"{error_line}\\n\")",
+      "\t\t}",
+      "\t}()",
+      *(f"\t{line}" for line in prelude),
+      "\t__started := time.Now()",
+      f"\t__result := {call_expr}",
+      f"\tfmt.Printf(\"{time_prefix}%d\\n\", time.Since(__started).Milliseconds())",
+      f"\tfmt.Print(\"{result_prefix}\" + __internroute_to_json(__result) + \"\\n\")",
+      "}()",
+    ]
 
   if family == "rust":
-    prelude_block = _indented_block(prelude, indent="    ")
-    helper_block = _indented_block(serializer_helpers, indent="")
-    return (
-      f"{user_source}\n\n"
-      f"{helper_block}"
-      "fn main() {\n"
-      f"{prelude_block}"
-      f"    let __result = {call_expr};\n"
-      "    let __payload = __internroute_to_json(__result);\n"
-      f"    print!(\"{RESULT_MARKER}{{}}\", __payload);\n"
-      "}\n"
-    )
+    return [
+      "{",
+      *(f"    {line}" for line in prelude),
+      "    let __started = std::time::Instant::now();",
+      f"    match std::panic::catch_unwind(|| {call_expr}) {{",
+      "        Ok(__result) => {",
+      f"            println!(\"{time_prefix}{{}}\", __started.elapsed().as_millis());",
+      f"            println!(\"{result_prefix}{{}}\", __internroute_to_json(__result));",
+      "        }",
+      f"        Err(_) => println!(\"{error_line}\"),",
+      "    }",
+      "}",
+    ]
 
   if family == "kotlin":
-    prelude_block = _indented_block(prelude, indent="")
-    helper_block = _indented_block(serializer_helpers, indent="")
-    return (
-      f"{user_source}\n\n"
-      f"{helper_block}"
-      "fun main() {\n"
-      f"{prelude_block}"
-      f"val __result = {call_expr}\n"
-      "val __payload = __internroute_to_json(__result)\n"
-      f"print(\"{RESULT_MARKER}\" + __payload)\n"
-      "}\n"
-    )
+    return [
+      "try {",
+      *prelude,
+      "val __started = System.nanoTime()",
+      f"val __result = {call_expr}",
+      f"print(\"{time_prefix}\" + ((System.nanoTime() - __started) / 1000000L) + \"\\n\")",
+      f"print(\"{result_prefix}\" + __internroute_to_json(__result) + \"\\n\")",
+      "} catch (__err: Throwable) {",
+      "System.err.println(__err.toString())",
+      f"print(\"{error_line}\\n\")",
+      "}",
+      "System.out.flush()",
+    ]
 
   if family == "swift":
-    prelude_block = _indented_block(prelude, indent="")
-    helper_block = _indented_block(serializer_helpers, indent="")
-    return (
-      "import Foundation\n\n"
-      f"{user_source}\n\n"
-      f"{helper_block}"
-      f"{prelude_block}"
-      f"let __result = {call_expr}\n"
-      "let __payload = __internroute_to_json(__result)\n"
-      f"print(\"{RESULT_MARKER}\" + __payload, terminator: \"\")\n"
-    )
+    return [
+      "do {",
+      *prelude,
+      "let __started = Date()",
+      f"let __result = {call_expr}",
+      f"print(\"{time_prefix}\" + String(Int(Date().timeIntervalSince(__started) * 1000)))",
+      f"print(\"{result_prefix}\" + __internroute_to_json(__result))",
+      "fflush(stdout)",
+      "}",
+    ]
 
   if family == "php":
-    prelude_block = _indented_block(prelude, indent="")
-    helper_block = _indented_block(serializer_helpers, indent="")
-    return (
-      "<?php\n"
-      f"{user_source}\n\n"
-      f"{helper_block}"
-      f"{prelude_block}"
-      f"$__result = {call_expr};\n"
-      "$__payload = __internroute_to_json($__result);\n"
-      f"echo '{RESULT_MARKER}' . $__payload;\n"
-    )
+    return [
+      "try {",
+      *(f"  {line}" for line in prelude),
+      "  $__started = microtime(true);",
+      f"  $__result = {call_expr};",
+      f"  echo '{time_prefix}' . (int) ((microtime(true) - $__started) * 1000) . \"\\n\";",
+      f"  echo '{result_prefix}' . __internroute_to_json($__result) . \"\\n\";",
+      "} catch (\\Throwable $__err) {",
+      "  fwrite(STDERR, (string) $__err . \"\\n\");",
+      f"  echo \"{error_line}\\n\";",
+      "}",
+    ]
 
   if family == "ruby":
-    prelude_block = _indented_block(prelude, indent="")
-    helper_block = _indented_block(serializer_helpers, indent="")
-    return (
-      f"{user_source}\n\n"
-      f"{helper_block}"
-      f"{prelude_block}"
-      f"__result = {call_expr}\n"
-      "__payload = __internroute_to_json(__result)\n"
-      f"print(\"{RESULT_MARKER}\" + __payload)\n"
-    )
+    return [
+      "begin",
+      *(f"  {line}" for line in prelude),
+      "  __started = Process.clock_gettime(Process::CLOCK_MONOTONIC)",
+      f"  __result = {call_expr}",
+      f"  print(\"{time_prefix}\" + ((Process.clock_gettime(Process::CLOCK_MONOTONIC) - __started) * 1000).to_i.to_s + \"\\n\")",
+      f"  print(\"{result_prefix}\" + __internroute_to_json(__result) + \"\\n\")",
+      "rescue StandardError, SystemStackError => __err",
+      "  $stderr.puts(\"#{__err.class}: #{__err.message}\")",
+      f"  print(\"{error_line}\\n\")",
+      "end",
+      "$stdout.flush",
+    ]
 
   if family == "c":
-    prelude_block = _indented_block(prelude, indent="  ")
     c_return_type = _c_return_type_for_challenge(return_type)
-    helper_block = _indented_block(serializer_helpers, indent="")
-    if return_type == "string":
-      c_emit = "__internroute_emit_result_string(__result);"
-    elif return_type == "int":
-      c_emit = "__internroute_emit_result_int(__result);"
-    elif return_type == "float":
-      c_emit = "__internroute_emit_result_float(__result);"
-    else:
-      raise ValueError(f"Unsupported return type for C challenge: {return_type}")
-    return (
-      "#include <stdio.h>\n"
-      "#include <string.h>\n"
-      "#include <stdlib.h>\n\n"
-      f"{user_source}\n\n"
-      f"{helper_block}"
-      "int main(void) {\n"
-      f"{prelude_block}"
-      f"  {c_return_type} __result = {call_expr};\n"
-      f"  {c_emit}\n"
-      "  return 0;\n"
-      "}\n"
-    )
+    return [
+      "{",
+      *(f"  {line}" for line in prelude),
+      "  clock_t __started = clock();",
+      f"  {c_return_type} __result = {call_expr};",
+      f"  printf(\"{time_prefix}%ld\\n\", (long) ((clock() - __started) * 1000 / CLOCKS_PER_SEC));",
+      f"  printf(\"%s{index}:\", __internroute_marker);",
+      f"  {_c_write_call(return_type)}",
+      "  printf(\"\\n\");",
+      "  fflush(stdout);",
+      "}",
+    ]
 
   raise ValueError(f"Unsupported language family: {family}")
 
@@ -540,9 +860,9 @@ def _c_serializer_block(return_type: str) -> list[str]:
     return [
       f"static const char *__internroute_marker = \"{RESULT_MARKER}\";",
       "",
-      "static void __internroute_emit_result_string(const char *value) {",
+      "static void __internroute_write_string(const char *value) {",
       "  const char *next = value == NULL ? \"\" : value;",
-      "  printf(\"%s\\\"\", __internroute_marker);",
+      "  printf(\"\\\"\");",
       "  while (*next) {",
       "    if (*next == '\\\\') printf(\"\\\\\\\\\");",
       "    else if (*next == '\\\"') printf(\"\\\\\\\\\\\\\\\"\");",
@@ -555,14 +875,24 @@ def _c_serializer_block(return_type: str) -> list[str]:
       "  printf(\"\\\"\");",
       "}",
       "",
+      "static void __internroute_emit_result_string(const char *value) {",
+      "  printf(\"%s\", __internroute_marker);",
+      "  __internroute_write_string(value);",
+      "}",
+      "",
     ]
 
   if return_type == "int":
     return [
       f"static const char *__internroute_marker = \"{RESULT_MARKER}\";",
       "",
+      "static void __internroute_write_int(int value) {",
+      "  printf(\"%d\", value);",
+      "}",
+      "",
       "static void __internroute_emit_result_int(int value) {",
-      "  printf(\"%s%d\", __internroute_marker, value);",
+      "  printf(\"%s\", __internroute_marker);",
+      "  __internroute_write_int(value);",
       "}",
       "",
     ]
@@ -571,8 +901,13 @@ def _c_serializer_block(return_type: str) -> list[str]:
     return [
       f"static const char *__internroute_marker = \"{RESULT_MARKER}\";",
       "",
+      "static void __internroute_write_float(double value) {",
+      "  printf(\"%.15g\", value);",
+      "}",
+      "",
       "static void __internroute_emit_result_float(double value) {",
-      "  printf(\"%s%.15g\", __internroute_marker, value);",
+      "  printf(\"%s\", __internroute_marker);",
+      "  __internroute_write_float(value);",
       "}",
       "",
     ]
@@ -580,6 +915,26 @@ def _c_serializer_block(return_type: str) -> list[str]:
   raise ValueError(f"Unsupported return type for C serializer: {return_type}")
 
 
+def _c_emit_call(return_type: str) -> str:
+  if return_type == "string":
+    return "__internroute_emit_result_string(__result);"
+  if return_type == "int":
+    return "__internroute_emit_result_int(__result);"
+  if return_type == "float":
+    return "__internroute_emit_result_float(__result);"
+  raise ValueError(f"Unsupported return type for C challenge: {return_type}")
+
+
+def _c_write_call(return_type: str) -> str:
+  if return_type == "string":
+    return "__internroute_write_string(__result);"
+  if return_type == "int":
+    return "__internroute_write_int(__result);"
+  if return_type == "float":
+    return "__internroute_write_float(__result);"
+  raise ValueError(f"Unsupported return type for C challenge: {return_type}")
+
+
 def _c_return_type_for_challenge(return_type: str) -> str:
   if return_type == "string":
     return "const char *"
@@ -632,35 +987,18 @@ def _call_args_and_prelude(
 
 
 def _literal_for_family(*, family: str, param_type: str, value: Any) -> str:
-  if family == "python":
-    return _python_literal(param_type, value)
-  if family in {"javascript", "typescript"}:
-    return _js_literal(param_type, value)
-  if family == "java":
-    return _java_literal(param_type, value)
-  if family == "cpp":
-    return _cpp_literal(param_type, value)
-  if family == "csharp":
-    return _csharp_literal(param_type, value)
-  if family == "go":
-    return _go_literal(param_type, value)
-  if family == "rust":
-    return _rust_literal(param_type, value)
-  if family == "kotlin":
-    return _kotlin_literal(param_type, value)
-  if family == "swift":
-    return _swift_literal(param_type, value)
-  if family == "php":
-    return _php_literal(param_type, value)
-  if family == "ruby":
-    return _ruby_literal(param_type, value)
-  if family == "c":
-    if param_type == "string":
-      return _c_string_literal(str(value))
-    if param_type == "int":
-      return str(int(value))
-    raise ValueError(f"Unsupported C parameter type for direct literal: {param_type}")
-  raise ValueError(f"Unsupported language family: {family}")
+  literal = _LITERAL_BUILDERS.get(family)
+  if literal is None:
+    raise ValueError(f"Unsupported language family: {family}")
+  return literal(param_type, value)
+
+
+def _c_literal(param_type: str, value: Any) -> str:
+  if param_type == "string":
+    return _c_string_literal(str(value))
+  if param_type == "int":
+    return str(int(value))
+  raise ValueError(f"Unsupported C parameter type for direct literal: {param_type}")
 
 
 def _python_literal(param_type: str, value: Any) -> str:
@@ -808,6 +1146,23 @@ def _ruby_literal(param_type: str, value: Any) -> str:
   raise ValueError(f"Unsupported parameter type: {param_type}")
 
 
+_LITERAL_BUILDERS: dict[str, Callable[[str, Any], str]] = {
+  "python": _python_literal,
+  "javascript": _js_literal,
+  "typescript": _js_literal,
+  "java": _java_literal,
+  "cpp": _cpp_literal,
+  "csharp": _csharp_literal,
+  "go": _go_literal,
+  "rust": _rust_literal,
+  "kotlin": _kotlin_literal,
+  "swift": _swift_literal,
+  "php": _php_literal,
+  "ruby": _ruby_literal,
+  "c": _c_literal,
+}
+
+
 def _validate_param_value(param_type: str, value: Any) -> None:
   if param_type == "string" and isinstance(value, str):
     return
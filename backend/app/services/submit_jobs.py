@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+
+from ..extensions import db
+from ..models import ChallengeSubmissionJob
+
+logger = logging.getLogger(__name__)
+
+# Submit jobs run in the executor of the process that accepted them. That process heartbeats every
+# job it still holds, queued or running; a job whose heartbeat stops (its process restarted or died)
+# is failed by whichever process sweeps next.
+SUBMIT_JOB_HEARTBEAT_SECONDS = float(os.getenv("SUBMIT_JOB_HEARTBEAT_SECONDS") or 30.0)
+SUBMIT_JOB_STALE_SECONDS = float(os.getenv("SUBMIT_JOB_STALE_SECONDS") or 180.0)
+_ACTIVE_STATUSES = ("queued", "running")
+
+_OWNED_JOB_IDS: set[str] = set()
+_OWNED_JOB_IDS_LOCK = threading.Lock()
+
+
+def own_submit_job(job_id: str) -> None:
+  with _OWNED_JOB_IDS_LOCK:
+    _OWNED_JOB_IDS.add(job_id)
+
+
+def release_submit_job(job_id: str) -> None:
+  with _OWNED_JOB_IDS_LOCK:
+    _OWNED_JOB_IDS.discard(job_id)
+
+
+def sweep_submit_jobs(now: datetime | None = None) -> int:
+  """Heartbeats the jobs this process holds, then fails active jobs whose heartbeat went stale.
+
+  Returns the number of jobs failed. Rows from before heartbeats existed fall back to created_at.
+  """
+  now = now or datetime.utcnow()
+  with _OWNED_JOB_IDS_LOCK:
+    owned = list(_OWNED_JOB_IDS)
+  active = ChallengeSubmissionJob.status.in_(_ACTIVE_STATUSES)
+  if owned:
+    (
+      db.session.query(ChallengeSubmissionJob)
+      .filter(active, ChallengeSubmissionJob.id.in_(owned))
+      .update({"heartbeat_at": now}, synchronize_session=False)
+    )
+
+  stale_before = now - timedelta(seconds=SUBMIT_JOB_STALE_SECONDS)
+  expired = (
+    db.session.query(ChallengeSubmissionJob)
+    .filter(
+      active,
+      db.or_(
+        ChallengeSubmissionJob.heartbeat_at < stale_before,
+        db.and_(ChallengeSubmissionJob.heartbeat_at.is_(None), ChallengeSubmissionJob.created_at < stale_before),
+      ),
+    )
+    .update(
+      {
+        "status": "failed",
+        "error_code": "submit_job_abandoned",
+        "error_message": "The grader stopped before finishing this submission. Please submit again.",
+      },
+      synchronize_session=False,
+    )
+  )
+  db.session.commit()
+  if expired:
+    logger.warning("skills_submit_jobs_abandoned count=%s", expired)
+  return expired
+
+
+class SubmitJobSweeper:
+  """One background thread per process that runs ``sweep_submit_jobs`` inside an app context."""
+
+  def __init__(self, app, *, interval_seconds: float = SUBMIT_JOB_HEARTBEAT_SECONDS):
+    self.app = app
+    self.interval_seconds = interval_seconds
+    self._stopping = threading.Event()
+    self._thread: threading.Thread | None = None
+    self._lock = threading.Lock()
+
+  def start(self) -> None:
+    with self._lock:
+      if self._thread is not None:
+        return
+      self._thread = threading.Thread(target=self._run, name="skills-submit-sweeper", daemon=True)
+      self._thread.start()
+
+  def stop(self, timeout: float | None = None) -> None:
+    self._stopping.set()
+    if self._thread is not None:
+      self._thread.join(timeout)
+
+  def _run(self) -> None:
+    while not self._stopping.is_set():
+      try:
+        with self.app.app_context():
+          sweep_submit_jobs()
+      except Exception:
+        logger.exception("skills_submit_job_sweep_error")
+      self._stopping.wait(self.interval_seconds)
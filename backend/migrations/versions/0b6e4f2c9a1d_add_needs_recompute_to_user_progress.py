@@ -0,0 +1,28 @@
+"""add needs_recompute to user_progress
+
+Revision ID: 0b6e4f2c9a1d
+Revises: 5d2e8f1a7c3b
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0b6e4f2c9a1d"
+down_revision = "5d2e8f1a7c3b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows start stale so the first dashboard read after deploy rewrites them once.
+    op.add_column(
+        "user_progress",
+        sa.Column("needs_recompute", sa.Boolean(), nullable=False, server_default=sa.text("true")),
+    )
+
+
+def downgrade():
+    op.drop_column("user_progress", "needs_recompute")
@@ -0,0 +1,36 @@
+"""add user_module_progress table
+
+Revision ID: 1c7a3e5b8d20
+Revises: 0b6e4f2c9a1d
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "1c7a3e5b8d20"
+down_revision = "0b6e4f2c9a1d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "user_module_progress",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("module_id", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completed_weight", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["module_id"], ["modules.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "module_id", name="uq_user_module_progress"),
+    )
+
+
+def downgrade():
+    op.drop_table("user_module_progress")
@@ -0,0 +1,27 @@
+"""index user_module_progress by module and score
+
+Revision ID: 3a8d6c1f0e92
+Revises: 1c7a3e5b8d20
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "3a8d6c1f0e92"
+down_revision = "1c7a3e5b8d20"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_user_module_progress_module_score",
+        "user_module_progress",
+        ["module_id", "score"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_user_module_progress_module_score", table_name="user_module_progress")
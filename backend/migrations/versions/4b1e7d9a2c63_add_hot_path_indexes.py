@@ -0,0 +1,52 @@
+"""add indexes for per-user hot paths
+
+Revision ID: 4b1e7d9a2c63
+Revises: 3a8d6c1f0e92
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4b1e7d9a2c63"
+down_revision = "3a8d6c1f0e92"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_resume_submissions_user_status_score",
+        "resume_submissions",
+        ["user_id", "status", "overall_score"],
+    )
+    op.create_index(
+        "ix_resume_submissions_user_created",
+        "resume_submissions",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_project_submissions_user_status",
+        "project_submissions",
+        ["user_id", "status"],
+    )
+    op.create_index(
+        "ix_project_submissions_user_created",
+        "project_submissions",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_tasks_module_challenge_active",
+        "tasks",
+        ["module_id", "challenge_id", "is_active"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_tasks_module_challenge_active", table_name="tasks")
+    op.drop_index("ix_project_submissions_user_created", table_name="project_submissions")
+    op.drop_index("ix_project_submissions_user_status", table_name="project_submissions")
+    op.drop_index("ix_resume_submissions_user_created", table_name="resume_submissions")
+    op.drop_index("ix_resume_submissions_user_status_score", table_name="resume_submissions")
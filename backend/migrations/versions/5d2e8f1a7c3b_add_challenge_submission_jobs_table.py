@@ -0,0 +1,47 @@
+"""add challenge_submission_jobs table
+
+Revision ID: 5d2e8f1a7c3b
+Revises: 6f3c1b9e2d7a
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5d2e8f1a7c3b"
+down_revision = "6f3c1b9e2d7a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "challenge_submission_jobs",
+        sa.Column("id", sa.String(length=32), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("challenge_id", sa.String(length=64), nullable=False),
+        sa.Column("language_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False, server_default="queued"),
+        sa.Column("total_cases", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("case_results_json", sa.Text(), nullable=True),
+        sa.Column("result_json", sa.Text(), nullable=True),
+        sa.Column("error_code", sa.String(length=64), nullable=True),
+        sa.Column("error_message", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_challenge_submission_jobs_user_created",
+        "challenge_submission_jobs",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_challenge_submission_jobs_user_created", table_name="challenge_submission_jobs")
+    op.drop_table("challenge_submission_jobs")
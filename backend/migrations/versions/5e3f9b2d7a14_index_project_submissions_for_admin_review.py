@@ -0,0 +1,34 @@
+"""index project_submissions for the admin review listing
+
+Revision ID: 5e3f9b2d7a14
+Revises: 4b1e7d9a2c63
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5e3f9b2d7a14"
+down_revision = "4b1e7d9a2c63"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_project_submissions_created",
+        "project_submissions",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_project_submissions_status_created",
+        "project_submissions",
+        ["status", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_project_submissions_status_created", table_name="project_submissions")
+    op.drop_index("ix_project_submissions_created", table_name="project_submissions")
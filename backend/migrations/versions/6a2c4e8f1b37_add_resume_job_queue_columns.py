@@ -0,0 +1,32 @@
+"""add resume scoring job queue columns
+
+Revision ID: 6a2c4e8f1b37
+Revises: 5e3f9b2d7a14
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "6a2c4e8f1b37"
+down_revision = "5e3f9b2d7a14"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("resume_submissions", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("pdf_bytes", sa.LargeBinary(), nullable=True))
+        batch_op.add_column(sa.Column("claimed_at", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"))
+    op.create_index("ix_resume_submissions_status_id", "resume_submissions", ["status", "id"])
+
+
+def downgrade():
+    op.drop_index("ix_resume_submissions_status_id", table_name="resume_submissions")
+    with op.batch_alter_table("resume_submissions", schema=None) as batch_op:
+        batch_op.drop_column("attempts")
+        batch_op.drop_column("claimed_at")
+        batch_op.drop_column("pdf_bytes")
@@ -0,0 +1,43 @@
+"""add resume content hash for score reuse
+
+Revision ID: 7c5e1a9d3f26
+Revises: 6a2c4e8f1b37
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7c5e1a9d3f26"
+down_revision = "6a2c4e8f1b37"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("resume_submissions", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("rubric_scores_json", sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column("content_sha256", sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column("reused_from_submission_id", sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_resume_submissions_reused_from",
+            "resume_submissions",
+            ["reused_from_submission_id"],
+            ["id"],
+        )
+    op.create_index(
+        "ix_resume_submissions_content_lookup",
+        "resume_submissions",
+        ["content_sha256", "provider", "model", "prompt_version"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_resume_submissions_content_lookup", table_name="resume_submissions")
+    with op.batch_alter_table("resume_submissions", schema=None) as batch_op:
+        batch_op.drop_constraint("fk_resume_submissions_reused_from", type_="foreignkey")
+        batch_op.drop_column("reused_from_submission_id")
+        batch_op.drop_column("content_sha256")
+        batch_op.drop_column("rubric_scores_json")
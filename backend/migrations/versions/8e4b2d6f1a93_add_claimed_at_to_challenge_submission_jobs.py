@@ -0,0 +1,26 @@
+"""add claimed_at to challenge_submission_jobs
+
+Revision ID: 8e4b2d6f1a93
+Revises: 7c5e1a9d3f26
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8e4b2d6f1a93"
+down_revision = "7c5e1a9d3f26"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("challenge_submission_jobs", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("claimed_at", sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("challenge_submission_jobs", schema=None) as batch_op:
+        batch_op.drop_column("claimed_at")
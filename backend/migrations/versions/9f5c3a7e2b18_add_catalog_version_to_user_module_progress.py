@@ -0,0 +1,27 @@
+"""add catalog_version to user_module_progress
+
+Revision ID: 9f5c3a7e2b18
+Revises: 8e4b2d6f1a93
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9f5c3a7e2b18"
+down_revision = "8e4b2d6f1a93"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows keep NULL, so each user's modules are recomputed from completions on next read.
+    with op.batch_alter_table("user_module_progress", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("catalog_version", sa.String(length=16), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("user_module_progress", schema=None) as batch_op:
+        batch_op.drop_column("catalog_version")
@@ -0,0 +1,32 @@
+"""add heartbeat_at to challenge_submission_jobs
+
+Revision ID: a3d9e6b1c472
+Revises: 9f5c3a7e2b18
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a3d9e6b1c472"
+down_revision = "9f5c3a7e2b18"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("challenge_submission_jobs", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+        batch_op.create_index(
+            "ix_challenge_submission_jobs_status_heartbeat",
+            ["status", "heartbeat_at"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("challenge_submission_jobs", schema=None) as batch_op:
+        batch_op.drop_index("ix_challenge_submission_jobs_status_heartbeat")
+        batch_op.drop_column("heartbeat_at")
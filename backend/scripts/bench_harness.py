@@ -0,0 +1,73 @@
+"""Per-case harness build time with and without the precompiled template registry.
+
+Usage (from backend/): SECRET_KEY=x JWT_SECRET_KEY=x python scripts/bench_harness.py [--iterations N]
+
+"rebuild" clears the template cache before every build, which redoes the serializer helper and
+indentation work that each case paid before templates were cached; "template" is the warm path.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services import skills_harness  # noqa: E402
+
+FAMILY_RETURN_TYPES = {
+  "python": "string_list_list",
+  "javascript": "string_list_list",
+  "typescript": "string_list_list",
+  "java": "string_list_list",
+  "cpp": "string_list",
+  "csharp": "string_list_list",
+  "go": "string_list_list",
+  "rust": "string_list_list",
+  "kotlin": "string_list_list",
+  "swift": "string_list_list",
+  "php": "string_list_list",
+  "ruby": "string_list_list",
+  "c": "int",
+}
+PARAMETERS = [{"name": "words", "type": "string_list"}]
+ARGS = [["eat", "tea", "tan", "ate", "nat", "bat"]]
+C_PARAMETERS = [{"name": "n", "type": "int"}]
+C_ARGS = [42]
+
+
+def _build(family: str) -> str:
+  is_c = family == "c"
+  return skills_harness.build_harness_source(
+    family=family,
+    function_name="groupAnagrams",
+    parameters=C_PARAMETERS if is_c else PARAMETERS,
+    return_type=FAMILY_RETURN_TYPES[family],
+    args=C_ARGS if is_c else ARGS,
+    user_source="// user solution\n" * 20,
+  )
+
+
+def _rebuild(family: str) -> str:
+  skills_harness._single_case_template.cache_clear()
+  return _build(family)
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--iterations", type=int, default=20000)
+  options = parser.parse_args()
+
+  print(f"{'family':<12}{'rebuild us':>12}{'template us':>13}{'speedup':>9}")
+  for family in FAMILY_RETURN_TYPES:
+    rebuild = min(timeit.repeat(lambda: _rebuild(family), number=options.iterations, repeat=3))
+    _build(family)
+    template = min(timeit.repeat(lambda: _build(family), number=options.iterations, repeat=3))
+    rebuild_us = rebuild / options.iterations * 1e6
+    template_us = template / options.iterations * 1e6
+    print(f"{family:<12}{rebuild_us:>12.2f}{template_us:>13.2f}{rebuild_us / template_us:>8.1f}x")
+
+
+if __name__ == "__main__":
+  main()
@@ -8,10 +8,19 @@ os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret-key")
 os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 os.environ.setdefault("RESUME_SCORER_ENABLED", "true")
 os.environ.setdefault("SUPERUSER_EMAILS", "")
+os.environ.setdefault("JUDGE0_WARM_LANGUAGES", "false")
+os.environ.setdefault("BACKGROUND_JOBS_ENABLED", "false")
 
 from app import create_app  # noqa: E402
 from app.extensions import db  # noqa: E402
 from app.models import Module, Task, User, UserProgress  # noqa: E402
+from app.services import rate_limiting  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _fresh_rate_limiter(monkeypatch):
+  # Every test reuses user id 1, so limiter windows must not carry over between tests.
+  monkeypatch.setattr(rate_limiting, "_RATE_LIMITER", None)
 
 
 @pytest.fixture()
@@ -0,0 +1,73 @@
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models import User, UserProgress
+
+
+def _capture_statements(app, client, *args, **kwargs):
+  statements: list[str] = []
+  with app.app_context():
+    engine = db.engine
+  listener = lambda conn, cursor, statement, *rest: statements.append(statement)
+  event.listen(engine, "before_cursor_execute", listener)
+  try:
+    response = client.get(*args, **kwargs)
+  finally:
+    event.remove(engine, "before_cursor_execute", listener)
+  return response, statements
+
+
+def test_summary_is_a_pure_read_once_progress_is_current(client, auth_headers, app):
+  first, first_statements = _capture_statements(app, client, "/dashboard/summary", headers=auth_headers)
+  assert first.status_code == 200
+  assert any(statement.startswith("UPDATE user_progress") for statement in first_statements)
+
+  second, second_statements = _capture_statements(app, client, "/dashboard/summary", headers=auth_headers)
+  assert second.status_code == 200
+  assert second.get_json()["progress"] == first.get_json()["progress"]
+  assert not any(statement.split()[0] in {"UPDATE", "INSERT", "DELETE"} for statement in second_statements)
+
+
+def test_task_toggle_is_reflected_in_next_summary(client, auth_headers, app):
+  client.get("/dashboard/summary", headers=auth_headers)
+
+  response = client.patch(
+    f"/dashboard/tasks/{app.config['TEST_RESUME_TASK_ID']}",
+    headers=auth_headers,
+    json={"completed": True},
+  )
+  assert response.status_code == 200
+
+  summary = client.get("/dashboard/summary", headers=auth_headers).get_json()
+  with app.app_context():
+    progress = UserProgress.query.filter_by(user_id=app.config["TEST_USER_ID"]).first()
+    assert progress.needs_recompute is False
+    assert progress.readiness_score == summary["progress"]
+
+
+def test_summary_serves_module_progress_from_stored_rows(client, auth_headers, app):
+  client.get("/dashboard/summary", headers=auth_headers)
+
+  response, statements = _capture_statements(app, client, "/dashboard/summary", headers=auth_headers)
+  assert response.status_code == 200
+  assert [state["module_key"] for state in response.get_json()["module_progress"]] == ["resume"]
+  assert not any("user_task_completions" in statement for statement in statements)
+  assert not any("resume_submissions" in statement for statement in statements)
+  assert sum("FROM user_module_progress" in statement for statement in statements) == 1
+
+
+def test_admin_lists_users_below_module_threshold(client, auth_headers, app):
+  with app.app_context():
+    user = db.session.get(User, app.config["TEST_USER_ID"])
+    user.is_superuser = True
+    db.session.commit()
+  client.get("/dashboard/summary", headers=auth_headers)
+
+  response = client.get("/dashboard/admin/stuck-users?module_key=resume", headers=auth_headers)
+  assert response.status_code == 200
+  payload = response.get_json()
+  assert payload["threshold"] == 80
+  assert [row["user_id"] for row in payload["users"]] == [app.config["TEST_USER_ID"]]
+
+  missing = client.get("/dashboard/admin/stuck-users?module_key=nope", headers=auth_headers)
+  assert missing.status_code == 404
@@ -0,0 +1,314 @@
+import os
+import shutil
+import signal
+import threading
+import time
+
+import pytest
+
+from app.services import executors, judge0, local_sandbox
+from app.services.skills_harness import build_harness_source
+
+
+def _sandbox_available():
+  pid = os.fork()
+  if pid == 0:
+    try:
+      local_sandbox.enter_namespaces()
+      os._exit(0)
+    except BaseException:
+      os._exit(1)
+  return os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1]) == 0
+
+
+SANDBOX_AVAILABLE = _sandbox_available()
+
+
+@pytest.fixture()
+def local_executor():
+  if not SANDBOX_AVAILABLE:
+    pytest.skip("unprivileged user namespaces are unavailable")
+  return executors.LocalSubprocessExecutor()
+
+
+def _run_python(executor, source_code, **kwargs):
+  return executor.run(source_code=source_code, language_id=71, stdin="", language_family="python", **kwargs)
+
+
+def test_local_executor_returns_judge0_shaped_result(local_executor):
+  result = _run_python(local_executor, "print('hello')", expected_output="hello")
+
+  assert result["status"] == {"id": 3, "description": "Accepted"}
+  assert result["stdout"].strip() == "hello"
+  assert result["stderr"] is None
+  assert float(result["time"]) >= 0
+  assert result["memory"] > 0
+
+
+def test_local_executor_reports_wrong_answer_and_runtime_errors(local_executor):
+  wrong = _run_python(local_executor, "print('nope')", expected_output="hello")
+  crashed = _run_python(local_executor, "raise ValueError('boom')")
+
+  assert wrong["status"]["id"] == 4
+  assert crashed["status"]["id"] == 11
+  assert "ValueError: boom" in crashed["stderr"]
+
+
+def test_local_executor_enforces_cpu_limit(local_executor):
+  result = _run_python(local_executor, "while True:\n  pass\n", cpu_time_limit=0.5)
+
+  assert result["status"]["id"] == 5
+
+
+def test_local_executor_has_no_network(local_executor):
+  source = (
+    "import socket\n"
+    "try:\n"
+    "  socket.create_connection(('1.1.1.1', 53), timeout=1)\n"
+    "  print('connected')\n"
+    "except OSError:\n"
+    "  print('offline')\n"
+  )
+  result = _run_python(local_executor, source)
+
+  assert result["stdout"].strip() == "offline"
+
+
+def test_local_executor_runs_python_harness(local_executor):
+  source = build_harness_source(
+    family="python",
+    function_name="solve",
+    parameters=[{"name": "name", "type": "string"}],
+    return_type="string",
+    args=["  Ada "],
+    user_source="def solve(name):\n  return name.strip().lower()\n",
+  )
+  result = _run_python(local_executor, source)
+
+  assert result["status"]["id"] == 3
+  assert "ada" in result["stdout"]
+
+
+def test_local_executor_hides_the_host_filesystem_and_processes(local_executor):
+  source = (
+    "import os\n"
+    f"print(os.path.exists({executors.__file__!r}))\n"
+    "print(sorted(int(p) for p in os.listdir('/proc') if p.isdigit()))\n"
+    "print(os.getuid())\n"
+  )
+  result = _run_python(local_executor, source)
+
+  assert result["stdout"].split("\n")[:3] == ["False", "[1, 2]", "65534"]
+
+
+_DETACHED_PROBE = "import time; time.sleep(30)  # ir-detached-probe"
+
+
+def _detached_probes():
+  found = []
+  for pid in filter(str.isdigit, os.listdir("/proc")):
+    try:
+      with open(f"/proc/{pid}/cmdline", "rb") as handle:
+        argv = handle.read().split(b"\0")
+    except OSError:
+      continue
+    if _DETACHED_PROBE.encode() in argv[1:3]:
+      found.append(pid)
+  return found
+
+
+def test_local_executor_kills_detached_processes_with_the_run(local_executor):
+  source = f"import subprocess, sys\nsubprocess.Popen([sys.executable, '-c', {_DETACHED_PROBE!r}], start_new_session=True)\n"
+  result = _run_python(local_executor, source)
+  time.sleep(0.2)
+
+  assert result["status"]["id"] == 3
+  assert _detached_probes() == []
+
+
+@pytest.mark.skipif(os.getuid() == 0, reason="RLIMIT_NPROC does not apply to root")
+def test_local_executor_limits_processes(local_executor):
+  source = (
+    "import os, time\n"
+    "try:\n"
+    "  while True:\n"
+    "    if os.fork() == 0:\n"
+    "      time.sleep(2)\n"
+    "      os._exit(0)\n"
+    "except OSError:\n"
+    "  print('limited')\n"
+  )
+  result = _run_python(local_executor, source)
+
+  assert result["stdout"].strip() == "limited"
+
+
+def test_local_executor_fails_closed_without_a_sandbox(monkeypatch, tmp_path):
+  broken = tmp_path / "broken_sandbox.py"
+  broken.write_text("import sys\nprint('sandbox: unshare failed', file=sys.stderr)\nsys.exit(125)\n")
+  monkeypatch.setattr(executors, "_SANDBOX_SCRIPT", str(broken))
+
+  with pytest.raises(executors.judge0.Judge0Error, match="unshare failed"):
+    _run_python(executors.LocalSubprocessExecutor(), "print('ran')")
+
+
+@pytest.mark.skipif(not shutil.which("node"), reason="node is not installed")
+def test_local_executor_runs_javascript(local_executor):
+  result = local_executor.run(
+    source_code="console.log([1, 2, 3].map((n) => n * 2).join(','))",
+    language_id=63,
+    stdin="",
+    language_family="javascript",
+  )
+
+  assert result["status"]["id"] == 3
+  assert result["stdout"].strip() == "2,4,6"
+
+
+def test_executor_selection_falls_back_to_judge0(monkeypatch):
+  assert executors.get_executor("python").name == "judge0"
+
+  monkeypatch.setattr(executors, "CODE_EXECUTOR", "local")
+  assert executors.get_executor("python").name == "local"
+  assert executors.get_executor("java").name == "judge0"
+
+
+def test_every_execution_passes_one_shared_gate(monkeypatch):
+  lock = threading.Lock()
+  in_flight = [0, 0]
+
+  def _slow(**_):
+    with lock:
+      in_flight[0] += 1
+      in_flight[1] = max(in_flight)
+    time.sleep(0.05)
+    with lock:
+      in_flight[0] -= 1
+    return {}
+
+  monkeypatch.setattr(executors, "_EXECUTION_SLOTS", threading.BoundedSemaphore(2))
+  monkeypatch.setattr(executors._JUDGE0_EXECUTOR, "run", _slow)
+  monkeypatch.setattr(executors._JUDGE0_EXECUTOR, "run_batch", _slow)
+  calls = [
+    lambda: executors.run_submission(source_code="", language_id=71, stdin="", language_family="python"),
+    lambda: executors.run_submission_batch(source_codes=[""], language_id=71, language_family="python"),
+  ] * 4
+  threads = [threading.Thread(target=call) for call in calls]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  assert in_flight == [0, 2]
+
+
+def test_execution_gate_tells_callers_to_retry_when_full(monkeypatch):
+  monkeypatch.setattr(executors, "_EXECUTION_SLOTS", threading.BoundedSemaphore(1))
+  monkeypatch.setattr(executors, "EXECUTION_SLOT_WAIT_SECONDS", 0.01)
+  executors._EXECUTION_SLOTS.acquire()
+
+  with pytest.raises(judge0.Judge0ProcessingTimeout):
+    executors.run_submission(source_code="", language_id=71, stdin="", language_family="python")
+
+
+@pytest.fixture()
+def warm_executor():
+  if not SANDBOX_AVAILABLE:
+    pytest.skip("unprivileged user namespaces are unavailable")
+  executor = executors.LocalSubprocessExecutor(python_workers=1, python_worker_max_jobs=3)
+  yield executor
+  executor.python_pool.close()
+
+
+def test_warm_pool_runs_python_with_the_same_result_shape(warm_executor):
+  ok = warm_executor.run(
+    source_code="import sys\nprint(sys.stdin.read().upper())",
+    language_id=71,
+    stdin="hi",
+    expected_output="HI",
+    language_family="python",
+  )
+  crashed = _run_python(warm_executor, "raise ValueError('boom')")
+
+  assert ok["status"]["id"] == 3
+  assert ok["memory"] > 0
+  assert crashed["status"]["id"] == 11
+  assert "ValueError: boom" in crashed["stderr"]
+
+
+def test_warm_pool_isolates_jobs_and_enforces_limits(warm_executor):
+  leaked = _run_python(warm_executor, "import json\njson.leak = 1\nprint('set')")
+  isolated = _run_python(warm_executor, "import json\nprint(hasattr(json, 'leak'))")
+  looping = _run_python(warm_executor, "while True:\n  pass\n", cpu_time_limit=0.5)
+  hungry = _run_python(warm_executor, "blob = bytearray(1024 * 1024 * 1024)\n")
+
+  assert leaked["stdout"].strip() == "set"
+  assert isolated["stdout"].strip() == "False"
+  assert looping["status"]["id"] == 5
+  assert hungry["status"]["id"] == 11
+  assert "MemoryError" in hungry["stderr"]
+
+
+def test_warm_pool_recycles_workers(warm_executor):
+  pool = warm_executor.python_pool
+  for _ in range(3):
+    _run_python(warm_executor, "print(1)")
+  _run_python(warm_executor, "import os, signal\nos.kill(os.getpid(), signal.SIGSEGV)")
+  _run_python(warm_executor, "print(1)")
+
+  stats = pool.stats()
+  assert stats["jobs"] == 5
+  assert stats["recycled"] == 2
+  assert stats["started"] == 3
+
+
+def test_warm_pool_jobs_get_their_own_namespaces(warm_executor):
+  writer = _run_python(warm_executor, "open('/tmp/left-behind', 'w').write('x')\nprint('wrote')")
+  source = (
+    "import os\n"
+    "print(os.listdir('/tmp'))\n"
+    "print(sorted(int(p) for p in os.listdir('/proc') if p.isdigit()))\n"
+    f"print(os.path.exists({executors.__file__!r}))\n"
+  )
+  reader = _run_python(warm_executor, source)
+  detached = _run_python(
+    warm_executor,
+    f"import subprocess, sys\nsubprocess.Popen([sys.executable, '-c', {_DETACHED_PROBE!r}], start_new_session=True)\n",
+  )
+  time.sleep(0.2)
+
+  assert writer["stdout"].strip() == "wrote"
+  assert reader["stdout"].split("\n")[:3] == ["[]", "[1, 2]", "False"]
+  assert detached["status"]["id"] == 3
+  assert _detached_probes() == []
+
+
+def test_warm_pool_jobs_cannot_kill_their_worker(warm_executor):
+  result = _run_python(warm_executor, "import os, signal\nos.kill(os.getppid(), signal.SIGKILL)\nprint('alive')")
+  _run_python(warm_executor, "print(1)")
+
+  assert result["stdout"].strip() == "alive"
+  assert warm_executor.python_pool.stats()["started"] == 1
+
+
+def test_warm_pool_survives_worker_being_killed(warm_executor):
+  pool = warm_executor.python_pool
+  _run_python(warm_executor, "print(1)")
+  os.killpg(pool._idle.queue[0].process.pid, signal.SIGKILL)
+
+  with pytest.raises(executors.judge0.Judge0Error):
+    _run_python(warm_executor, "print('lost')")
+  assert _run_python(warm_executor, "print('back')")["stdout"].strip() == "back"
+
+
+def test_warm_pool_gives_up_on_a_wedged_worker(warm_executor, monkeypatch):
+  monkeypatch.setattr(executors, "LOCAL_PYTHON_WORKER_GRACE_SECONDS", 0.5)
+  pool = warm_executor.python_pool
+  _run_python(warm_executor, "print(1)")
+  os.killpg(pool._idle.queue[0].process.pid, signal.SIGSTOP)
+
+  started = time.monotonic()
+  with pytest.raises(executors.judge0.Judge0Error):
+    _run_python(warm_executor, "print('stuck')", cpu_time_limit=0.5)
+  assert time.monotonic() - started < 5
+  assert pool.stats()["worker_failures"] == 1
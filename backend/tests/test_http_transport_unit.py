@@ -0,0 +1,89 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services.http_transport import HttpTransportError, PooledHttpTransport
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+  protocol_version = "HTTP/1.1"
+  posts = 0
+
+  def do_GET(self):
+    body = b'{"ok": true}'
+    self.send_response(200)
+    self.send_header("Content-Type", "application/json")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def do_POST(self):
+    self.rfile.read(int(self.headers.get("Content-Length") or 0))
+    type(self).posts += 1
+    # Accept the body, then drop the connection before answering.
+    self.close_connection = True
+    self.connection.shutdown(2)
+
+  def log_message(self, *args):
+    pass
+
+
+@pytest.fixture()
+def server_url():
+  _KeepAliveHandler.posts = 0
+  server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+  thread = threading.Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  yield f"http://127.0.0.1:{server.server_address[1]}"
+  server.shutdown()
+  server.server_close()
+
+
+def test_transport_reuses_keep_alive_connections(server_url):
+  transport = PooledHttpTransport(max_connections_per_host=2)
+  for _ in range(5):
+    response = transport.request("GET", f"{server_url}/submissions/abc?base64_encoded=false")
+    assert response.status == 200
+    assert response.body == b'{"ok": true}'
+
+  stats = transport.stats()
+  assert stats["new_connections"] == 1
+  assert stats["reuses"] == 4
+  transport.close()
+
+
+def test_transport_bounds_connections_under_concurrency(server_url):
+  transport = PooledHttpTransport(max_connections_per_host=2)
+  errors: list[Exception] = []
+
+  def _worker():
+    try:
+      for _ in range(5):
+        transport.request("GET", f"{server_url}/languages")
+    except Exception as err:  # pragma: no cover - surfaced by the assertion below
+      errors.append(err)
+
+  threads = [threading.Thread(target=_worker) for _ in range(6)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  stats = transport.stats()
+  assert errors == []
+  assert stats["new_connections"] <= 2
+  assert stats["requests"] == 30
+  transport.close()
+
+
+def test_transport_does_not_resend_post_after_the_server_received_it(server_url):
+  transport = PooledHttpTransport(max_connections_per_host=1)
+  transport.request("GET", f"{server_url}/languages")
+
+  with pytest.raises(HttpTransportError, match="connection dropped"):
+    transport.request("POST", f"{server_url}/submissions", body=b"{}", headers={"Content-Length": "2"})
+
+  assert _KeepAliveHandler.posts == 1
+  assert transport.stats()["retries"] == 0
+  transport.close()
@@ -0,0 +1,93 @@
+import threading
+import time
+
+import pytest
+
+from app.services.judge0 import Judge0Error, _language_family
+from app.services.judge0_languages import LanguageCatalog
+
+LANGUAGES = [
+  {"id": 71, "name": "Python (3.8.1)"},
+  {"id": 63, "name": "JavaScript (Node.js 12.14.0)"},
+  {"id": 62, "name": "Java (OpenJDK 13.0.1)"},
+]
+
+
+class _Clock:
+  def __init__(self):
+    self.now = 1000.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+class _Fetcher:
+  def __init__(self, *, delay: float = 0.0):
+    self.calls = 0
+    self.delay = delay
+    self.fail = False
+
+  def __call__(self):
+    self.calls += 1
+    time.sleep(self.delay)
+    if self.fail:
+      raise Judge0Error("Judge0 HTTP 503")
+    return list(LANGUAGES)
+
+
+def _wait_for_refresh(catalog: LanguageCatalog) -> None:
+  deadline = time.monotonic() + 5
+  while catalog.stats()["refreshing"] and time.monotonic() < deadline:
+    time.sleep(0.01)
+
+
+def test_cold_start_fetches_once_across_concurrent_readers():
+  fetcher = _Fetcher(delay=0.05)
+  catalog = LanguageCatalog(fetcher, _language_family, source="judge0")
+
+  threads = [threading.Thread(target=catalog.languages) for _ in range(8)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  assert fetcher.calls == 1
+  assert catalog.family(71) == "python"
+  assert catalog.family(62) == "java"
+  assert catalog.family(999) is None
+
+
+def test_expired_catalog_is_served_stale_while_refresh_fails():
+  fetcher = _Fetcher()
+  clock = _Clock()
+  catalog = LanguageCatalog(fetcher, _language_family, source="judge0", ttl_seconds=60, retry_seconds=30, clock=clock)
+  assert catalog.family(63) == "javascript"
+
+  clock.now += 120
+  fetcher.fail = True
+  assert catalog.languages() == LANGUAGES
+  _wait_for_refresh(catalog)
+  assert fetcher.calls == 2
+  assert catalog.stats()["fetch_errors"] == 1
+
+  # Within the retry window reads stay off the network.
+  clock.now += 10
+  catalog.languages()
+  _wait_for_refresh(catalog)
+  assert fetcher.calls == 2
+
+
+def test_snapshot_file_lets_a_restart_skip_the_network(tmp_path):
+  path = str(tmp_path / "languages.json")
+  LanguageCatalog(_Fetcher(), _language_family, source="judge0", snapshot_path=path).languages()
+
+  offline = _Fetcher()
+  offline.fail = True
+  restarted = LanguageCatalog(offline, _language_family, source="judge0", snapshot_path=path)
+  assert restarted.languages() == LANGUAGES
+  assert restarted.family(71) == "python"
+  assert restarted.stats()["snapshot_loads"] == 1
+
+  other_deployment = LanguageCatalog(offline, _language_family, source="other", snapshot_path=path)
+  with pytest.raises(Judge0Error):
+    other_deployment.languages()
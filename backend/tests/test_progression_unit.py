@@ -0,0 +1,173 @@
+import pytest
+
+from app.extensions import db
+from app.models import Module, ResumeSubmission, Task, User, UserModuleProgress, UserProgress
+from app.services import progression
+
+
+@pytest.fixture()
+def app_ctx(app):
+  with app.app_context():
+    progression.invalidate_catalog()
+    yield app
+    progression.invalidate_catalog()
+
+
+def test_catalog_snapshot_is_reused_until_fingerprint_changes(app_ctx, monkeypatch):
+  first = progression.get_catalog()
+  resume = first.modules_by_key["resume"]
+  assert resume.total_weight == 100
+  assert resume.tasks_by_challenge_id["resume_pass_threshold"].id == app_ctx.config["TEST_RESUME_TASK_ID"]
+  assert progression.get_catalog() is first
+
+  # A migration-style UPDATE bypasses ORM events; the periodic fingerprint check picks it up.
+  db.session.execute(db.text("UPDATE tasks SET weight = 40"))
+  db.session.commit()
+  assert progression.get_catalog() is first
+
+  monkeypatch.setattr(progression, "CATALOG_VERSION_CHECK_SECONDS", 0.0)
+  refreshed = progression.get_catalog()
+  assert refreshed is not first
+  assert refreshed.modules_by_key["resume"].total_weight == 40
+  assert progression.get_catalog() is refreshed
+
+
+def test_bulk_recompute_matches_per_user_recompute(app_ctx):
+  users = []
+  for index in range(5):
+    user = User(email=f"bulk{index}@example.com")
+    user.password_hash = "x"
+    db.session.add(user)
+    users.append(user)
+  db.session.flush()
+  for index, user in enumerate(users[:3]):
+    db.session.add(
+      ResumeSubmission(
+        user_id=user.id,
+        file_name="resume.pdf",
+        file_size_bytes=10,
+        status="succeeded",
+        overall_score=60 + index * 10,
+      )
+    )
+  db.session.add(UserProgress(user_id=users[0].id, readiness_score=99))
+  db.session.commit()
+
+  stats = progression.bulk_recompute_user_progress(chunk_size=2)
+  assert stats["users"] == 6
+  assert stats["chunks"] == 3
+
+  bulk = {
+    row.user_id: (row.readiness_score, row.category_resume, row.needs_recompute)
+    for row in UserProgress.query.all()
+  }
+  assert len(bulk) == 6
+  for user_id in list(bulk):
+    summary = progression.recompute_and_persist_user_progress(user_id, commit=True)
+    assert bulk[user_id] == (summary["progress"], summary["category_readiness"]["resume"], False)
+  assert bulk[users[2].id][1] == 80
+
+
+def test_task_toggle_applies_incremental_delta_consistent_with_full_recompute(app_ctx, monkeypatch):
+  monkeypatch.setattr(progression, "PROGRESS_CONSISTENCY_SAMPLE_RATE", 0.0)
+  user_id = app_ctx.config["TEST_USER_ID"]
+  module = Module(key="coding", name="Coding", category="coding", overall_weight=40, unlock_threshold=80, sort_order=0)
+  db.session.add(module)
+  db.session.flush()
+  tasks = [Task(module_id=module.id, title=f"Task {index}", weight=weight, sort_order=index) for index, weight in enumerate([30, 70])]
+  db.session.add_all(tasks)
+  db.session.commit()
+  progression.recompute_and_persist_user_progress(user_id, commit=True)
+
+  calls = []
+  monkeypatch.setattr(progression, "_build_module_states", lambda *args: calls.append(args) or [])
+  summary = progression.set_task_completion_internal(user_id, tasks[1].id, True)
+  assert calls == []
+  monkeypatch.undo()
+
+  coding = next(state for state in summary["module_progress"] if state["module_key"] == "coding")
+  assert coding["score"] == 70
+  assert summary["category_readiness"]["coding"] == 70
+  assert progression.verify_user_progress(user_id) == []
+
+  progression.set_task_completion_internal(user_id, tasks[1].id, False)
+  assert progression.verify_user_progress(user_id) == []
+  row = UserModuleProgress.query.filter_by(user_id=user_id, module_id=module.id).one()
+  assert (row.score, row.completed_weight) == (0, 0)
+
+
+def test_task_delta_adds_to_the_stored_weight_not_a_stale_read(app_ctx):
+  user_id = app_ctx.config["TEST_USER_ID"]
+  module = Module(key="coding", name="Coding", category="coding", overall_weight=40, unlock_threshold=80, sort_order=0)
+  db.session.add(module)
+  db.session.flush()
+  tasks = [Task(module_id=module.id, title=f"Task {index}", weight=weight, sort_order=index) for index, weight in enumerate([30, 70])]
+  db.session.add_all(tasks)
+  db.session.commit()
+  progression.recompute_and_persist_user_progress(user_id, commit=True)
+  row = UserModuleProgress.query.filter_by(user_id=user_id, module_id=module.id).one()
+  assert row.completed_weight == 0
+
+  # Another request toggles the 70-weight task after this session has already loaded the row.
+  db.session.execute(
+    db.text("UPDATE user_module_progress SET completed_weight = 70 WHERE id = :id"),
+    {"id": row.id},
+  )
+  summary = progression._apply_task_delta(user_id, tasks[0].id, 30)
+
+  assert row.completed_weight == 100
+  coding = next(state for state in summary["module_progress"] if state["module_key"] == "coding")
+  assert coding["score"] == 100
+
+
+def test_consistency_check_detects_and_repairs_drift(app_ctx):
+  user_id = app_ctx.config["TEST_USER_ID"]
+  progression.recompute_and_persist_user_progress(user_id, commit=True)
+  UserProgress.query.filter_by(user_id=user_id).update({"readiness_score": 42})
+  db.session.commit()
+
+  result = progression.check_progress_consistency(repair=True)
+  assert result == {"checked": 1, "drifted": [user_id]}
+  assert progression.check_progress_consistency() == {"checked": 1, "drifted": []}
+
+
+def _reweighted_coding_module(user_id):
+  module = Module(key="coding", name="Coding", category="coding", overall_weight=40, unlock_threshold=80, sort_order=0)
+  db.session.add(module)
+  db.session.flush()
+  tasks = [Task(module_id=module.id, title=f"Task {index}", weight=weight, sort_order=index) for index, weight in enumerate([30, 70])]
+  db.session.add_all(tasks)
+  db.session.commit()
+  progression.set_task_completion_internal(user_id, tasks[0].id, True)
+  progression.get_user_progress_summary(user_id)
+
+  tasks[0].weight = 40
+  db.session.commit()
+  return module, tasks
+
+
+def test_dashboard_recomputes_module_rows_after_a_reweight(app_ctx, monkeypatch):
+  monkeypatch.setattr(progression, "PROGRESS_CONSISTENCY_SAMPLE_RATE", 0.0)
+  user_id = app_ctx.config["TEST_USER_ID"]
+  module, _ = _reweighted_coding_module(user_id)
+
+  summary = progression.get_user_progress_summary(user_id)
+  coding = next(state for state in summary["module_progress"] if state["module_key"] == "coding")
+  # 40 of 110 active weight; the stale row alone would have rescaled 30 of 110 to 27.
+  assert coding["score"] == 36
+  row = UserModuleProgress.query.filter_by(user_id=user_id, module_id=module.id).one()
+  assert (row.score, row.completed_weight) == (36, 40)
+  assert progression.verify_user_progress(user_id) == []
+
+
+def test_task_toggle_after_a_reweight_falls_back_to_full_recompute(app_ctx, monkeypatch):
+  monkeypatch.setattr(progression, "PROGRESS_CONSISTENCY_SAMPLE_RATE", 0.0)
+  user_id = app_ctx.config["TEST_USER_ID"]
+  module, tasks = _reweighted_coding_module(user_id)
+
+  progression.set_task_completion_internal(user_id, tasks[1].id, True)
+  progression.set_task_completion_internal(user_id, tasks[0].id, False)
+
+  row = UserModuleProgress.query.filter_by(user_id=user_id, module_id=module.id).one()
+  assert (row.score, row.completed_weight) == (63, 70)
+  assert progression.verify_user_progress(user_id) == []
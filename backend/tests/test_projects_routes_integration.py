@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import pagination
+from app.extensions import db
+from app.models import ProjectSubmission, User
+
+
+@pytest.fixture()
+def submissions(app):
+  # Uses the fixture's app context so requests see the same (updated) User instance.
+  user_id = app.config["TEST_USER_ID"]
+  db.session.get(User, user_id).is_superuser = True
+  base = datetime(2026, 1, 1)
+  for index in range(5):
+    db.session.add(
+      ProjectSubmission(
+        user_id=user_id,
+        repo_url=f"https://github.com/intern/repo-{index}",
+        status="pending" if index % 2 == 0 else "pass",
+        review_notes="long review notes",
+        # Two rows share a timestamp so the id tie-breaker is exercised.
+        created_at=base + timedelta(minutes=min(index, 3)),
+      )
+    )
+  db.session.commit()
+
+
+def test_submissions_are_paged_newest_first_with_opaque_cursor(client, auth_headers, submissions):
+  seen = []
+  cursor = None
+  for _ in range(3):
+    url = "/projects/submissions?limit=2" + (f"&cursor={cursor}" if cursor else "")
+    payload = client.get(url, headers=auth_headers).get_json()
+    seen.extend(item["repo_url"].rsplit("-", 1)[1] for item in payload["submissions"])
+    cursor = payload["next_cursor"]
+    if cursor is None:
+      break
+
+  assert seen == ["4", "3", "2", "1", "0"]
+  assert cursor is None
+
+
+def test_admin_listing_filters_status_and_projects_fields(client, auth_headers, submissions):
+  response = client.get("/projects/admin/submissions?status=pending&fields=id,status", headers=auth_headers)
+  assert response.status_code == 200
+  payload = response.get_json()
+  assert len(payload["submissions"]) == 3
+  assert all(set(item) == {"id", "status"} for item in payload["submissions"])
+  assert {item["status"] for item in payload["submissions"]} == {"pending"}
+
+
+def test_listings_without_limit_use_the_default_page_size(client, auth_headers, submissions, monkeypatch):
+  monkeypatch.setattr(pagination, "DEFAULT_PAGE_SIZE", 3)
+  for url in ("/projects/submissions", "/projects/admin/submissions"):
+    payload = client.get(url, headers=auth_headers).get_json()
+    assert [item["repo_url"].rsplit("-", 1)[1] for item in payload["submissions"]] == ["4", "3", "2"]
+    assert payload["next_cursor"] is not None
+
+
+def test_summaries_count_every_submission(client, auth_headers, submissions):
+  mine = client.get("/projects/submissions/summary", headers=auth_headers).get_json()
+  admin = client.get("/projects/admin/submissions/summary", headers=auth_headers).get_json()
+
+  assert mine == {"counts": {"fail": 0, "pass": 2, "pending": 3}, "total": 5, "deployed_passes": 0}
+  assert admin == {"counts": {"fail": 0, "pass": 2, "pending": 3}, "total": 5}
+
+
+def test_listing_rejects_bad_cursor_and_fields(client, auth_headers, submissions):
+  assert client.get("/projects/submissions?cursor=nope", headers=auth_headers).status_code == 400
+  bad_limit = client.get("/projects/submissions?limit=ten", headers=auth_headers)
+  assert bad_limit.status_code == 400
+  assert bad_limit.get_json() == {"error": "limit must be an integer"}
+  assert client.get("/projects/submissions?fields=password", headers=auth_headers).status_code == 400
+  assert client.get("/projects/admin/submissions?status=weird", headers=auth_headers).status_code == 400
@@ -0,0 +1,82 @@
+import os
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.extensions import db
+from app.models import ProjectSubmission, ResumeSubmission, Task, UserTaskCompletion
+
+USER_ID = 1
+
+# The per-user access paths behind progression, listings and resume scoring.
+HOT_QUERIES = {
+  "best_resume_score": lambda: (
+    sa.select(sa.func.max(ResumeSubmission.overall_score))
+    .where(ResumeSubmission.user_id == USER_ID, ResumeSubmission.status == "succeeded")
+  ),
+  "resume_listing": lambda: (
+    sa.select(ResumeSubmission.id)
+    .where(ResumeSubmission.user_id == USER_ID)
+    .order_by(ResumeSubmission.created_at.desc(), ResumeSubmission.id.desc())
+  ),
+  "project_listing": lambda: (
+    sa.select(ProjectSubmission.id)
+    .where(ProjectSubmission.user_id == USER_ID)
+    .order_by(ProjectSubmission.created_at.desc(), ProjectSubmission.id.desc())
+  ),
+  "admin_pending_listing": lambda: (
+    sa.select(ProjectSubmission.id)
+    .where(ProjectSubmission.status == "pending")
+    .order_by(ProjectSubmission.created_at.desc(), ProjectSubmission.id.desc())
+  ),
+  "project_pass_count": lambda: (
+    sa.select(sa.func.count())
+    .select_from(ProjectSubmission)
+    .where(ProjectSubmission.user_id == USER_ID, ProjectSubmission.status == "pass")
+  ),
+  "user_completions": lambda: (
+    sa.select(UserTaskCompletion.task_id).where(UserTaskCompletion.user_id == USER_ID)
+  ),
+  "challenge_task": lambda: (
+    sa.select(Task.id).where(Task.module_id == 1, Task.challenge_id == "clean_username", Task.is_active.is_(True))
+  ),
+}
+
+
+def _compile(statement, dialect) -> str:
+  return str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_index_on_sqlite(app, name):
+  with app.app_context():
+    sql = _compile(HOT_QUERIES[name](), sqlite.dialect())
+    plan = " | ".join(row[-1] for row in db.session.execute(sa.text(f"EXPLAIN QUERY PLAN {sql}")))
+
+  assert "INDEX" in plan, plan
+  assert "TEMP B-TREE" not in plan, plan
+
+
+@pytest.fixture(scope="module")
+def postgres_engine():
+  url = os.getenv("TEST_POSTGRES_URL")
+  if not url:
+    pytest.skip("TEST_POSTGRES_URL is not set")
+  engine = sa.create_engine(url)
+  db.metadata.create_all(engine)
+  yield engine
+  db.metadata.drop_all(engine)
+  engine.dispose()
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_index_on_postgres(postgres_engine, name):
+  sql = _compile(HOT_QUERIES[name](), postgresql.dialect())
+  with postgres_engine.connect() as conn:
+    # Empty tables make a sequential scan cheapest; disable it so the plan shows what is available.
+    conn.execute(sa.text("SET enable_seqscan = off"))
+    plan = " | ".join(row[0] for row in conn.execute(sa.text(f"EXPLAIN {sql}")))
+
+  assert "Index" in plan, plan
+  assert "Sort" not in plan, plan
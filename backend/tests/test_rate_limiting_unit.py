@@ -0,0 +1,78 @@
+from app.services import rate_limiting
+from app.services.rate_limiting import (
+  InProcessRateLimitBackend,
+  RateLimiter,
+  SqliteRateLimitBackend,
+  _sliding_window_decision,
+  _WindowState,
+)
+
+
+def test_sliding_window_weights_previous_window_by_overlap():
+  state, retry_after = _sliding_window_decision(None, limit=2, window_seconds=60, now=600.0)
+  assert retry_after is None
+  state, retry_after = _sliding_window_decision(state, limit=2, window_seconds=60, now=601.0)
+  assert retry_after is None
+  state, retry_after = _sliding_window_decision(state, limit=2, window_seconds=60, now=602.0)
+  assert retry_after == 88
+
+  # Halfway into the next window the two earlier hits count as one, so one more fits.
+  state, retry_after = _sliding_window_decision(state, limit=2, window_seconds=60, now=690.0)
+  assert retry_after is None
+  assert state == _WindowState(660.0, 1, 2, 690.0)
+
+
+def test_sliding_window_with_a_zero_limit_always_denies():
+  state, retry_after = _sliding_window_decision(None, limit=0, window_seconds=60, now=600.0)
+  assert retry_after == 60
+  assert state == _WindowState(600.0, 0, 0, 600.0)
+  _, retry_after = _sliding_window_decision(state, limit=-1, window_seconds=60, now=630.0)
+  assert retry_after == 60
+
+
+def test_in_process_limiter_blocks_over_limit_and_tracks_in_flight():
+  limiter = RateLimiter(InProcessRateLimitBackend())
+
+  assert limiter.check("1:submit", limit=2) is None
+  assert limiter.check("1:submit", limit=2) is None
+  assert limiter.check("1:submit", limit=2) >= 1
+  assert limiter.check("2:submit", limit=2) is None
+
+  assert limiter.acquire("1:submit", limit=1)
+  assert not limiter.acquire("1:submit", limit=1)
+  limiter.release("1:submit")
+  assert limiter.acquire("1:submit", limit=1)
+
+  stats = limiter.stats()
+  assert stats["allowed"] == 3
+  assert stats["limited"] == 1
+
+
+def test_sqlite_backend_shares_limits_between_workers(tmp_path):
+  path = str(tmp_path / "rate-limits.sqlite3")
+  worker_a = RateLimiter(SqliteRateLimitBackend(path))
+  worker_b = RateLimiter(SqliteRateLimitBackend(path))
+
+  assert worker_a.check("1:run", limit=2) is None
+  assert worker_b.check("1:run", limit=2) is None
+  assert worker_a.check("1:run", limit=2) is not None
+
+  assert worker_a.acquire("1:run", limit=1)
+  assert not worker_b.acquire("1:run", limit=1)
+  worker_a.release("1:run")
+  assert worker_b.acquire("1:run", limit=1)
+
+
+def test_idle_keys_are_evicted_periodically(monkeypatch):
+  limiter = RateLimiter(InProcessRateLimitBackend(), idle_ttl_seconds=30, eviction_interval_seconds=0)
+  clock = [1000.0]
+  monkeypatch.setattr(rate_limiting.time, "time", lambda: clock[0])
+
+  limiter.check("1:run", limit=5)
+  limiter.check("2:run", limit=5)
+  clock[0] += 31
+  limiter.check("3:run", limit=5)
+
+  stats = limiter.stats()
+  assert stats["evicted"] == 2
+  assert stats["window_keys"] == 1
@@ -1,7 +1,13 @@
+from datetime import datetime, timedelta
 from io import BytesIO
 
-from app.models import ResumeSubmission, UserTaskCompletion
+from flask_jwt_extended import create_access_token
+
+from app.extensions import db
+from app.models import ResumeSubmission, User, UserTaskCompletion
 from app.routes import resume as resume_route
+from app.services.resume_providers import ResumeProviderError
+from app.services.resume_jobs import claim_next_resume_job, process_next_resume_job
 from app.services.resume_scoring import PreparedResumeContent
 
 
@@ -168,7 +174,7 @@ def test_resume_readiness_keeps_best_score_and_does_not_drop(client, auth_header
   second = client.post(
     "/resume/score",
     headers=auth_headers,
-    data={"file": (BytesIO(b"%PDF-1.4 fake"), "resume.pdf")},
+    data={"file": (BytesIO(b"%PDF-1.4 revised"), "resume.pdf")},
     content_type="multipart/form-data",
   )
   assert second.status_code == 200
@@ -186,3 +192,220 @@ def test_resume_readiness_keeps_best_score_and_does_not_drop(client, auth_header
     if module["module_key"] == "resume"
   )
   assert resume_module["score"] == 84
+
+
+
+
+def test_score_resume_rejects_oversized_content_length_before_parsing(client, auth_headers, app):
+  response = client.post(
+    "/resume/score",
+    headers=auth_headers,
+    data={"file": (BytesIO(b"%PDF-1.4 " + b"x" * (6 * 1024 * 1024)), "resume.pdf")},
+    content_type="multipart/form-data",
+  )
+  assert response.status_code == 400
+  assert response.get_json()["error_code"] == "file_too_large"
+  with app.app_context():
+    assert ResumeSubmission.query.count() == 0
+
+
+def test_score_resume_rejects_oversized_chunked_upload_without_content_length(client, auth_headers, app):
+  boundary = "resume-boundary"
+  body = (
+    f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"resume.pdf\"\r\n"
+    "Content-Type: application/pdf\r\n\r\n"
+  ).encode("utf-8") + b"%PDF-1.4 " + b"x" * (6 * 1024 * 1024) + f"\r\n--{boundary}--\r\n".encode("utf-8")
+  response = client.post(
+    "/resume/score",
+    headers={**auth_headers, "Transfer-Encoding": "chunked"},
+    input_stream=BytesIO(body),
+    content_type=f"multipart/form-data; boundary={boundary}",
+    environ_overrides={"wsgi.input_terminated": True},
+  )
+  assert response.status_code == 400
+  assert response.get_json()["error_code"] == "file_too_large"
+  with app.app_context():
+    assert ResumeSubmission.query.count() == 0
+
+
+def test_identical_upload_reuses_prior_score_without_calling_provider(client, auth_headers, app, monkeypatch):
+  provider = _SequentialProvider()
+  monkeypatch.setattr(resume_route, "build_resume_scoring_provider", lambda: provider)
+  monkeypatch.setattr(
+    resume_route,
+    "prepare_resume_content",
+    lambda _: PreparedResumeContent(
+      text_for_prompt="student@example.com https://github.com/student",
+      page_count=1,
+      extracted_char_count=48,
+    ),
+  )
+
+  responses = [
+    client.post(
+      "/resume/score",
+      headers=auth_headers,
+      data={"file": (BytesIO(b"%PDF-1.4 fake"), "resume.pdf")},
+      content_type="multipart/form-data",
+    ).get_json()
+    for _ in range(2)
+  ]
+
+  assert provider.calls == 1
+  first, second = responses
+  assert second["metadata"]["reused"] is True
+  assert second["overall_score"] == first["overall_score"] == 84
+  assert second["rubric_scores"] == first["rubric_scores"]
+  assert second["submission_id"] != first["submission_id"]
+
+  with app.app_context():
+    reused = db.session.get(ResumeSubmission, second["submission_id"])
+    assert reused.reused_from_submission_id == first["submission_id"]
+    assert reused.status == "succeeded"
+
+
+def _fake_content(_):
+  return PreparedResumeContent(
+    text_for_prompt="student@example.com https://github.com/student",
+    page_count=1,
+    extracted_char_count=48,
+  )
+
+
+def _post_resume(client, headers, content=b"%PDF-1.4 fake"):
+  return client.post(
+    "/resume/score",
+    headers=headers,
+    data={"file": (BytesIO(content), "resume.pdf")},
+    content_type="multipart/form-data",
+  )
+
+
+def test_identical_upload_is_reused_even_when_the_provider_is_unavailable(client, auth_headers, monkeypatch):
+  monkeypatch.setattr(resume_route, "prepare_resume_content", _fake_content)
+  monkeypatch.setattr(resume_route, "build_resume_scoring_provider", lambda: _PassingProvider())
+  first = _post_resume(client, auth_headers).get_json()
+
+  def _unavailable():
+    raise ResumeProviderError("OPENAI_API_KEY is required for resume scoring.")
+
+  monkeypatch.setattr(resume_route, "build_resume_scoring_provider", _unavailable)
+  second = _post_resume(client, auth_headers)
+
+  assert second.status_code == 200
+  assert second.get_json()["metadata"]["reused"] is True
+  assert second.get_json()["overall_score"] == first["overall_score"]
+  assert _post_resume(client, auth_headers, b"%PDF-1.4 other").status_code == 503
+
+
+def test_identical_upload_from_another_user_is_scored_again(client, auth_headers, app, monkeypatch):
+  provider = _SequentialProvider()
+  monkeypatch.setattr(resume_route, "build_resume_scoring_provider", lambda: provider)
+  monkeypatch.setattr(resume_route, "prepare_resume_content", _fake_content)
+  with app.app_context():
+    other = User(email="other@example.com")
+    other.set_password("password123")
+    db.session.add(other)
+    db.session.commit()
+    other_headers = {"Authorization": f"Bearer {create_access_token(identity=str(other.id))}"}
+
+  first = _post_resume(client, auth_headers).get_json()
+  second = _post_resume(client, other_headers).get_json()
+
+  assert provider.calls == 2
+  assert first["metadata"]["reused"] is False
+  assert second["metadata"]["reused"] is False
+
+
+class _IdlePool:
+  def __init__(self):
+    self.notified = 0
+
+  def notify(self):
+    self.notified += 1
+
+
+def test_async_resume_score_is_queued_then_scored_by_worker(client, auth_headers, app, monkeypatch):
+  pool = _IdlePool()
+  monkeypatch.setitem(app.extensions, "resume_job_pool", pool)
+  monkeypatch.setattr(resume_route, "build_resume_scoring_provider", lambda: _PassingProvider())
+  monkeypatch.setattr(
+    resume_route,
+    "prepare_resume_content",
+    lambda _: PreparedResumeContent(
+      text_for_prompt="student@example.com https://github.com/student",
+      page_count=1,
+      extracted_char_count=48,
+    ),
+  )
+
+  response = client.post(
+    "/resume/score",
+    headers=auth_headers,
+    data={"file": (BytesIO(b"%PDF-1.4 fake"), "resume.pdf"), "async": "true"},
+    content_type="multipart/form-data",
+  )
+  assert response.status_code == 202
+  payload = response.get_json()
+  assert payload["status"] == "queued"
+  assert pool.notified == 1
+
+  queued = client.get(payload["status_url"], headers=auth_headers).get_json()
+  assert queued["status"] == "queued"
+
+  assert process_next_resume_job(resume_route.run_resume_job) is True
+  assert process_next_resume_job(resume_route.run_resume_job) is False
+
+  finished = client.get(payload["status_url"], headers=auth_headers).get_json()
+  assert finished["status"] == "succeeded"
+  assert finished["overall_score"] == 84
+
+  with app.app_context():
+    saved = ResumeSubmission.query.filter_by(id=payload["submission_id"]).first()
+    assert saved.pdf_bytes is None
+    assert saved.attempts == 1
+    completion = UserTaskCompletion.query.filter_by(
+      user_id=app.config["TEST_USER_ID"],
+      task_id=app.config["TEST_RESUME_TASK_ID"],
+    ).first()
+    assert completion is not None
+
+
+def test_stale_running_resume_job_is_reclaimed(app, monkeypatch):
+  submission = ResumeSubmission(
+    user_id=app.config["TEST_USER_ID"],
+    file_name="resume.pdf",
+    file_size_bytes=4,
+    status="running",
+    claimed_at=datetime.utcnow() - timedelta(hours=1),
+    attempts=1,
+  )
+  db.session.add(submission)
+  db.session.commit()
+
+  claimed = claim_next_resume_job()
+  assert claimed is not None and claimed.id == submission.id
+  assert claimed.attempts == 2
+  assert claim_next_resume_job() is None
+
+
+def test_app_factory_starts_resume_workers_when_scoring_is_enabled(monkeypatch):
+  from app import create_app
+  from app.config import Config
+
+  monkeypatch.setattr(Config, "BACKGROUND_JOBS_ENABLED", True)
+  monkeypatch.setattr(Config, "RESUME_SCORER_ENABLED", True)
+  started = create_app()
+  pool = started.extensions["resume_job_pool"]
+  sweeper = started.extensions["submit_job_sweeper"]
+  try:
+    assert pool.workers == resume_route.RESUME_JOB_WORKERS
+    assert all(thread.is_alive() for thread in pool._threads)
+  finally:
+    pool.stop(timeout=5)
+    sweeper.stop(timeout=5)
+
+  monkeypatch.setattr(Config, "RESUME_SCORER_ENABLED", False)
+  disabled = create_app()
+  disabled.extensions["submit_job_sweeper"].stop(timeout=5)
+  assert "resume_job_pool" not in disabled.extensions
@@ -1,10 +1,23 @@
+import base64
+import hashlib
+import io
+import json
+import tempfile
+import threading
+
+import pytest
+
+from app.services import resume_scoring
 from app.services.resume_scoring import (
+  MAX_RESUME_FILE_SIZE_BYTES,
   PreparedResumeContent,
+  ResumeExtractionError,
+  hash_upload,
   parse_provider_payload,
   score_prepared_resume,
   validate_pdf_upload,
 )
-from app.services.resume_providers import ResumeProviderError
+from app.services.resume_providers import PDF_DATA_URL, ResumeProviderError, encode_json_body
 
 
 class _FakeProvider:
@@ -123,3 +136,159 @@ def test_score_prepared_resume_retries_on_timeout_provider_error():
   )
   assert result.overall_score == 82
   assert provider.calls == 2
+
+
+class _CountingStream(io.BytesIO):
+  def __init__(self, data: bytes):
+    super().__init__(data)
+    self.bytes_read = 0
+
+  def read(self, size=-1):
+    chunk = super().read(size)
+    self.bytes_read += len(chunk)
+    return chunk
+
+
+def test_hash_upload_hashes_in_place_and_stops_past_the_limit():
+  data = b"%PDF-1.4 " + b"x" * 200_000
+  stream = io.BytesIO(data)
+  upload = hash_upload(stream)
+  assert upload.file is stream
+  assert upload.size_bytes == len(data)
+  assert upload.sha256 == hashlib.sha256(data).hexdigest()
+  assert upload.read_bytes() == data
+
+  oversized = _CountingStream(b"x" * (MAX_RESUME_FILE_SIZE_BYTES * 4))
+  upload = hash_upload(oversized)
+  assert upload.size_bytes == MAX_RESUME_FILE_SIZE_BYTES + 1
+  assert oversized.bytes_read == MAX_RESUME_FILE_SIZE_BYTES + 1
+
+
+def test_encode_json_body_streams_pdf_base64_into_the_file_data_value():
+  pdf = b"%PDF-1.4 " + bytes(range(256)) * 1000
+  # A filename that looks like a placeholder must stay exactly as the user sent it.
+  filename = "__resume_pdf_base64__.pdf"
+  payload = {"input": [{"filename": filename, "file_data": PDF_DATA_URL, "score": 1.5, "ok": None}]}
+  expected = json.dumps(
+    {
+      "input": [
+        {
+          "filename": filename,
+          "file_data": f"data:application/pdf;base64,{base64.b64encode(pdf).decode('ascii')}",
+          "score": 1.5,
+          "ok": None,
+        }
+      ]
+    }
+  ).encode("utf-8")
+
+  for source in (pdf, io.BytesIO(pdf)):
+    chunks, content_length = encode_json_body(payload, pdf=source)
+    body = b"".join(chunks)
+    assert body == expected
+    assert content_length == len(expected)
+
+
+def _text_pdf(pages: list[str]) -> bytes:
+  page_count = len(pages)
+  kids = " ".join(f"{3 + index * 2} 0 R" for index in range(page_count))
+  font_id = 3 + page_count * 2
+  objects = [
+    b"<< /Type /Catalog /Pages 2 0 R >>",
+    f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>".encode(),
+  ]
+  for index, text in enumerate(pages):
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects.append(
+      f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + index * 2} 0 R "
+      f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>".encode()
+    )
+    objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+  objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+  out = bytearray(b"%PDF-1.4\n")
+  offsets = []
+  for number, body in enumerate(objects, start=1):
+    offsets.append(len(out))
+    out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+  xref_offset = len(out)
+  out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+  for offset in offsets:
+    out += b"%010d 00000 n \n" % offset
+  out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+  return bytes(out)
+
+
+def test_prepare_resume_content_stops_at_page_cap_and_records_timings(monkeypatch):
+  monkeypatch.setattr(resume_scoring, "PDF_EXTRACTION_WORKERS", 0)
+  pdf = _text_pdf([f"Page {index} experience" for index in range(25)])
+
+  prepared = resume_scoring.prepare_resume_content(pdf)
+
+  assert prepared.page_count == 25
+  assert len(prepared.page_timings_ms) == resume_scoring.MAX_EXTRACTED_PAGES
+  assert "Page 0 experience" in prepared.text_for_prompt
+  assert f"Page {resume_scoring.MAX_EXTRACTED_PAGES} experience" not in prepared.text_for_prompt
+
+
+def test_prepare_resume_content_stops_once_char_budget_is_reached(monkeypatch):
+  monkeypatch.setattr(resume_scoring, "PDF_EXTRACTION_WORKERS", 0)
+  monkeypatch.setattr(resume_scoring, "MAX_EXTRACTED_TEXT_CHARS", 40)
+  pdf = _text_pdf(["A" * 30, "B" * 30, "C" * 30])
+
+  prepared = resume_scoring.prepare_resume_content(pdf)
+
+  assert len(prepared.page_timings_ms) == 2
+  assert len(prepared.text_for_prompt) == 40
+
+
+def test_prepare_resume_content_times_out_in_pool_and_recovers(monkeypatch):
+  pdf = _text_pdf(["Software engineering intern"])
+  monkeypatch.setattr(resume_scoring, "PDF_EXTRACTION_TIMEOUT_SECONDS", 0.001)
+  with pytest.raises(ResumeExtractionError) as excinfo:
+    resume_scoring.prepare_resume_content(pdf)
+  assert excinfo.value.code == "pdf_extraction_timeout"
+
+  monkeypatch.setattr(resume_scoring, "PDF_EXTRACTION_TIMEOUT_SECONDS", 60.0)
+  prepared = resume_scoring.prepare_resume_content(pdf)
+  assert prepared.text_for_prompt == "Software engineering intern"
+  assert len(prepared.page_timings_ms) == 1
+
+
+def test_waiting_for_an_extraction_slot_does_not_count_toward_the_timeout(monkeypatch):
+  pdf = _text_pdf(["Software engineering intern"])
+  slots = threading.BoundedSemaphore(1)
+  monkeypatch.setattr(resume_scoring, "_EXTRACTION_SLOTS", slots)
+  monkeypatch.setattr(resume_scoring, "PDF_EXTRACTION_TIMEOUT_SECONDS", 5.0)
+  resume_scoring.prepare_resume_content(pdf)
+
+  # Another upload holds the only slot for longer than the extraction timeout.
+  slots.acquire()
+  releaser = threading.Timer(1.0, slots.release)
+  releaser.start()
+  monkeypatch.setattr(resume_scoring, "PDF_EXTRACTION_TIMEOUT_SECONDS", 0.8)
+  prepared = resume_scoring.prepare_resume_content(pdf)
+  releaser.join()
+
+  assert prepared.text_for_prompt == "Software engineering intern"
+
+
+def test_extraction_hands_the_child_a_file_descriptor_not_bytes(monkeypatch):
+  pdf = _text_pdf(["Software engineering intern"])
+  on_disk = tempfile.TemporaryFile()
+  on_disk.write(pdf)
+  on_disk.seek(0)
+  assert resume_scoring._file_for_child(on_disk) == (on_disk, False)
+
+  in_memory = io.BytesIO(pdf)
+  copied, owned = resume_scoring._file_for_child(in_memory)
+  assert owned and copied.fileno() >= 0
+  copied.seek(0)
+  assert copied.read() == pdf
+  copied.close()
+
+  monkeypatch.setattr(resume_scoring, "PDF_EXTRACTION_TIMEOUT_SECONDS", 60.0)
+  prepared = resume_scoring.prepare_resume_content(on_disk)
+  assert prepared.text_for_prompt == "Software engineering intern"
+  assert on_disk.tell() == 0
+  on_disk.close()
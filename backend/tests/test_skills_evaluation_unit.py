@@ -0,0 +1,389 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.routes import skills as skills_route
+from app.services import judge0
+from app.services.execution_cache import (
+  ExecutionResultCache,
+  SqliteCacheBackend,
+  get_compile_failure_cache,
+  get_execution_cache,
+)
+from app.services.skills_challenges import get_challenge_config
+from app.services.skills_harness import ERROR_MARKER, RESULT_MARKER, TIME_MARKER
+
+
+@pytest.fixture(autouse=True)
+def _fresh_execution_cache():
+  get_execution_cache().clear()
+  get_compile_failure_cache().clear()
+  yield
+  get_execution_cache().clear()
+  get_compile_failure_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def _no_poll_sleep(monkeypatch):
+  slept: list[float] = []
+  monkeypatch.setattr(judge0, "_POLLER", judge0.AdaptivePoller(sleep=slept.append, jitter=0.0))
+  return slept
+
+
+def _ok_result(value):
+  return {
+    "status": {"id": 3, "description": "Accepted"},
+    "stdout": f"{RESULT_MARKER}{json.dumps(value)}",
+    "time": "0.012",
+    "memory": 3200,
+  }
+
+
+class _FakeBatchJudge:
+  def __init__(self, results):
+    self.results = list(results)
+    self.calls: list[tuple[str, str]] = []
+
+  def __call__(self, method, path, payload=None, *, timeout=20.0):
+    self.calls.append((method, path))
+    if method == "POST" and path.startswith("/submissions/batch"):
+      return [{"token": f"tok-{index}"} for index, _ in enumerate(payload["submissions"])]
+    if method == "GET" and path.startswith("/submissions/batch"):
+      tokens = path.split("tokens=", 1)[1].split("&", 1)[0].split(",")
+      return {"submissions": [self.results[int(token.split("-")[1])] for token in tokens]}
+    raise AssertionError(f"Unexpected Judge0 call: {method} {path}")
+
+
+def test_run_submission_batch_submits_once_and_preserves_order(monkeypatch):
+  fake = _FakeBatchJudge([_ok_result("a"), _ok_result("b"), _ok_result("c")])
+  monkeypatch.setattr(judge0, "_request_json", fake)
+
+  results = judge0.run_submission_batch(source_codes=["x", "y", "z"], language_id=71)
+
+  assert [result["stdout"] for result in results] == [
+    f'{RESULT_MARKER}"a"',
+    f'{RESULT_MARKER}"b"',
+    f'{RESULT_MARKER}"c"',
+  ]
+  assert [method for method, _ in fake.calls] == ["POST", "GET"]
+
+
+def test_evaluate_test_group_stops_on_first_failure_in_case_order(monkeypatch):
+  challenge = get_challenge_config("cart_total")
+  tests = challenge["hidden_cases"]
+  outputs = [_ok_result(tests[0]["expected"]), _ok_result(-1.0), _ok_result(tests[2]["expected"]), _ok_result(0.0)]
+  monkeypatch.setattr(judge0, "_request_json", _FakeBatchJudge(outputs))
+
+  evaluation = skills_route._evaluate_test_group(
+    source_code="def cart_total(prices, qty, coupon):\n  return 0.0\n",
+    language_id=71,
+    language_family="python",
+    challenge=challenge,
+    tests=tests,
+    cpu_time_limit=2.0,
+    stop_on_first_failure=True,
+  )
+
+  assert evaluation["status"] == "wrong_answer"
+  assert evaluation["passed_count"] == 1
+  assert evaluation["total"] == len(tests)
+  assert [case["passed"] for case in evaluation["case_results"]] == [True, False]
+
+
+def test_evaluate_test_group_demultiplexes_multi_case_output(monkeypatch):
+  challenge = get_challenge_config("clean_username")
+  tests = challenge["hidden_cases"]
+  submitted: list[str] = []
+
+  def _fake_run_submission(*, source_code, language_id, stdin, cpu_time_limit, **_):
+    submitted.append(source_code)
+    return {
+      "status": {"id": 3, "description": "Accepted"},
+      "stdout": (
+        f'debug line\n{RESULT_MARKER}0:"intern_route"\n'
+        f"{ERROR_MARKER}1\n"
+        f'{RESULT_MARKER}2:"many_spaces"\n'
+      ),
+      "stderr": "java.lang.IllegalStateException: boom",
+      "time": "0.2",
+      "memory": 41000,
+    }
+
+  monkeypatch.setattr(skills_route, "run_submission", _fake_run_submission)
+
+  evaluation = skills_route._evaluate_test_group(
+    source_code="class Solution { static String clean_username(String s) { return s; } }",
+    language_id=62,
+    language_family="java",
+    challenge=challenge,
+    tests=tests,
+    cpu_time_limit=2.0,
+    stop_on_first_failure=False,
+  )
+
+  assert len(submitted) == 1
+  assert [case["status_kind"] for case in evaluation["case_results"]] == ["ok", "runtime_error", "wrong_answer"]
+  assert evaluation["status"] == "runtime_error"
+  assert evaluation["passed_count"] == 1
+
+
+def test_multi_case_run_judges_time_limit_per_case(monkeypatch):
+  challenge = get_challenge_config("clean_username")
+  tests = challenge["hidden_cases"]
+
+  def _fake_run_submission(*, source_code, language_id, stdin, cpu_time_limit, **_):
+    return {
+      "status": {"id": 3, "description": "Accepted"},
+      "stdout": "".join(
+        f"{TIME_MARKER}{index}:{elapsed}\n{RESULT_MARKER}{index}:{json.dumps(test_case['expected'])}\n"
+        for index, (test_case, elapsed) in enumerate(zip(tests, [5, 5000, 5]))
+      ),
+      "time": "5.01",
+      "memory": 41000,
+    }
+
+  monkeypatch.setattr(skills_route, "run_submission", _fake_run_submission)
+
+  evaluation = skills_route._evaluate_test_group(
+    source_code="class Solution { static String clean_username(String s) { return s; } }",
+    language_id=62,
+    language_family="java",
+    challenge=challenge,
+    tests=tests,
+    cpu_time_limit=2.0,
+    stop_on_first_failure=False,
+  )
+
+  assert [case["status_kind"] for case in evaluation["case_results"]] == ["ok", "timeout", "ok"]
+  assert [case["time_ms"] for case in evaluation["case_results"]] == [5, 5000, 5]
+  assert evaluation["status"] == "timeout"
+
+
+def test_multi_case_runaway_case_reruns_unreached_cases_alone(monkeypatch):
+  challenge = get_challenge_config("clean_username")
+  tests = challenge["hidden_cases"]
+  case_sources = {
+    skills_route._build_case_source("src", "java", challenge, test_case): test_case for test_case in tests
+  }
+  limits: list[float] = []
+
+  def _fake_run_submission(*, source_code, language_id, stdin, cpu_time_limit, **_):
+    limits.append(cpu_time_limit)
+    if source_code not in case_sources:
+      # The shared program reports case 0, then case 1 never returns.
+      return {
+        "status": {"id": 5, "description": "Time Limit Exceeded"},
+        "stdout": f"{TIME_MARKER}0:3\n{RESULT_MARKER}0:{json.dumps(tests[0]['expected'])}\n",
+      }
+    if case_sources[source_code] is tests[1]:
+      return {"status": {"id": 5, "description": "Time Limit Exceeded"}, "stdout": ""}
+    return _ok_result(case_sources[source_code]["expected"])
+
+  monkeypatch.setattr(skills_route, "run_submission", _fake_run_submission)
+  monkeypatch.setattr(skills_route, "supports_batch", lambda family: False)
+
+  evaluation = skills_route._evaluate_test_group(
+    source_code="src",
+    language_id=62,
+    language_family="java",
+    challenge=challenge,
+    tests=tests,
+    cpu_time_limit=2.0,
+    stop_on_first_failure=False,
+  )
+
+  assert [case["status_kind"] for case in evaluation["case_results"]] == ["ok", "timeout", "ok"]
+  assert limits[0] == 6.0
+  assert sorted(limits[1:]) == [2.0, 2.0]
+
+
+def test_repeat_run_with_unchanged_code_is_served_from_cache(monkeypatch):
+  challenge = get_challenge_config("word_counter")
+  tests = challenge["sample_cases"]
+  fake = _FakeBatchJudge([_ok_result(test_case["expected"]) for test_case in tests])
+  monkeypatch.setattr(judge0, "_request_json", fake)
+
+  kwargs = dict(
+    source_code="def word_counter(words):\n  return []\n",
+    language_id=71,
+    language_family="python",
+    challenge=challenge,
+    tests=tests,
+    cpu_time_limit=2.0,
+    stop_on_first_failure=False,
+  )
+  first = skills_route._evaluate_test_group(**kwargs)
+  calls_after_first = len(fake.calls)
+  second = skills_route._evaluate_test_group(**kwargs)
+
+  assert first == second
+  assert len(fake.calls) == calls_after_first
+  assert get_execution_cache().stats()["memory_hits"] == len(tests)
+
+
+def test_sqlite_backend_shares_results_between_cache_instances(tmp_path):
+  path = str(tmp_path / "execution-cache.sqlite3")
+  worker_a = ExecutionResultCache(shared_backend=SqliteCacheBackend(path))
+  worker_b = ExecutionResultCache(shared_backend=SqliteCacheBackend(path))
+
+  worker_a.set("key", _ok_result("x"))
+  worker_a.set("timeout", {"status": {"id": 5, "description": "Time Limit Exceeded"}})
+
+  assert worker_b.get("key") == _ok_result("x")
+  assert worker_b.get("timeout") is None
+  assert worker_b.stats()["shared_hits"] == 1
+
+
+def test_batch_poller_backs_off_and_records_poll_counts(monkeypatch, _no_poll_sleep):
+  pending = {"status": {"id": 2, "description": "Processing"}}
+  responses = iter([[pending], [pending], [_ok_result("done")]])
+
+  def _fake_request(method, path, payload=None, *, timeout=20.0):
+    if method == "POST":
+      return [{"token": "tok-0"}]
+    return {"submissions": next(responses)}
+
+  monkeypatch.setattr(judge0, "_request_json", _fake_request)
+
+  results = judge0.run_submission_batch(source_codes=["x"], language_id=71, language_family="python")
+
+  assert results[0]["stdout"] == f'{RESULT_MARKER}"done"'
+  assert len(_no_poll_sleep) == 3
+  assert _no_poll_sleep[0] < _no_poll_sleep[1] < _no_poll_sleep[2]
+  stats = judge0.get_poll_stats()["python"]
+  assert stats["executions"] == 1
+  assert stats["polls"] == 3
+  assert stats["latency_seconds"] is not None
+
+
+def _case_sources(challenge, tests, source_code):
+  return {
+    skills_route._build_case_source(source_code, "python", challenge, test_case): index
+    for index, test_case in enumerate(tests)
+  }
+
+
+def test_concurrent_fan_out_matches_batched_evaluation(monkeypatch):
+  challenge = get_challenge_config("cart_total")
+  tests = challenge["hidden_cases"]
+  source_code = "def cart_total(prices, qty, coupon):\n  return 0.0\n"
+  outputs = [
+    _ok_result(tests[0]["expected"]),
+    {"status": {"id": 11, "description": "Runtime Error (NZEC)"}, "stderr": "boom", "time": "0.3", "memory": 9000},
+    _ok_result(-1.0),
+    _ok_result(tests[3]["expected"]),
+  ]
+  kwargs = dict(
+    source_code=source_code,
+    language_id=71,
+    language_family="python",
+    challenge=challenge,
+    tests=tests,
+    cpu_time_limit=2.0,
+    stop_on_first_failure=False,
+  )
+
+  monkeypatch.setattr(judge0, "_request_json", _FakeBatchJudge(outputs))
+  batched = skills_route._evaluate_test_group(**kwargs)
+
+  get_execution_cache().clear()
+  index_of = _case_sources(challenge, tests, source_code)
+
+  def _fake_run_submission(*, source_code, **_):
+    index = index_of[source_code]
+    # Later cases finish first; results must still come back in case order.
+    time.sleep(0.01 * (len(tests) - index))
+    return outputs[index]
+
+  monkeypatch.setattr(judge0, "JUDGE0_BATCH_ENABLED", False)
+  monkeypatch.setattr(skills_route, "run_submission", _fake_run_submission)
+  concurrent = skills_route._evaluate_test_group(**kwargs)
+
+  assert concurrent == batched
+  assert concurrent["status"] == "runtime_error"
+  assert concurrent["time_ms"] == 300
+
+
+def test_concurrent_fan_out_cancels_pending_cases_after_a_failure(monkeypatch):
+  challenge = get_challenge_config("cart_total")
+  tests = challenge["hidden_cases"]
+  source_code = "def cart_total(prices, qty, coupon):\n  return 0.0\n"
+  index_of = _case_sources(challenge, tests, source_code)
+  release = threading.Event()
+  started: list[int] = []
+
+  def _fake_run_submission(*, source_code, **_):
+    index = index_of[source_code]
+    started.append(index)
+    if index > 0:
+      release.wait(5)
+    return _ok_result(-1.0)
+
+  monkeypatch.setattr(judge0, "JUDGE0_BATCH_ENABLED", False)
+  monkeypatch.setattr(skills_route, "run_submission", _fake_run_submission)
+  monkeypatch.setattr(skills_route, "_CASE_FAN_OUT_EXECUTOR", ThreadPoolExecutor(max_workers=1))
+
+  evaluation = skills_route._evaluate_test_group(
+    source_code=source_code,
+    language_id=71,
+    language_family="python",
+    challenge=challenge,
+    tests=tests,
+    cpu_time_limit=2.0,
+    stop_on_first_failure=True,
+  )
+  release.set()
+  skills_route._CASE_FAN_OUT_EXECUTOR.shutdown(wait=True)
+
+  assert [case["passed"] for case in evaluation["case_results"]] == [False]
+  # Case 1 may already be running when case 0 fails; everything after it never starts.
+  assert started in ([0], [0, 1])
+
+
+def test_compile_error_short_circuits_remaining_cases_and_is_remembered(monkeypatch):
+  challenge = get_challenge_config("cart_total")
+  source_code = "def cart_total(prices, qty, coupon) return 0.0\n"
+  compile_failed = {
+    "status": {"id": 6, "description": "Compilation Error"},
+    "compile_output": "SyntaxError: expected ':'",
+    "time": None,
+    "memory": None,
+  }
+  release = threading.Event()
+  calls: list[str] = []
+
+  def _fake_run_submission(*, source_code, **_):
+    calls.append(source_code)
+    if len(calls) > 1:
+      release.wait(5)
+    return compile_failed
+
+  monkeypatch.setattr(judge0, "JUDGE0_BATCH_ENABLED", False)
+  monkeypatch.setattr(skills_route, "run_submission", _fake_run_submission)
+  monkeypatch.setattr(skills_route, "_CASE_FAN_OUT_EXECUTOR", ThreadPoolExecutor(max_workers=1))
+  kwargs = dict(
+    source_code=source_code,
+    language_id=71,
+    language_family="python",
+    challenge=challenge,
+    cpu_time_limit=2.0,
+    stop_on_first_failure=False,
+  )
+
+  run = skills_route._evaluate_test_group(tests=challenge["hidden_cases"], **kwargs)
+  release.set()
+  skills_route._CASE_FAN_OUT_EXECUTOR.shutdown(wait=True)
+  calls_after_run = len(calls)
+  resubmit = skills_route._evaluate_test_group(tests=challenge["sample_cases"], **kwargs)
+
+  assert calls_after_run <= 2
+  assert len(run["case_results"]) == len(challenge["hidden_cases"])
+  assert {case["status_kind"] for case in run["case_results"]} == {"compile_error"}
+  assert run["status"] == "compile_error"
+  assert run["compile_output"] == "SyntaxError: expected ':'"
+  assert len(calls) == calls_after_run
+  assert resubmit["status"] == "compile_error"
+  assert len(resubmit["case_results"]) == len(challenge["sample_cases"])
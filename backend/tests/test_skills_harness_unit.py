@@ -0,0 +1,55 @@
+import pytest
+
+from app.services import skills_harness
+from app.services.skills_harness import RESULT_MARKER, TIME_MARKER, build_harness_source, build_multi_case_harness_source
+
+FAMILIES = ["python", "javascript", "typescript", "java", "cpp", "csharp", "go", "rust", "kotlin", "swift", "php", "ruby", "c"]
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_harness_templates_are_compiled_once_per_family_and_return_type(family):
+  skills_harness._single_case_template.cache_clear()
+  sources = [
+    build_harness_source(
+      family=family,
+      function_name="solve",
+      parameters=[{"name": "n", "type": "int"}],
+      return_type="int",
+      args=[value],
+      user_source="/* user */",
+    )
+    for value in (1, 2)
+  ]
+
+  assert skills_harness._single_case_template.cache_info().misses == 1
+  assert sources[0] != sources[1]
+  for source in sources:
+    assert "/* user */" in source
+    assert RESULT_MARKER in source or family == "c"
+
+
+def test_multi_case_harness_splices_every_case_between_frame():
+  source = build_multi_case_harness_source(
+    family="python",
+    function_name="solve",
+    parameters=[{"name": "s", "type": "string"}],
+    return_type="string",
+    cases_args=[["a"], ["b"]],
+    user_source="def solve(s):\n  return s",
+  )
+  assert source.startswith("def solve(s):\n  return s\n\nimport json\nimport time\nimport traceback\n")
+  assert f'{RESULT_MARKER}0:' in source and f'{RESULT_MARKER}1:' in source
+  assert f'{TIME_MARKER}0:' in source and f'{TIME_MARKER}1:' in source
+  assert source.endswith('if __name__ == "__main__":\n  __internroute_main()\n')
+
+
+def test_unknown_family_is_rejected():
+  with pytest.raises(ValueError, match="Unsupported language family"):
+    build_harness_source(
+      family="cobol",
+      function_name="solve",
+      parameters=[],
+      return_type="int",
+      args=[],
+      user_source="",
+    )
@@ -0,0 +1,174 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db
+from app.models import ChallengeSubmissionJob, Module, Task, UserTaskCompletion
+from app.routes import skills as skills_route
+from app.services import submit_jobs
+from app.services.execution_cache import get_execution_cache
+from app.services.skills_challenges import get_challenge_config
+from app.services.skills_harness import RESULT_MARKER
+
+
+class _InlineExecutor:
+  def submit(self, fn, *args, **kwargs):
+    fn(*args, **kwargs)
+
+
+def _accepted(value):
+  return {
+    "status": {"id": 3, "description": "Accepted"},
+    "stdout": f"{RESULT_MARKER}{json.dumps(value)}",
+    "time": "0.010",
+    "memory": 2048,
+  }
+
+
+@pytest.fixture()
+def coding_task(app):
+  with app.app_context():
+    module = Module(key="coding", name="Coding", category="coding", overall_weight=40, unlock_threshold=80, sort_order=0)
+    db.session.add(module)
+    db.session.flush()
+    task = Task(module_id=module.id, challenge_id="clean_username", title="Clean username", weight=20, sort_order=1)
+    db.session.add(task)
+    db.session.commit()
+    return task.id
+
+
+@pytest.fixture()
+def python_judge(monkeypatch):
+  get_execution_cache().clear()
+  challenge = get_challenge_config("clean_username")
+  monkeypatch.setattr(skills_route, "get_language_family", lambda _: "python")
+  monkeypatch.setattr(
+    skills_route,
+    "run_submission_batch",
+    lambda *, source_codes, language_id, cpu_time_limit, **_: [
+      _accepted(case["expected"]) for case in challenge["hidden_cases"]
+    ],
+  )
+  yield
+  get_execution_cache().clear()
+
+
+def test_async_submit_returns_job_and_completes_task(client, auth_headers, app, coding_task, python_judge, monkeypatch):
+  monkeypatch.setattr(skills_route, "_SUBMIT_EXECUTOR", _InlineExecutor())
+
+  response = client.post(
+    "/skills/challenges/clean_username/submit",
+    headers=auth_headers,
+    json={"source_code": "def clean_username(s):\n  return s\n", "language_id": 71, "async": True},
+  )
+  assert response.status_code == 202
+  job_id = response.get_json()["job_id"]
+
+  status = client.get(f"/skills/submit-jobs/{job_id}", headers=auth_headers)
+  assert status.status_code == 200
+  payload = status.get_json()
+  assert payload["status"] == "completed"
+  assert [case["passed"] for case in payload["case_results"]] == [True, True, True]
+  assert "expected_output" not in payload["case_results"][0]
+  assert payload["result"]["passed_all_hidden"] is True
+  assert payload["result"]["task_completed"] is True
+
+  stream = client.get(f"/skills/submit-jobs/{job_id}/stream", headers=auth_headers)
+  body = stream.get_data(as_text=True)
+  assert body.count("event: case") == 3
+  assert "event: done" in body
+
+  with app.app_context():
+    completion = UserTaskCompletion.query.filter_by(
+      user_id=app.config["TEST_USER_ID"],
+      task_id=coding_task,
+    ).first()
+    assert completion is not None
+
+
+class _DroppingExecutor:
+  # Stands in for a worker process that restarted after the job was queued.
+  def submit(self, fn, *args, **kwargs):
+    pass
+
+
+def test_orphaned_submit_job_is_failed_by_the_sweeper(client, auth_headers, app, coding_task, python_judge, monkeypatch):
+  monkeypatch.setattr(skills_route, "_SUBMIT_EXECUTOR", _DroppingExecutor())
+  response = client.post(
+    "/skills/challenges/clean_username/submit",
+    headers=auth_headers,
+    json={"source_code": "def clean_username(s):\n  return s\n", "language_id": 71, "async": True},
+  )
+  job_id = response.get_json()["job_id"]
+  skills_route._release_in_flight(app.config["TEST_USER_ID"], "submit")
+  skills_route._SUBMIT_JOB_SLOTS.release()
+  long_after = datetime.utcnow() + timedelta(seconds=submit_jobs.SUBMIT_JOB_STALE_SECONDS * 2)
+
+  # Still held by this process: a sweep long after enqueue heartbeats it instead of failing it.
+  with app.app_context():
+    assert submit_jobs.sweep_submit_jobs(now=long_after) == 0
+    assert db.session.get(ChallengeSubmissionJob, job_id).heartbeat_at == long_after
+
+  # The process that held it restarted; reading the status never writes.
+  submit_jobs.release_submit_job(job_id)
+  with app.app_context():
+    job = db.session.get(ChallengeSubmissionJob, job_id)
+    job.heartbeat_at = datetime.utcnow() - timedelta(seconds=submit_jobs.SUBMIT_JOB_STALE_SECONDS + 1)
+    db.session.commit()
+  assert client.get(f"/skills/submit-jobs/{job_id}", headers=auth_headers).get_json()["status"] == "queued"
+
+  with app.app_context():
+    assert submit_jobs.sweep_submit_jobs() == 1
+
+  payload = client.get(f"/skills/submit-jobs/{job_id}", headers=auth_headers).get_json()
+  assert payload["status"] == "failed"
+  assert payload["error_code"] == "submit_job_abandoned"
+
+  stream = client.get(f"/skills/submit-jobs/{job_id}/stream", headers=auth_headers)
+  assert "event: done" in stream.get_data(as_text=True)
+
+
+def test_submit_job_streams_are_bounded_per_process(client, auth_headers, app, coding_task, python_judge, monkeypatch):
+  monkeypatch.setattr(skills_route, "_SUBMIT_EXECUTOR", _InlineExecutor())
+  monkeypatch.setattr(skills_route, "_SUBMIT_JOB_STREAM_SLOTS", skills_route.BoundedSemaphore(1))
+  response = client.post(
+    "/skills/challenges/clean_username/submit",
+    headers=auth_headers,
+    json={"source_code": "def clean_username(s):\n  return s\n", "language_id": 71, "async": True},
+  )
+  job_id = response.get_json()["job_id"]
+
+  skills_route._SUBMIT_JOB_STREAM_SLOTS.acquire()
+  assert client.get(f"/skills/submit-jobs/{job_id}/stream", headers=auth_headers).status_code == 503
+  skills_route._SUBMIT_JOB_STREAM_SLOTS.release()
+
+  first = client.get(f"/skills/submit-jobs/{job_id}/stream", headers=auth_headers)
+  assert "event: done" in first.get_data(as_text=True)
+  first.close()
+  second = client.get(f"/skills/submit-jobs/{job_id}/stream", headers=auth_headers)
+  assert second.status_code == 200
+
+
+def test_progress_reads_completions_with_set_based_queries(client, auth_headers, app, coding_task):
+  with app.app_context():
+    db.session.add(UserTaskCompletion(user_id=app.config["TEST_USER_ID"], task_id=coding_task))
+    db.session.commit()
+
+  client.get("/skills/progress", headers=auth_headers)
+  statements: list[str] = []
+  with app.app_context():
+    engine = db.engine
+  listener = lambda conn, cursor, statement, *args: statements.append(statement)
+  event.listen(engine, "before_cursor_execute", listener)
+  try:
+    response = client.get("/skills/progress", headers=auth_headers)
+  finally:
+    event.remove(engine, "before_cursor_execute", listener)
+
+  assert response.status_code == 200
+  payload = response.get_json()
+  assert payload["challenge_completion"]["clean_username"] is True
+  assert payload["completed_count"] == 1
+  assert len(statements) == 1
@@ -115,6 +115,20 @@ type ProjectSubmission = {
 
 type ProjectSubmissionsResponse = {
   submissions: ProjectSubmission[];
+  next_cursor: string | null;
+};
+
+type SubmissionCounts = Record<SubmissionStatus, number>;
+
+type ProjectSubmissionsSummaryResponse = {
+  counts: SubmissionCounts;
+  total: number;
+  deployed_passes: number;
+};
+
+type AdminSubmissionsSummaryResponse = {
+  counts: SubmissionCounts;
+  total: number;
 };
 
 type ProjectSubmissionCreateResponse = {
@@ -137,6 +151,7 @@ type AdminProjectSubmission = ProjectSubmission & {
 
 type AdminProjectSubmissionsResponse = {
   submissions: AdminProjectSubmission[];
+  next_cursor: string | null;
 };
 
 type ReviewDecision = "pass" | "fail";
@@ -163,6 +178,12 @@ const statusLabel: Record<SubmissionStatus, string> = {
   fail: "Not Yet"
 };
 
+const emptyCounts: SubmissionCounts = { pending: 0, pass: 0, fail: 0 };
+
+function pagePath(path: string, cursor: string | null): string {
+  return cursor ? `${path}?cursor=${encodeURIComponent(cursor)}` : path;
+}
+
 function createReviewDraft(): ReviewDraft {
   return {
     hasApi: false,
@@ -183,9 +204,19 @@ export default function ProjectsPage() {
   const [listError, setListError] = useState<string | null>(null);
   const [successMessage, setSuccessMessage] = useState<string | null>(null);
   const [submissions, setSubmissions] = useState<ProjectSubmission[]>([]);
+  const [submissionsCursor, setSubmissionsCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [summary, setSummary] = useState<ProjectSubmissionsSummaryResponse>({
+    counts: emptyCounts,
+    total: 0,
+    deployed_passes: 0,
+  });
   const [isSuperuser, setIsSuperuser] = useState(false);
   const [adminSubmissions, setAdminSubmissions] = useState<AdminProjectSubmission[]>([]);
+  const [adminCursor, setAdminCursor] = useState<string | null>(null);
+  const [adminTotal, setAdminTotal] = useState(0);
   const [adminLoading, setAdminLoading] = useState(false);
+  const [adminLoadingMore, setAdminLoadingMore] = useState(false);
   const [adminError, setAdminError] = useState<string | null>(null);
   const [reviewDrafts, setReviewDrafts] = useState<Record<number, ReviewDraft>>({});
 
@@ -202,8 +233,13 @@ export default function ProjectsPage() {
     setIsLoading(true);
     setListError(null);
     try {
-      const data = await apiRequest<ProjectSubmissionsResponse>("/projects/submissions");
+      const [data, summaryData] = await Promise.all([
+        apiRequest<ProjectSubmissionsResponse>("/projects/submissions"),
+        apiRequest<ProjectSubmissionsSummaryResponse>("/projects/submissions/summary"),
+      ]);
       setSubmissions(data.submissions || []);
+      setSubmissionsCursor(data.next_cursor ?? null);
+      setSummary(summaryData);
     } catch (err) {
       const message = err instanceof Error ? err.message : "Could not load submissions.";
       setListError(message);
@@ -212,9 +248,41 @@ export default function ProjectsPage() {
     }
   }, []);
 
+  const loadMoreSubmissions = useCallback(async () => {
+    if (!submissionsCursor) {
+      return;
+    }
+    setLoadingMore(true);
+    setListError(null);
+    try {
+      const data = await apiRequest<ProjectSubmissionsResponse>(pagePath("/projects/submissions", submissionsCursor));
+      setSubmissions((previous) => [...previous, ...(data.submissions || [])]);
+      setSubmissionsCursor(data.next_cursor ?? null);
+    } catch (err) {
+      const message = err instanceof Error ? err.message : "Could not load submissions.";
+      setListError(message);
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [submissionsCursor]);
+
+  const addReviewDrafts = useCallback((items: AdminProjectSubmission[]) => {
+    setReviewDrafts((previous) => {
+      const next = { ...previous };
+      for (const submission of items) {
+        if (!next[submission.id]) {
+          next[submission.id] = createReviewDraft();
+        }
+      }
+      return next;
+    });
+  }, []);
+
   const loadAdminSubmissions = useCallback(async () => {
     if (!isSuperuser) {
       setAdminSubmissions([]);
+      setAdminCursor(null);
+      setAdminTotal(0);
       setAdminError(null);
       return;
     }
@@ -222,25 +290,44 @@ export default function ProjectsPage() {
     setAdminLoading(true);
     setAdminError(null);
     try {
-      const data = await apiRequest<AdminProjectSubmissionsResponse>("/projects/admin/submissions");
+      const [data, summaryData] = await Promise.all([
+        apiRequest<AdminProjectSubmissionsResponse>("/projects/admin/submissions"),
+        apiRequest<AdminSubmissionsSummaryResponse>("/projects/admin/submissions/summary"),
+      ]);
       const nextSubmissions = data.submissions || [];
       setAdminSubmissions(nextSubmissions);
-      setReviewDrafts((previous) => {
-        const next = { ...previous };
-        for (const submission of nextSubmissions) {
-          if (!next[submission.id]) {
-            next[submission.id] = createReviewDraft();
-          }
-        }
-        return next;
-      });
+      setAdminCursor(data.next_cursor ?? null);
+      setAdminTotal(summaryData.total);
+      addReviewDrafts(nextSubmissions);
     } catch (err) {
       const message = err instanceof Error ? err.message : "Could not load admin submissions.";
       setAdminError(message);
     } finally {
       setAdminLoading(false);
     }
-  }, [isSuperuser]);
+  }, [addReviewDrafts, isSuperuser]);
+
+  const loadMoreAdminSubmissions = useCallback(async () => {
+    if (!adminCursor) {
+      return;
+    }
+    setAdminLoadingMore(true);
+    setAdminError(null);
+    try {
+      const data = await apiRequest<AdminProjectSubmissionsResponse>(
+        pagePath("/projects/admin/submissions", adminCursor),
+      );
+      const nextSubmissions = data.submissions || [];
+      setAdminSubmissions((previous) => [...previous, ...nextSubmissions]);
+      setAdminCursor(data.next_cursor ?? null);
+      addReviewDrafts(nextSubmissions);
+    } catch (err) {
+      const message = err instanceof Error ? err.message : "Could not load admin submissions.";
+      setAdminError(message);
+    } finally {
+      setAdminLoadingMore(false);
+    }
+  }, [addReviewDrafts, adminCursor]);
 
   const updateReviewDraft = useCallback((submissionId: number, patch: Partial<ReviewDraft>) => {
     setReviewDrafts((previous) => ({
@@ -302,23 +389,12 @@ export default function ProjectsPage() {
     void loadAdminSubmissions();
   }, [isSuperuser, loadAdminSubmissions]);
 
-  const statusSummary = useMemo(() => {
-    let pending = 0;
-    let pass = 0;
-    let fail = 0;
-
-    for (const submission of submissions) {
-      if (submission.status === "pass") pass += 1;
-      if (submission.status === "pending") pending += 1;
-      if (submission.status === "fail") fail += 1;
-    }
-    return { pending, pass, fail };
-  }, [submissions]);
+  // Counts come from the summary endpoint; the list below only holds the pages loaded so far.
+  const statusSummary = summary.counts;
 
   const portfolioCards = useMemo(() => {
-    const passed = submissions.filter((submission) => submission.status === "pass");
-    const passCount = passed.length;
-    const hasBonusPass = passed.some((submission) => Boolean(submission.deployed_url));
+    const passCount = summary.counts.pass;
+    const hasBonusPass = summary.deployed_passes > 0;
 
     return portfolioCardBlueprint.map((card) => {
       if (card.key === "core_1") {
@@ -353,7 +429,7 @@ export default function ProjectsPage() {
             : "Optional bonus unlocks after first pass",
       };
     });
-  }, [submissions]);
+  }, [summary]);
 
   const handleSubmit = useCallback(async (event: FormEvent<HTMLFormElement>) => {
     event.preventDefault();
@@ -835,6 +911,17 @@ export default function ProjectsPage() {
                     </div>
                   );
                 })}
+                {submissionsCursor ? (
+                  <button
+                    type="button"
+                    onClick={() => void loadMoreSubmissions()}
+                    disabled={loadingMore}
+                    className="inline-flex items-center gap-2 rounded-lg border border-slate-200 bg-white px-3 py-2 text-xs font-semibold text-slate-700 hover:bg-slate-50 disabled:opacity-60"
+                  >
+                    {loadingMore ? <Loader2 size={13} className="animate-spin" /> : null}
+                    Load older submissions
+                  </button>
+                ) : null}
               </div>
             ) : null}
           </article>
@@ -851,7 +938,7 @@ export default function ProjectsPage() {
                 </p>
               </div>
               <span className="rounded-full border border-indigo-200 bg-white px-3 py-1 text-xs font-semibold text-indigo-700">
-                {adminSubmissions.length} total submissions
+                {adminTotal} total submissions
               </span>
             </div>
 
@@ -980,6 +1067,18 @@ export default function ProjectsPage() {
                 })}
               </div>
             ) : null}
+
+            {!adminLoading && adminCursor ? (
+              <button
+                type="button"
+                onClick={() => void loadMoreAdminSubmissions()}
+                disabled={adminLoadingMore}
+                className="mt-4 inline-flex items-center gap-2 rounded-lg border border-indigo-200 bg-white px-3 py-2 text-xs font-semibold text-indigo-700 hover:bg-indigo-100 disabled:opacity-60"
+              >
+                {adminLoadingMore ? <Loader2 size={13} className="animate-spin" /> : null}
+                Load more submissions
+              </button>
+            ) : null}
           </article>
         ) : null}
 